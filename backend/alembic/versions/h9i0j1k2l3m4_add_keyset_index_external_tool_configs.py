@@ -0,0 +1,39 @@
+"""Add keyset pagination index to external_tool_configs
+
+Revision ID: h9i0j1k2l3m4
+Revises: g8h9i0j1k2l3
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'h9i0j1k2l3m4'
+down_revision = 'g8h9i0j1k2l3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add composite index backing cursor pagination of tool configurations.
+
+    Lets (user_id, created_at, id) keyset queries seek directly to the
+    requested page instead of scanning past an OFFSET.
+    """
+    op.create_index(
+        'idx_external_tool_configs_user_created_id',
+        'external_tool_configs',
+        ['user_id', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade():
+    """Remove the keyset pagination index."""
+    op.drop_index(
+        'idx_external_tool_configs_user_created_id',
+        table_name='external_tool_configs'
+    )
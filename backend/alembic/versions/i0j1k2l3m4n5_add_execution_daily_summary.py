@@ -0,0 +1,54 @@
+"""Add execution_daily_summary pre-aggregation table
+
+Revision ID: i0j1k2l3m4n5
+Revises: h9i0j1k2l3m4
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'i0j1k2l3m4n5'
+down_revision = 'h9i0j1k2l3m4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Create the per-day execution summary used by monitoring dashboards.
+
+    Rows are filled by the background rollup job for complete days; the
+    dashboard combines them with live rows for the current day.
+    """
+    op.create_table(
+        'execution_daily_summary',
+        sa.Column('agent_id', sa.Integer(), nullable=False),
+        sa.Column('created_by_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('total_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('success_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_tokens', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('total_cost', sa.DECIMAL(precision=14, scale=6), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['agent_id'], ['agents.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('agent_id', 'created_by_id', 'date')
+    )
+    op.create_index(
+        'idx_execution_daily_summary_user_date',
+        'execution_daily_summary',
+        ['created_by_id', 'date'],
+        unique=False
+    )
+
+
+def downgrade():
+    """Drop the execution summary table."""
+    op.drop_index(
+        'idx_execution_daily_summary_user_date',
+        table_name='execution_daily_summary'
+    )
+    op.drop_table('execution_daily_summary')
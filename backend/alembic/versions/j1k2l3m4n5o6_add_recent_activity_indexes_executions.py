@@ -0,0 +1,46 @@
+"""Add recent activity indexes to executions table
+
+Revision ID: j1k2l3m4n5o6
+Revises: i0j1k2l3m4n5
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'j1k2l3m4n5o6'
+down_revision = 'i0j1k2l3m4n5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add indexes backing the monitoring recent-activity feeds.
+
+    Newest-first queries (optionally filtered by status) read the first
+    rows of a backward index scan instead of sorting the whole table.
+    """
+    # Recent executions: ORDER BY created_at DESC LIMIT n
+    op.create_index(
+        'idx_executions_created',
+        'executions',
+        ['created_at'],
+        unique=False
+    )
+
+    # Recent errors: WHERE status = 'failed' ORDER BY created_at DESC LIMIT n
+    op.create_index(
+        'idx_executions_status_created',
+        'executions',
+        ['status', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade():
+    """Remove the recent activity indexes."""
+    op.drop_index('idx_executions_status_created', table_name='executions')
+    op.drop_index('idx_executions_created', table_name='executions')
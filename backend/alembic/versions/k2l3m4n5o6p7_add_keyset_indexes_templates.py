@@ -0,0 +1,55 @@
+"""Add keyset pagination indexes to templates table
+
+Revision ID: k2l3m4n5o6p7
+Revises: j1k2l3m4n5o6
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'k2l3m4n5o6p7'
+down_revision = 'j1k2l3m4n5o6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add indexes backing cursor pagination of the template list.
+
+    (created_at, id) keyset queries seek directly to the requested page
+    instead of scanning past an OFFSET. The partial indexes cover the
+    common featured-only and public-only library views.
+    """
+    op.create_index(
+        'idx_templates_created_id',
+        'templates',
+        ['created_at', 'id'],
+        unique=False
+    )
+
+    op.create_index(
+        'idx_templates_featured_created_id',
+        'templates',
+        ['created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active AND is_featured')
+    )
+
+    op.create_index(
+        'idx_templates_public_created_id',
+        'templates',
+        ['created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active AND is_public')
+    )
+
+
+def downgrade():
+    """Remove the keyset pagination indexes."""
+    op.drop_index('idx_templates_public_created_id', table_name='templates')
+    op.drop_index('idx_templates_featured_created_id', table_name='templates')
+    op.drop_index('idx_templates_created_id', table_name='templates')
@@ -15,8 +15,8 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
-from core.dependencies import get_current_active_user
+from core.database import get_db, get_db_read
+from core.dependencies import get_current_active_user, get_current_active_user_read
 from models.user import User
 from schemas.agent import AgentCreate, AgentResponse, AgentUpdate
 from schemas.subagent import SubagentCreate, SubagentResponse, SubagentUpdate
@@ -151,8 +151,8 @@ async def list_agents(
     is_active: Optional[bool] = Query(
         None, description="Filter by active status (default: true)"
     ),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     List all agents with pagination and filters.
@@ -194,8 +194,8 @@ async def list_agents(
 @router.get("/{agent_id}", response_model=AgentResponse)
 async def get_agent(
     agent_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get agent by ID.
@@ -508,8 +508,8 @@ async def add_subagent_to_agent(
 @router.get("/{agent_id}/subagents", response_model=List[SubagentResponse])
 async def list_agent_subagents(
     agent_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     List all subagents for an agent.
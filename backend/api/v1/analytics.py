@@ -6,8 +6,8 @@ from typing import Literal, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
-from core.dependencies import get_current_active_user
+from core.database import get_db_read
+from core.dependencies import get_current_active_user_read
 from models.user import User
 from schemas.analytics import (
     AgentPerformanceResponse,
@@ -32,8 +32,8 @@ async def get_execution_time_series(
         "day", description="Time bucket interval"
     ),
     agent_id: Optional[int] = Query(None, description="Optional agent ID filter"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get execution time-series analytics.
@@ -76,8 +76,8 @@ async def get_agent_usage_rankings(
     start_date: datetime = Query(..., description="Start of date range"),
     end_date: datetime = Query(..., description="End of date range"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of agents to return"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get agent usage rankings.
@@ -120,8 +120,8 @@ async def get_token_usage_breakdown(
     group_by: Literal["agent", "model", "day"] = Query(
         "agent", description="Dimension to group by"
     ),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get token usage breakdown by dimension.
@@ -162,8 +162,8 @@ async def get_error_analysis(
     start_date: datetime = Query(..., description="Start of date range"),
     end_date: datetime = Query(..., description="End of date range"),
     limit: int = Query(10, ge=1, le=100, description="Maximum error patterns to return"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get error pattern analysis.
@@ -202,8 +202,8 @@ async def get_agent_performance_metrics(
     agent_id: int,
     start_date: datetime = Query(..., description="Start of date range"),
     end_date: datetime = Query(..., description="End of date range"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get detailed performance metrics for a specific agent.
@@ -256,8 +256,8 @@ async def get_agent_performance_metrics(
 
 @router.get("/performance/system", response_model=SystemPerformanceResponse)
 async def get_system_performance_metrics(
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get overall system performance metrics.
@@ -288,8 +288,8 @@ async def get_system_performance_metrics(
 async def get_cost_recommendations(
     start_date: datetime = Query(..., description="Start of date range"),
     end_date: datetime = Query(..., description="End of date range"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get cost optimization recommendations.
@@ -329,8 +329,8 @@ async def get_cost_projections(
     projection_days: int = Query(
         30, ge=1, le=365, description="Number of days to project"
     ),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ):
     """
     Get cost projections based on historical usage.
@@ -13,30 +13,82 @@ Also provides WebSocket endpoint for:
 - Real-time execution trace streaming
 """
 
-from typing import List, Optional
+import json
+from typing import TYPE_CHECKING, List, Optional
 
 from fastapi import (
     APIRouter,
     Depends,
     HTTPException,
     Query,
+    Response,
     WebSocket,
     WebSocketDisconnect,
     status,
 )
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
-from core.dependencies import get_current_active_user
+from core.database import get_db, get_db_read, get_stream_db, start_stream
+from core.dependencies import get_current_active_user, get_current_active_user_read
 from core.security import decode_access_token
 from models.user import User
 from schemas.execution import ExecutionCreate, ExecutionResponse, TraceResponse
 from services.auth_service import AuthService
 from services.execution_service import execution_service
 
+if TYPE_CHECKING:
+    from models.execution import Execution
+
 router = APIRouter(prefix="/executions", tags=["executions"])
 
 
+def _auth_message(status_value: str, message: Optional[str] = None) -> str:
+    """Serialize a WebSocket auth message exactly as ``send_json`` would."""
+    payload = {"type": "auth", "status": status_value}
+    if message is not None:
+        payload["message"] = message
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+# Static WebSocket auth payloads, serialized once at import time so that
+# rejected handshakes (e.g. reconnect storms) do not re-encode JSON.
+_AUTH_ERR_FORMAT = _auth_message(
+    "error", "First message must be authentication message with type='auth'"
+)
+_AUTH_ERR_NO_TOKEN = _auth_message("error", "Token is required")
+_AUTH_ERR_INVALID = _auth_message("error", "Invalid or expired token")
+_AUTH_ERR_BAD_PAYLOAD = _auth_message("error", "Invalid token payload")
+_AUTH_ERR_INACTIVE = _auth_message("error", "User not found or inactive")
+_AUTH_OK = _auth_message("success")
+
+
+# Executions in these states never change again, and neither do their traces.
+TERMINAL_EXECUTION_STATUSES = frozenset({"completed", "failed", "cancelled"})
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def set_execution_cache_headers(response: Response, execution: "Execution") -> None:
+    """
+    Set HTTP caching headers based on execution state.
+
+    Terminal executions are immutable, so clients may cache them (and their
+    traces) indefinitely. Anything still pending/running must not be cached.
+    Responses are user-specific, hence ``private`` rather than ``public``.
+
+    Args:
+        response: Response whose headers should be updated
+        execution: Execution the response is derived from
+    """
+    if execution.status in TERMINAL_EXECUTION_STATUSES:
+        finished_at = execution.completed_at or execution.created_at
+        version = int(finished_at.timestamp()) if finished_at else 0
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response.headers["ETag"] = f'"{execution.id}-{execution.status}-{version}"'
+    else:
+        response.headers["Cache-Control"] = "no-store"
+
+
 # ============================================================================
 # Helper Functions - Authorization
 # ============================================================================
@@ -128,6 +180,39 @@ async def get_execution_or_403(
     return execution
 
 
+async def get_stream_owner_is_active(
+    execution_id: int,
+    user_id: int,
+    db: AsyncSession,
+) -> Optional[bool]:
+    """
+    Check execution ownership and the owner's active flag in one query.
+
+    Used by the WebSocket handshake: tokens already carry the user_id claim,
+    so the common case (user streams their own execution) needs no separate
+    user lookup.
+
+    Args:
+        execution_id: Execution ID to stream
+        user_id: User ID from the JWT ``user_id`` claim
+        db: Database session
+
+    Returns:
+        The owner's ``is_active`` flag if ``user_id`` owns the execution,
+        None if the execution doesn't exist or belongs to someone else.
+    """
+    from models.execution import Execution
+    from sqlalchemy import select
+
+    stmt = (
+        select(User.is_active)
+        .join(Execution, Execution.created_by_id == User.id)
+        .where(Execution.id == execution_id, User.id == user_id)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
 @router.post("/", response_model=ExecutionResponse, status_code=status.HTTP_201_CREATED)
 async def create_execution(
     execution_data: ExecutionCreate,
@@ -213,14 +298,19 @@ async def start_execution(
 @router.get("/{execution_id}", response_model=ExecutionResponse)
 async def get_execution(
     execution_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read)
 ) -> ExecutionResponse:
     """
     Get execution by ID.
 
+    Completed, failed and cancelled executions are served with immutable
+    Cache-Control headers; in-progress ones with ``no-store``.
+
     Args:
         execution_id: Execution ID
+        response: Outgoing response (used to set caching headers)
         current_user: Current authenticated user
         db: Database session
 
@@ -233,6 +323,7 @@ async def get_execution(
     """
     # Verify ownership before returning execution
     execution = await get_execution_or_403(execution_id, current_user.id, db)
+    set_execution_cache_headers(response, execution)
     return execution
 
 
@@ -242,8 +333,8 @@ async def list_executions(
     status: Optional[str] = Query(None, description="Filter by status"),
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(100, ge=1, le=1000, description="Pagination limit"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ) -> List[ExecutionResponse]:
     """
     List executions with optional filters.
@@ -264,12 +355,8 @@ async def list_executions(
     Raises:
         HTTPException: 403 if agent_id specified but user doesn't own it
     """
-    # If agent_id filter is specified, verify user owns that agent
-    if agent_id is not None:
-        await get_agent_or_403(agent_id, current_user.id, db)
-
-    # List executions - need to filter by user_id
-    # Note: execution_service.list_executions should filter by created_by_id
+    # Agent ownership is enforced inside the query via a join, so the common
+    # case needs a single round trip.
     executions = await execution_service.list_executions(
         db=db,
         agent_id=agent_id,
@@ -277,7 +364,14 @@ async def list_executions(
         skip=skip,
         limit=limit,
         user_id=current_user.id,  # Filter by current user
+        require_agent_owner=True,
     )
+
+    # An empty result is ambiguous when filtering by agent: probe the agent
+    # only then to report 404/403 instead of an empty list.
+    if not executions and agent_id is not None:
+        await get_agent_or_403(agent_id, current_user.id, db)
+
     return executions
 
 
@@ -315,18 +409,26 @@ async def cancel_execution(
     return {"status": "cancelled"}
 
 
-@router.get("/{execution_id}/traces", response_model=List[TraceResponse])
+@router.get(
+    "/{execution_id}/traces",
+    response_class=StreamingResponse,
+    responses={200: {"model": List[TraceResponse]}},
+)
 async def get_execution_traces(
     execution_id: int,
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(1000, ge=1, le=10000, description="Pagination limit"),
     current_user: User = Depends(get_current_active_user),
+    # Server-side cursors need a transaction: not an autocommit get_db_read session
     db: AsyncSession = Depends(get_db),
-) -> List[TraceResponse]:
+) -> StreamingResponse:
     """
     Get traces for an execution.
 
     Returns ordered list of trace events for post-execution analysis.
+    The JSON array is streamed row by row, so large pages are never
+    materialized in memory. Traces of finished executions are served with
+    immutable Cache-Control headers.
 
     Args:
         execution_id: Execution ID
@@ -336,19 +438,36 @@ async def get_execution_traces(
         db: Database session
 
     Returns:
-        List of traces ordered by sequence number
+        Streamed JSON list of traces ordered by sequence number
 
     Raises:
         HTTPException: 403 if user doesn't own the execution
         HTTPException: 404 if execution not found
     """
     # Verify user owns the execution before returning traces
-    await get_execution_or_403(execution_id, current_user.id, db)
+    execution = await get_execution_or_403(execution_id, current_user.id, db)
 
-    traces = await execution_service.get_execution_traces(
-        db=db, execution_id=execution_id, skip=skip, limit=limit
+    # Query errors must surface before the 200 goes out with the first chunk
+    traces = await start_stream(
+        execution_service.stream_execution_traces(
+            db=db, execution_id=execution_id, skip=skip, limit=limit
+        )
     )
-    return traces
+
+    async def generate_traces():
+        yield b"["
+        if traces is not None:
+            first = True
+            async for trace in traces:
+                if not first:
+                    yield b","
+                yield TraceResponse.model_validate(trace).model_dump_json().encode()
+                first = False
+        yield b"]"
+
+    response = StreamingResponse(generate_traces(), media_type="application/json")
+    set_execution_cache_headers(response, execution)
+    return response
 
 
 @router.websocket("/{execution_id}/stream")
@@ -385,11 +504,7 @@ async def stream_execution(websocket: WebSocket, execution_id: int):
 
         # Validate auth message format
         if not isinstance(auth_message, dict) or auth_message.get("type") != "auth":
-            await websocket.send_json({
-                "type": "auth",
-                "status": "error",
-                "message": "First message must be authentication message with type='auth'"
-            })
+            await websocket.send_text(_AUTH_ERR_FORMAT)
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
 
@@ -399,65 +514,63 @@ async def stream_execution(websocket: WebSocket, execution_id: int):
         if token.startswith("Bearer "):
             token = token[7:]
         elif not token:
-            await websocket.send_json({
-                "type": "auth",
-                "status": "error",
-                "message": "Token is required"
-            })
+            await websocket.send_text(_AUTH_ERR_NO_TOKEN)
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
 
         # Validate JWT token
         token_data = decode_access_token(token)
         if token_data is None:
-            await websocket.send_json({
-                "type": "auth",
-                "status": "error",
-                "message": "Invalid or expired token"
-            })
+            await websocket.send_text(_AUTH_ERR_INVALID)
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
 
         # Get user from token
         username = token_data.get("sub")
+        user_id = token_data.get("user_id")
         if not username:
-            await websocket.send_json({
-                "type": "auth",
-                "status": "error",
-                "message": "Invalid token payload"
-            })
+            await websocket.send_text(_AUTH_ERR_BAD_PAYLOAD)
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
 
-        # Get database session and validate user
-        async for db in get_db():
+        # Get database session (from the streaming pool) and validate user
+        async for db in get_stream_db():
             try:
-                user = await AuthService.get_user_by_username(db, username=username)
-                if not user or not user.is_active:
-                    await websocket.send_json({
-                        "type": "auth",
-                        "status": "error",
-                        "message": "User not found or inactive"
-                    })
+                # Fast path: ownership and active flag in a single query
+                is_owner = False
+                is_active = None
+                if user_id is not None:
+                    is_active = await get_stream_owner_is_active(
+                        execution_id, user_id, db
+                    )
+                    is_owner = is_active is not None
+
+                # Slow path: not the owner (or legacy token without user_id),
+                # so look the user up to report the right error
+                if not is_owner:
+                    user = await AuthService.get_user_by_username(db, username=username)
+                    is_active = bool(user and user.is_active)
+                    user_id = user.id if user else None
+
+                if not is_active:
+                    await websocket.send_text(_AUTH_ERR_INACTIVE)
                     await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
                     return
 
                 # Authentication successful
-                await websocket.send_json({
-                    "type": "auth",
-                    "status": "success"
-                })
+                await websocket.send_text(_AUTH_OK)
 
                 # Verify user owns the execution before starting
-                try:
-                    await get_execution_or_403(execution_id, user.id, db)
-                except HTTPException as e:
-                    await websocket.send_json({
-                        "event_type": "error",
-                        "content": {"error": f"Access denied: {e.detail}"}
-                    })
-                    await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
-                    return
+                if not is_owner:
+                    try:
+                        await get_execution_or_403(execution_id, user_id, db)
+                    except HTTPException as e:
+                        await websocket.send_json({
+                            "event_type": "error",
+                            "content": {"error": f"Access denied: {e.detail}"}
+                        })
+                        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                        return
 
                 # Start execution and stream traces
                 async for trace in execution_service.start_execution(db, execution_id):
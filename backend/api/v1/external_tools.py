@@ -5,14 +5,20 @@ Provides REST API for external tool configuration, connection testing,
 and tool marketplace.
 """
 
-from typing import Optional
+import hashlib
+import json
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
-from core.dependencies import get_current_active_user
+from core.cache import LocalTTLCache
+from core.constants import LOCAL_CACHE_TOOL_CONFIG_TTL
+from core.database import get_db, get_db_read, start_stream
+from core.dependencies import get_current_active_user, get_current_active_user_read
+from core.pagination import decode_cursor, encode_cursor
 from models.user import User
 from schemas.external_tool import (
     ConnectionTestRequest,
@@ -28,6 +34,17 @@ from services.external_tool_service import external_tool_service
 
 router = APIRouter(prefix="/external-tools", tags=["external-tools"])
 
+# The tool catalog is static for the lifetime of the process, so it is
+# serialized once and served as raw bytes with an ETag.
+CATALOG_CACHE_CONTROL = "public, max-age=300"
+_catalog_body: Optional[bytes] = None
+_catalog_etag: Optional[str] = None
+
+# Per-worker cache of single-config responses keyed on (user_id, tool_id).
+# Holds validated response models (never ORM objects, which are bound to a
+# session) and is invalidated by every endpoint that writes a config.
+_tool_config_cache = LocalTTLCache(ttl=LOCAL_CACHE_TOOL_CONFIG_TTL)
+
 
 @router.post(
     "/",
@@ -95,89 +112,114 @@ async def create_tool_config(
         )
 
 
-@router.get("/", response_model=ExternalToolConfigListResponse)
+@router.get(
+    "/",
+    response_class=StreamingResponse,
+    responses={200: {"model": ExternalToolConfigListResponse}},
+)
 async def list_tool_configs(
     tool_type: Optional[str] = Query(None, description="Filter by tool type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    page: int = Query(1, ge=1, description="Page number (deprecated, use cursor)"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_active_user),
+    # Server-side cursors need a transaction: not an autocommit get_db_read session
     db: AsyncSession = Depends(get_db),
-) -> ExternalToolConfigListResponse:
+) -> StreamingResponse:
     """
     List user's external tool configurations.
 
+    Supports keyset pagination: pass the ``next_cursor`` of the previous
+    response as ``cursor`` to fetch the next page in constant time.
+    ``page`` is kept for backwards compatibility (OFFSET-based).
+
     **Query Parameters:**
     - `tool_type`: Filter by type (postgresql, elasticsearch, http, gitlab)
     - `is_active`: Filter by active status
-    - `page`: Page number (default: 1)
+    - `cursor`: Opaque cursor from a previous response
+    - `page`: Page number (default: 1, ignored when `cursor` is set)
     - `page_size`: Items per page (default: 50, max: 100)
 
     Args:
         tool_type: Filter by tool type
         is_active: Filter by active status
+        cursor: Keyset pagination cursor
         page: Page number
         page_size: Items per page
         current_user: Current authenticated user
         db: Database session
 
     Returns:
-        Paginated list of tool configurations
+        Streamed JSON page of tool configurations
+        (ExternalToolConfigListResponse shape)
 
     Raises:
+        HTTPException 400: Invalid cursor
         HTTPException 401: Unauthorized
-        HTTPException 500: Internal server error
     """
-    try:
-        skip = (page - 1) * page_size
-
-        # Get tool configs
-        tool_configs = await external_tool_service.list_tool_configs(
-            db=db,
-            user_id=current_user.id,
-            tool_type=tool_type,
-            is_active=is_active,
-            skip=skip,
-            limit=page_size,
-        )
-
-        # Get total count
-        total = await external_tool_service.count_tool_configs(
-            db=db,
-            user_id=current_user.id,
-            tool_type=tool_type,
-            is_active=is_active,
+    after = decode_cursor(cursor) if cursor else None
+    skip = 0 if after else (page - 1) * page_size
+    filters = {"user_id": current_user.id, "tool_type": tool_type, "is_active": is_active}
+
+    # Run the queries before the 200 goes out with the first chunk, so
+    # database errors still become a normal 500. One extra row tells
+    # whether another page exists.
+    rows = await start_stream(
+        external_tool_service.stream_tool_configs_with_total(
+            db=db, skip=skip, limit=page_size + 1, after=after, **filters
         )
-
-        # Convert to response models
-        items = [
-            ExternalToolConfigResponse.model_validate(config)
-            for config in tool_configs
-        ]
-
-        has_more = (skip + len(items)) < total
-
-        return ExternalToolConfigListResponse(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
+    )
+    total = None
+    if rows is None:
+        # Empty page: only past the first one can there be matching rows
+        total = (
+            await external_tool_service.count_tool_configs(db=db, **filters)
+            if skip or after is not None
+            else 0
         )
 
-    except Exception as e:
-        logger.error(f"Error listing tool configs: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    async def generate_page():
+        # Items are serialized one at a time as rows arrive; the envelope
+        # fields that depend on the whole page are written after them.
+        yield b'{"items":['
+        page_total = total
+        count = 0
+        has_more = False
+        last = None
+
+        if rows is not None:
+            async for tool_config, row_total in rows:
+                page_total = row_total
+                if count == page_size:
+                    has_more = True
+                    continue
+                if count:
+                    yield b","
+                yield ExternalToolConfigResponse.model_validate(
+                    tool_config
+                ).model_dump_json().encode()
+                last = (tool_config.created_at, tool_config.id)
+                count += 1
+
+        next_cursor = encode_cursor(*last) if has_more else None
+        tail = {
+            "total": page_total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+        yield b"]," + json.dumps(tail, separators=(",", ":"))[1:].encode()
+
+    return StreamingResponse(generate_page(), media_type="application/json")
 
 
 @router.get("/{tool_id}", response_model=ExternalToolConfigResponse)
 async def get_tool_config(
     tool_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ) -> ExternalToolConfigResponse:
     """
     Get external tool configuration by ID.
@@ -195,6 +237,11 @@ async def get_tool_config(
         HTTPException 404: Tool not found
         HTTPException 500: Internal server error
     """
+    cache_key = (current_user.id, tool_id)
+    cached = _tool_config_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         tool_config = await external_tool_service.get_tool_config(
             db, current_user.id, tool_id
@@ -206,7 +253,9 @@ async def get_tool_config(
                 detail=f"Tool configuration {tool_id} not found",
             )
 
-        return ExternalToolConfigResponse.model_validate(tool_config)
+        response = ExternalToolConfigResponse.model_validate(tool_config)
+        _tool_config_cache.set(cache_key, response)
+        return response
 
     except HTTPException:
         raise
@@ -250,6 +299,7 @@ async def update_tool_config(
         tool_config = await external_tool_service.update_tool_config(
             db, current_user.id, tool_id, tool_data
         )
+        _tool_config_cache.pop((current_user.id, tool_id))
 
         if not tool_config:
             raise HTTPException(
@@ -301,6 +351,7 @@ async def delete_tool_config(
         deleted = await external_tool_service.delete_tool_config(
             db, current_user.id, tool_id
         )
+        _tool_config_cache.pop((current_user.id, tool_id))
 
         if not deleted:
             raise HTTPException(
@@ -324,7 +375,7 @@ async def test_tool_connection(
     test_request: Optional[ConnectionTestRequest] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-) -> ConnectionTestResponse:
+) -> Dict[str, Any]:
     """
     Test connection to external tool.
 
@@ -365,8 +416,11 @@ async def test_tool_connection(
         result = await external_tool_service.test_connection(
             db, current_user.id, tool_id, override_config
         )
+        # Stored test status changed
+        _tool_config_cache.pop((current_user.id, tool_id))
 
-        return ConnectionTestResponse(**result)
+        # Validated and serialized once against response_model by FastAPI
+        return result
 
     except ValueError as e:
         logger.warning(f"Tool connection test failed: {e}")
@@ -387,16 +441,36 @@ async def test_tool_connection(
 # ============================================================================
 
 
+async def _get_catalog_body() -> Tuple[bytes, str]:
+    """Return the serialized tool catalog and its ETag, building them once."""
+    global _catalog_body, _catalog_etag
+
+    if _catalog_body is None:
+        catalog_items = await external_tool_service.get_tool_catalog()
+        body = ToolCatalogResponse(
+            langchain_tools=catalog_items,
+            total=len(catalog_items),
+        ).model_dump_json().encode()
+        _catalog_etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        _catalog_body = body
+
+    return _catalog_body, _catalog_etag
+
+
 @router.get("/catalog/all", response_model=ToolCatalogResponse, tags=["tools"])
 async def get_tool_catalog(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
-) -> ToolCatalogResponse:
+) -> Response:
     """
     Get tool catalog for marketplace.
 
     Returns available tools with configuration schemas, examples,
     and metadata for the Tool Marketplace UI.
 
+    The catalog is serialized once per process and served with an ETag;
+    requests with a matching ``If-None-Match`` get ``304 Not Modified``.
+
     **Categories:**
     - database: PostgreSQL, MySQL, etc.
     - git: GitLab, GitHub
@@ -405,6 +479,7 @@ async def get_tool_catalog(
     - http: Generic HTTP API clients
 
     Args:
+        request: Incoming request (for conditional headers)
         current_user: Current authenticated user
 
     Returns:
@@ -415,12 +490,13 @@ async def get_tool_catalog(
         HTTPException 500: Internal server error
     """
     try:
-        catalog_items = await external_tool_service.get_tool_catalog()
+        body, etag = await _get_catalog_body()
+        headers = {"Cache-Control": CATALOG_CACHE_CONTROL, "ETag": etag}
 
-        return ToolCatalogResponse(
-            langchain_tools=catalog_items,
-            total=len(catalog_items),
-        )
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(content=body, media_type="application/json", headers=headers)
 
     except Exception as e:
         logger.error(f"Error getting tool catalog: {e}", exc_info=True)
@@ -433,9 +509,9 @@ async def get_tool_catalog(
 @router.get("/analytics/usage", response_model=ToolUsageAnalytics, tags=["monitoring"])
 async def get_tool_usage_analytics(
     days: int = Query(30, ge=1, le=90, description="Number of days to analyze"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
-) -> ToolUsageAnalytics:
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
+) -> Dict[str, Any]:
     """
     Get tool usage analytics.
 
@@ -463,7 +539,8 @@ async def get_tool_usage_analytics(
             db, current_user.id, days
         )
 
-        return ToolUsageAnalytics(**analytics)
+        # Validated and serialized once against response_model by FastAPI
+        return analytics
 
     except Exception as e:
         logger.error(f"Error getting tool usage analytics: {e}", exc_info=True)
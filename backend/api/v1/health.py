@@ -10,22 +10,38 @@ This module provides:
 import asyncio
 import os
 import shutil
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import get_redis_client
 from core.config import settings
-from core.database import engine
+from core.constants import DB_HEARTBEAT_INTERVAL_SECONDS, DB_HEARTBEAT_STALE_SECONDS
+from core.database import health_engine
 from core.dependencies import get_current_active_user
 from models.user import User
 
+try:
+    import psutil
+except ImportError:  # Optional: memory check reports "unknown" without it
+    psutil = None
+
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# Static part of the basic health payload (settings are immutable)
+_HEALTH_INFO = {
+    "status": "healthy",
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+    "service": settings.PROJECT_NAME,
+}
+
 
 # ============================================================================
 # Basic Health Check (Liveness)
@@ -43,13 +59,37 @@ async def health_check() -> dict[str, Any]:
     Returns:
         Health status and basic information
     """
-    return {
-        "status": "healthy",
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-        "service": settings.PROJECT_NAME,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    return {**_HEALTH_INFO, "timestamp": datetime.now(timezone.utc).isoformat()}
+
+
+# ============================================================================
+# Database Heartbeat
+# ============================================================================
+
+
+async def _ping_database(state: Any) -> None:
+    """Run SELECT 1 and record the time of success on ``state.db_last_ok``."""
+    async with health_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    state.db_last_ok = time.monotonic()
+
+
+async def run_db_heartbeat(state: Any) -> None:
+    """
+    Background task keeping ``state.db_last_ok`` fresh.
+
+    Readiness probes read the timestamp instead of checking out a pool
+    connection on every request.
+
+    Args:
+        state: Application state (``app.state``)
+    """
+    while True:
+        try:
+            await _ping_database(state)
+        except Exception as e:
+            logger.warning(f"Database heartbeat failed: {e}")
+        await asyncio.sleep(DB_HEARTBEAT_INTERVAL_SECONDS)
 
 
 # ============================================================================
@@ -58,7 +98,7 @@ async def health_check() -> dict[str, Any]:
 
 
 @router.get("/readiness")
-async def readiness_check() -> dict[str, Any]:
+async def readiness_check(request: Request) -> dict[str, Any]:
     """
     Readiness check endpoint.
 
@@ -66,12 +106,19 @@ async def readiness_check() -> dict[str, Any]:
     This includes basic dependency checks.
     Use this for Kubernetes readiness probes.
 
+    The database counts as ready when the background heartbeat succeeded
+    recently; only a stale heartbeat makes the probe query the database.
+
+    Args:
+        request: Incoming request (provides app state)
+
     Returns:
         Readiness status
 
     Raises:
         HTTPException: If service is not ready
     """
+    timestamp = datetime.now(timezone.utc).isoformat()
     checks = {
         "database": False,
         "redis": False,
@@ -80,8 +127,10 @@ async def readiness_check() -> dict[str, Any]:
 
     # Check database connection
     try:
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
+        state = request.app.state
+        last_ok = getattr(state, "db_last_ok", 0.0)
+        if time.monotonic() - last_ok >= DB_HEARTBEAT_STALE_SECONDS:
+            await _ping_database(state)
         checks["database"] = True
     except Exception as e:
         logger.error(f"Database readiness check failed: {e}")
@@ -89,12 +138,8 @@ async def readiness_check() -> dict[str, Any]:
 
     # Check Redis connection (if configured)
     try:
-        # Import redis here to avoid circular imports
-        import redis.asyncio as redis
-
-        redis_client = redis.from_url(str(settings.REDIS_URL))
+        redis_client = await get_redis_client()
         await redis_client.ping()
-        await redis_client.close()
         checks["redis"] = True
     except Exception as e:
         logger.error(f"Redis readiness check failed: {e}")
@@ -110,14 +155,14 @@ async def readiness_check() -> dict[str, Any]:
                 "status": "not_ready",
                 "checks": checks,
                 "errors": errors,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": timestamp,
             },
         )
 
     return {
         "status": "ready",
         "checks": checks,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp,
     }
 
 
@@ -144,89 +189,62 @@ async def liveness_check() -> dict[str, str]:
 
 
 # ============================================================================
-# Deep Health Check
+# Deep Health Check - Individual Probes
 # ============================================================================
+# Each probe returns (check_name, check_details, is_healthy) so that
+# deep_health_check can run them concurrently and fold the results.
+# External API probes use HEAD: any HTTP response proves reachability,
+# and no response body (e.g. OpenAI's model list) is downloaded.
 
+HealthProbeResult = tuple[str, dict[str, Any], bool]
 
-@router.get("/deep")
-async def deep_health_check(
-    current_user: User = Depends(get_current_active_user),
-) -> dict[str, Any]:
-    """
-    Comprehensive health check for all dependencies.
-
-    **Requires authentication** - exposes sensitive operational data.
-
-    Checks:
-    - Database connectivity and query execution
-    - Redis connectivity and operations
-    - Disk space availability
-    - Memory usage
-    - External API reachability (Anthropic, OpenAI)
-
-    This endpoint may be slow (5-10 seconds) as it thoroughly tests all systems.
-    Do NOT use this for load balancer health checks.
-
-    Args:
-        current_user: Current authenticated user
+# Table count only changes on deploys; refresh it at most once a minute so
+# the information_schema scan doesn't run on every deep probe.
+TABLE_COUNT_CACHE_SECONDS = 60.0
+_table_count_cache: Optional[tuple[float, int]] = None
 
-    Returns:
-        Detailed health status of all components
-
-    Raises:
-        HTTPException: 401 if not authenticated
-        HTTPException: 503 if any critical component is unhealthy
-    """
-    health_status = {
-        "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-        "checks": {},
-    }
 
-    all_healthy = True
+async def _check_database() -> HealthProbeResult:
+    """Check database connectivity and query execution."""
+    global _table_count_cache
 
-    # ========================================================================
-    # Database Health Check
-    # ========================================================================
     try:
-        db_start = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        db_start = loop.time()
 
-        async with engine.connect() as conn:
+        async with health_engine.connect() as conn:
             # Test connection
             await conn.execute(text("SELECT 1"))
 
-            # Test query execution
-            result = await conn.execute(
-                text("SELECT COUNT(*) FROM information_schema.tables")
-            )
-            table_count = result.scalar()
+            # Schema statistics (cached, see TABLE_COUNT_CACHE_SECONDS)
+            if (
+                _table_count_cache is None
+                or db_start - _table_count_cache[0] > TABLE_COUNT_CACHE_SECONDS
+            ):
+                result = await conn.execute(
+                    text("SELECT COUNT(*) FROM information_schema.tables")
+                )
+                _table_count_cache = (db_start, result.scalar())
+            table_count = _table_count_cache[1]
 
-        db_duration = asyncio.get_event_loop().time() - db_start
+        db_duration = loop.time() - db_start
 
-        health_status["checks"]["database"] = {
+        return "database", {
             "status": "healthy",
             "response_time_ms": round(db_duration * 1000, 2),
             "table_count": table_count,
-        }
+        }, True
     except Exception as e:
         logger.error(f"Database deep health check failed: {e}")
-        health_status["checks"]["database"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-        all_healthy = False
+        return "database", {"status": "unhealthy", "error": str(e)}, False
 
-    # ========================================================================
-    # Redis Health Check
-    # ========================================================================
-    try:
-        import redis.asyncio as redis
 
-        redis_start = asyncio.get_event_loop().time()
+async def _check_redis() -> HealthProbeResult:
+    """Check Redis connectivity and basic operations."""
+    try:
+        redis_start = asyncio.get_running_loop().time()
 
-        redis_client = redis.from_url(str(settings.REDIS_URL))
+        redis_client = await get_redis_client()
 
         # Test ping
         await redis_client.ping()
@@ -234,32 +252,27 @@ async def deep_health_check(
         # Test set/get
         test_key = "health_check_test"
         await redis_client.set(test_key, "test_value", ex=10)
-        value = await redis_client.get(test_key)
+        await redis_client.get(test_key)
         await redis_client.delete(test_key)
 
         # Get info
         info = await redis_client.info()
-        await redis_client.close()
 
-        redis_duration = asyncio.get_event_loop().time() - redis_start
+        redis_duration = asyncio.get_running_loop().time() - redis_start
 
-        health_status["checks"]["redis"] = {
+        return "redis", {
             "status": "healthy",
             "response_time_ms": round(redis_duration * 1000, 2),
             "memory_used_mb": round(info.get("used_memory", 0) / 1024 / 1024, 2),
             "connected_clients": info.get("connected_clients", 0),
-        }
+        }, True
     except Exception as e:
         logger.error(f"Redis deep health check failed: {e}")
-        health_status["checks"]["redis"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-        all_healthy = False
+        return "redis", {"status": "unhealthy", "error": str(e)}, False
 
-    # ========================================================================
-    # Disk Space Check
-    # ========================================================================
+
+def _check_disk() -> HealthProbeResult:
+    """Check free disk space (blocking, run in a worker thread)."""
     try:
         disk_usage = shutil.disk_usage("/")
         free_percent = (disk_usage.free / disk_usage.total) * 100
@@ -267,99 +280,143 @@ async def deep_health_check(
         disk_status = "healthy"
         if free_percent < 5:
             disk_status = "critical"
-            all_healthy = False
         elif free_percent < 10:
             disk_status = "warning"
 
-        health_status["checks"]["disk"] = {
+        return "disk", {
             "status": disk_status,
             "total_gb": round(disk_usage.total / 1024 / 1024 / 1024, 2),
             "used_gb": round(disk_usage.used / 1024 / 1024 / 1024, 2),
             "free_gb": round(disk_usage.free / 1024 / 1024 / 1024, 2),
             "free_percent": round(free_percent, 2),
-        }
+        }, disk_status != "critical"
     except Exception as e:
         logger.error(f"Disk space check failed: {e}")
-        health_status["checks"]["disk"] = {
-            "status": "unknown",
-            "error": str(e),
-        }
+        return "disk", {"status": "unknown", "error": str(e)}, True
 
-    # ========================================================================
-    # Memory Check
-    # ========================================================================
-    try:
-        import psutil
 
+def _check_memory() -> HealthProbeResult:
+    """Check system memory usage (blocking, run in a worker thread)."""
+    if psutil is None:
+        return "memory", {"status": "unknown", "message": "psutil not installed"}, True
+
+    try:
         memory = psutil.virtual_memory()
         memory_percent = memory.percent
 
         memory_status = "healthy"
         if memory_percent > 95:
             memory_status = "critical"
-            all_healthy = False
         elif memory_percent > 90:
             memory_status = "warning"
 
-        health_status["checks"]["memory"] = {
+        return "memory", {
             "status": memory_status,
             "total_gb": round(memory.total / 1024 / 1024 / 1024, 2),
             "available_gb": round(memory.available / 1024 / 1024 / 1024, 2),
             "used_percent": memory_percent,
-        }
-    except ImportError:
-        health_status["checks"]["memory"] = {
-            "status": "unknown",
-            "message": "psutil not installed",
-        }
+        }, memory_status != "critical"
     except Exception as e:
         logger.error(f"Memory check failed: {e}")
-        health_status["checks"]["memory"] = {
-            "status": "unknown",
-            "error": str(e),
-        }
+        return "memory", {"status": "unknown", "error": str(e)}, True
 
-    # ========================================================================
-    # External API Checks (Anthropic, OpenAI)
-    # ========================================================================
-    # Only check if API keys are configured
-    if settings.ANTHROPIC_API_KEY:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.anthropic.com",
-                    timeout=5.0,
-                    headers={"x-api-key": settings.ANTHROPIC_API_KEY},
-                )
-                health_status["checks"]["anthropic_api"] = {
-                    "status": "reachable",
-                    "status_code": response.status_code,
-                }
-        except Exception as e:
-            logger.warning(f"Anthropic API check failed: {e}")
-            health_status["checks"]["anthropic_api"] = {
-                "status": "unreachable",
-                "error": str(e),
-            }
 
+async def _check_anthropic(client: httpx.AsyncClient) -> HealthProbeResult:
+    """Check Anthropic API reachability."""
+    try:
+        response = await client.head(
+            "https://api.anthropic.com",
+            timeout=5.0,
+            headers={"x-api-key": settings.ANTHROPIC_API_KEY},
+        )
+        return "anthropic_api", {
+            "status": "reachable",
+            "status_code": response.status_code,
+        }, True
+    except Exception as e:
+        logger.warning(f"Anthropic API check failed: {e}")
+        return "anthropic_api", {"status": "unreachable", "error": str(e)}, True
+
+
+async def _check_openai(client: httpx.AsyncClient) -> HealthProbeResult:
+    """Check OpenAI API reachability."""
+    try:
+        response = await client.head(
+            "https://api.openai.com/v1/models",
+            timeout=5.0,
+            headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"},
+        )
+        return "openai_api", {
+            "status": "reachable",
+            "status_code": response.status_code,
+        }, True
+    except Exception as e:
+        logger.warning(f"OpenAI API check failed: {e}")
+        return "openai_api", {"status": "unreachable", "error": str(e)}, True
+
+
+# ============================================================================
+# Deep Health Check
+# ============================================================================
+
+
+@router.get("/deep")
+async def deep_health_check(
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+) -> dict[str, Any]:
+    """
+    Comprehensive health check for all dependencies.
+
+    **Requires authentication** - exposes sensitive operational data.
+
+    Checks:
+    - Database connectivity and query execution
+    - Redis connectivity and operations
+    - Disk space availability
+    - Memory usage
+    - External API reachability (Anthropic, OpenAI)
+
+    All checks run concurrently, so the endpoint takes about as long as the
+    slowest probe (external APIs time out after 5 seconds).
+    Do NOT use this for load balancer health checks.
+
+    Args:
+        request: Incoming request (provides the app's shared HTTP client)
+        current_user: Current authenticated user
+
+    Returns:
+        Detailed health status of all components
+
+    Raises:
+        HTTPException: 401 if not authenticated
+        HTTPException: 503 if any critical component is unhealthy
+    """
+    health_status = {
+        "status": "healthy",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "version": settings.VERSION,
+        "environment": settings.ENVIRONMENT,
+        "checks": {},
+    }
+
+    probes = [
+        _check_database(),
+        _check_redis(),
+        asyncio.to_thread(_check_disk),
+        asyncio.to_thread(_check_memory),
+    ]
+    # Only check external APIs if API keys are configured
+    http_client = request.app.state.http_client
+    if settings.ANTHROPIC_API_KEY:
+        probes.append(_check_anthropic(http_client))
     if settings.OPENAI_API_KEY:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.openai.com/v1/models",
-                    timeout=5.0,
-                    headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"},
-                )
-                health_status["checks"]["openai_api"] = {
-                    "status": "reachable",
-                    "status_code": response.status_code,
-                }
-        except Exception as e:
-            logger.warning(f"OpenAI API check failed: {e}")
-            health_status["checks"]["openai_api"] = {
-                "status": "unreachable",
-                "error": str(e),
-            }
+        probes.append(_check_openai(http_client))
+
+    all_healthy = True
+    for name, details, healthy in await asyncio.gather(*probes):
+        health_status["checks"][name] = details
+        all_healthy = all_healthy and healthy
 
     # ========================================================================
     # Overall Status
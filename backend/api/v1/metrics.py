@@ -8,20 +8,30 @@ This module provides:
 - System metrics
 """
 
-from typing import Any
+import asyncio
+import gzip
+import time
+from typing import Any, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Request, Response
 from loguru import logger
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
-    REGISTRY,
     Counter,
     Gauge,
     Histogram,
     generate_latest,
 )
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.constants import METRICS_APP_STATS_TTL_SECONDS, METRICS_RENDER_TTL_SECONDS
+from core.database import engine, get_db, health_engine, read_engine, stream_engine
 from core.dependencies import get_current_active_user
+from core.metrics_registry import APP_REGISTRY, BoundedLabel, labeled
+from models.agent import Agent
+from models.template import Template
 from models.user import User
 
 router = APIRouter(prefix="/metrics", tags=["Metrics"])
@@ -35,6 +45,7 @@ http_requests_total = Counter(
     "http_requests_total",
     "Total HTTP requests",
     ["method", "endpoint", "status"],
+    registry=APP_REGISTRY,
 )
 
 http_request_duration_seconds = Histogram(
@@ -42,6 +53,7 @@ http_request_duration_seconds = Histogram(
     "HTTP request duration in seconds",
     ["method", "endpoint"],
     buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0),
+    registry=APP_REGISTRY,
 )
 
 # Agent Execution Metrics
@@ -49,6 +61,7 @@ agent_executions_total = Counter(
     "agent_executions_total",
     "Total agent executions",
     ["agent_id", "status"],
+    registry=APP_REGISTRY,
 )
 
 agent_execution_duration_seconds = Histogram(
@@ -56,12 +69,14 @@ agent_execution_duration_seconds = Histogram(
     "Agent execution duration in seconds",
     ["agent_id"],
     buckets=(1, 5, 10, 30, 60, 120, 300, 600),
+    registry=APP_REGISTRY,
 )
 
 agent_execution_errors_total = Counter(
     "agent_execution_errors_total",
     "Total agent execution errors",
     ["agent_id", "error_type"],
+    registry=APP_REGISTRY,
 )
 
 # Tool Execution Metrics
@@ -69,17 +84,20 @@ agent_tool_executions_total = Counter(
     "agent_tool_executions_total",
     "Total tool executions by agents",
     ["tool_name", "agent_id"],
+    registry=APP_REGISTRY,
 )
 
 # Database Metrics
 db_connections_active = Gauge(
     "db_connections_active",
     "Number of active database connections",
+    registry=APP_REGISTRY,
 )
 
 db_connections_idle = Gauge(
     "db_connections_idle",
     "Number of idle database connections",
+    registry=APP_REGISTRY,
 )
 
 db_query_duration_seconds = Histogram(
@@ -87,6 +105,7 @@ db_query_duration_seconds = Histogram(
     "Database query duration in seconds",
     ["operation"],
     buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.0),
+    registry=APP_REGISTRY,
 )
 
 # Redis Metrics
@@ -94,62 +113,73 @@ redis_commands_total = Counter(
     "redis_commands_total",
     "Total Redis commands executed",
     ["command"],
+    registry=APP_REGISTRY,
 )
 
 redis_cache_hits_total = Counter(
     "redis_cache_hits_total",
     "Total cache hits",
+    registry=APP_REGISTRY,
 )
 
 redis_cache_misses_total = Counter(
     "redis_cache_misses_total",
     "Total cache misses",
+    registry=APP_REGISTRY,
 )
 
 # User Metrics
 active_users_total = Gauge(
     "active_users_total",
     "Number of active users",
+    registry=APP_REGISTRY,
 )
 
 total_users = Gauge(
     "total_users",
     "Total number of registered users",
+    registry=APP_REGISTRY,
 )
 
 # Agent Metrics
 total_agents = Gauge(
     "total_agents",
     "Total number of agents",
+    registry=APP_REGISTRY,
 )
 
 active_agents = Gauge(
     "active_agents",
     "Number of active agents",
+    registry=APP_REGISTRY,
 )
 
 # Template Metrics
 total_templates = Gauge(
     "total_templates",
     "Total number of agent templates",
+    registry=APP_REGISTRY,
 )
 
 template_usage_total = Counter(
     "template_usage_total",
     "Template usage count",
     ["template_id"],
+    registry=APP_REGISTRY,
 )
 
 # API Token Metrics
 api_tokens_total = Counter(
     "api_tokens_total",
     "Total API tokens created",
+    registry=APP_REGISTRY,
 )
 
 api_token_usage_total = Counter(
     "api_token_usage_total",
     "API token usage count",
     ["token_id"],
+    registry=APP_REGISTRY,
 )
 
 # Error Metrics
@@ -157,17 +187,157 @@ errors_total = Counter(
     "errors_total",
     "Total errors",
     ["error_type", "component"],
+    registry=APP_REGISTRY,
 )
 
 
+# Connection pool usage, read from the engines at scrape time
+class DatabasePoolCollector:
+    """
+    Export SQLAlchemy pool usage for the main, streaming, read and health
+    engines.
+
+    Values are read when Prometheus scrapes, so they are never stale and
+    no caller has to push them. Pools without usage counters (SQLite)
+    are skipped.
+    """
+
+    def collect(self):
+        family = GaugeMetricFamily(
+            "db_pool_connections",
+            "Database pool connections by pool and state",
+            labels=["pool", "state"],
+        )
+        engines = {"main": engine}
+        if stream_engine is not engine:
+            engines["stream"] = stream_engine
+        if read_engine is not engine:
+            engines["read"] = read_engine
+        if health_engine is not engine:
+            engines["health"] = health_engine
+
+        for name, pool_engine in engines.items():
+            pool = pool_engine.pool
+            if not hasattr(pool, "checkedout"):
+                continue
+            family.add_metric([name, "checked_out"], pool.checkedout())
+            family.add_metric([name, "idle"], pool.checkedin())
+            family.add_metric([name, "overflow"], max(pool.overflow(), 0))
+            family.add_metric([name, "size"], pool.size())
+
+        yield family
+
+
+APP_REGISTRY.register(DatabasePoolCollector())
+
+# Legacy main-pool gauges, also read at scrape time (engine.pool is looked
+# up on each read because dispose() replaces it)
+if hasattr(engine.pool, "checkedout"):
+    db_connections_active.set_function(lambda: engine.pool.checkedout())
+    db_connections_idle.set_function(lambda: engine.pool.checkedin())
+
+# User-derived label values are capped to keep series counts bounded
+_agent_id_label = BoundedLabel("agent_id")
+_tool_name_label = BoundedLabel("tool_name")
+_template_id_label = BoundedLabel("template_id")
+
+
+# ============================================================================
+# Entity Count Gauges
+# ============================================================================
+
+_app_stats_lock = asyncio.Lock()
+_app_stats_refreshed_at: float = 0.0
+
+
+async def refresh_app_stats(db: AsyncSession) -> None:
+    """
+    Refresh user/agent/template count gauges with a single query.
+
+    All counts are fetched as scalar subqueries of one SELECT. Results are
+    reused for METRICS_APP_STATS_TTL_SECONDS, and concurrent scrapes wait on
+    a lock instead of issuing duplicate queries.
+
+    Args:
+        db: Database session
+    """
+    global _app_stats_refreshed_at
+
+    async with _app_stats_lock:
+        now = time.monotonic()
+        if now - _app_stats_refreshed_at < METRICS_APP_STATS_TTL_SECONDS:
+            return
+
+        stmt = select(
+            select(func.count(User.id)).scalar_subquery(),
+            select(func.count(User.id)).where(User.is_active.is_(True)).scalar_subquery(),
+            select(func.count(Agent.id)).scalar_subquery(),
+            select(func.count(Agent.id)).where(Agent.is_active.is_(True)).scalar_subquery(),
+            select(func.count(Template.id)).scalar_subquery(),
+        )
+        (
+            users_total,
+            users_active,
+            agents_total,
+            agents_active,
+            templates_total,
+        ) = (await db.execute(stmt)).one()
+
+        update_user_metrics(active=users_active, total=users_total)
+        update_agent_metrics(active=agents_active, total=agents_total)
+        update_template_metrics(total=templates_total)
+        _app_stats_refreshed_at = now
+
+
 # ============================================================================
 # Metrics Endpoint
 # ============================================================================
 
 
+# Last rendered exposition: (rendered_at, plain payload, gzip payload or None)
+_rendered_metrics: Optional[Tuple[float, bytes, Optional[bytes]]] = None
+
+
+def render_metrics(compress: bool) -> bytes:
+    """
+    Render the app registry, reusing a recent rendering.
+
+    generate_latest() walks every series, and counters move on every
+    request, so there is no cheap "unchanged" check; instead a rendering
+    (and its gzip form, built on first use) is shared by scrapes arriving
+    within METRICS_RENDER_TTL_SECONDS.
+
+    Args:
+        compress: Return the gzip-compressed payload
+
+    Returns:
+        Prometheus exposition payload
+    """
+    global _rendered_metrics
+
+    now = time.monotonic()
+    if (
+        _rendered_metrics is None
+        or now - _rendered_metrics[0] >= METRICS_RENDER_TTL_SECONDS
+    ):
+        _rendered_metrics = (now, generate_latest(APP_REGISTRY), None)
+
+    rendered_at, plain, gzipped = _rendered_metrics
+    if not compress:
+        return plain
+
+    if gzipped is None:
+        # Exposition text compresses very well; level 1 keeps CPU cost low
+        gzipped = gzip.compress(plain, compresslevel=1)
+        _rendered_metrics = (rendered_at, plain, gzipped)
+    return gzipped
+
+
 @router.get("", include_in_schema=False)
 async def metrics(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
 ) -> Response:
     """
     Prometheus metrics endpoint.
@@ -176,9 +346,14 @@ async def metrics(
 
     Returns metrics in Prometheus text format for scraping.
     This endpoint should be called by Prometheus at regular intervals.
+    The payload is gzip-compressed when the scraper accepts it
+    (Prometheus does by default); back-to-back scrapes share one
+    rendering (see render_metrics()).
 
     Args:
+        request: Incoming request (for Accept-Encoding)
         current_user: Current authenticated user
+        db: Database session (for entity count gauges)
 
     Returns:
         Response with Prometheus metrics in text format
@@ -187,12 +362,23 @@ async def metrics(
         HTTPException: 401 if not authenticated
     """
     try:
-        # Generate metrics in Prometheus format
-        metrics_data = generate_latest(REGISTRY)
+        await refresh_app_stats(db)
+    except Exception as e:
+        # Stale entity counts shouldn't fail the whole scrape
+        logger.warning(f"Error refreshing entity count metrics: {e}")
+
+    try:
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(
+                content=render_metrics(compress=True),
+                media_type=CONTENT_TYPE_LATEST,
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+            )
 
         return Response(
-            content=metrics_data,
+            content=render_metrics(compress=False),
             media_type=CONTENT_TYPE_LATEST,
+            headers={"Vary": "Accept-Encoding"},
         )
     except Exception as e:
         logger.error(f"Error generating metrics: {e}")
@@ -219,14 +405,12 @@ def record_http_request(
 
     Args:
         method: HTTP method (GET, POST, etc.)
-        endpoint: API endpoint path
+        endpoint: Route path template (e.g. /api/v1/agents/{agent_id})
         status: HTTP status code
         duration: Request duration in seconds
     """
-    http_requests_total.labels(method=method, endpoint=endpoint, status=status).inc()
-    http_request_duration_seconds.labels(method=method, endpoint=endpoint).observe(
-        duration
-    )
+    labeled(http_requests_total, method, endpoint, status).inc()
+    labeled(http_request_duration_seconds, method, endpoint).observe(duration)
 
 
 def record_agent_execution(
@@ -244,13 +428,12 @@ def record_agent_execution(
         duration: Execution duration in seconds
         error_type: Type of error if failed (optional)
     """
-    agent_executions_total.labels(agent_id=agent_id, status=status).inc()
-    agent_execution_duration_seconds.labels(agent_id=agent_id).observe(duration)
+    agent_id = _agent_id_label(agent_id)
+    labeled(agent_executions_total, agent_id, status).inc()
+    labeled(agent_execution_duration_seconds, agent_id).observe(duration)
 
     if error_type:
-        agent_execution_errors_total.labels(
-            agent_id=agent_id, error_type=error_type
-        ).inc()
+        labeled(agent_execution_errors_total, agent_id, error_type).inc()
 
 
 def record_tool_execution(tool_name: str, agent_id: str) -> None:
@@ -261,7 +444,9 @@ def record_tool_execution(tool_name: str, agent_id: str) -> None:
         tool_name: Name of the tool executed
         agent_id: Agent that executed the tool
     """
-    agent_tool_executions_total.labels(tool_name=tool_name, agent_id=agent_id).inc()
+    labeled(
+        agent_tool_executions_total, _tool_name_label(tool_name), _agent_id_label(agent_id)
+    ).inc()
 
 
 def record_db_query(operation: str, duration: float) -> None:
@@ -272,19 +457,7 @@ def record_db_query(operation: str, duration: float) -> None:
         operation: Database operation type (select, insert, update, delete)
         duration: Query duration in seconds
     """
-    db_query_duration_seconds.labels(operation=operation).observe(duration)
-
-
-def update_db_connections(active: int, idle: int) -> None:
-    """
-    Update database connection metrics.
-
-    Args:
-        active: Number of active connections
-        idle: Number of idle connections
-    """
-    db_connections_active.set(active)
-    db_connections_idle.set(idle)
+    labeled(db_query_duration_seconds, operation).observe(duration)
 
 
 def record_redis_command(command: str) -> None:
@@ -294,7 +467,7 @@ def record_redis_command(command: str) -> None:
     Args:
         command: Redis command name
     """
-    redis_commands_total.labels(command=command).inc()
+    labeled(redis_commands_total, command).inc()
 
 
 def record_cache_access(hit: bool) -> None:
@@ -351,7 +524,7 @@ def record_template_usage(template_id: str) -> None:
     Args:
         template_id: Template identifier
     """
-    template_usage_total.labels(template_id=template_id).inc()
+    labeled(template_usage_total, _template_id_label(template_id)).inc()
 
 
 def record_error(error_type: str, component: str) -> None:
@@ -362,4 +535,4 @@ def record_error(error_type: str, component: str) -> None:
         error_type: Type/category of error
         component: Component where error occurred
     """
-    errors_total.labels(error_type=error_type, component=component).inc()
+    labeled(errors_total, error_type, component).inc()
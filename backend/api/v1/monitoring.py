@@ -1,10 +1,13 @@
 """API endpoints for monitoring and analytics."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional, Sequence
 
-from core.database import get_db
+from core.cache import cache_get, cache_set
+from core.constants import CACHE_RECENT_ACTIVITY_TTL
+from core.database import get_db_ro
 from core.dependencies import get_current_active_user
 from models.user import User
 from services.monitoring_service import monitoring_service
@@ -19,11 +22,33 @@ from schemas.execution import ExecutionResponse
 
 router = APIRouter(prefix="/monitoring", tags=["monitoring"])
 
+_execution_list_adapter = TypeAdapter(List[ExecutionResponse])
+
+
+async def _cached_execution_list(
+    key: str, producer: Callable[[], Awaitable[Sequence]]
+) -> Response:
+    """
+    Serve an execution list from Redis, producing and caching it on a miss.
+
+    Recent-activity lists are polled by every open dashboard, so they are
+    cached as serialized JSON for CACHE_RECENT_ACTIVITY_TTL seconds.
+    """
+    body = await cache_get(key)
+    if body is None:
+        executions = await producer()
+        body = _execution_list_adapter.dump_json(
+            _execution_list_adapter.validate_python(executions, from_attributes=True)
+        )
+        await cache_set(key, body, CACHE_RECENT_ACTIVITY_TTL)
+
+    return Response(content=body, media_type="application/json")
+
 
 @router.get("/dashboard", response_model=DashboardOverview)
 async def get_dashboard(
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Get dashboard overview metrics.
@@ -56,7 +81,7 @@ async def get_dashboard(
 async def get_agent_health(
     agent_id: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Get agent health metrics.
@@ -95,7 +120,7 @@ async def get_agent_health(
 async def get_execution_stats(
     days: int = Query(7, ge=1, le=365, description="Number of days to include in stats"),
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Get execution statistics for the last N days.
@@ -127,7 +152,7 @@ async def get_execution_stats(
 async def get_token_usage(
     days: int = Query(30, ge=1, le=365, description="Number of days to include in summary"),
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Get token usage summary for the last N days.
@@ -156,7 +181,7 @@ async def get_token_usage(
 async def get_recent_executions(
     limit: int = Query(10, ge=1, le=100, description="Maximum number of executions to return"),
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Get most recent executions.
@@ -182,15 +207,17 @@ async def get_recent_executions(
     ]
     ```
     """
-    executions = await monitoring_service.get_recent_executions(db, limit)
-    return executions
+    return await _cached_execution_list(
+        f"cache:monitoring:recent_executions:{limit}",
+        lambda: monitoring_service.get_recent_executions(db, limit),
+    )
 
 
 @router.get("/executions/errors", response_model=List[ExecutionResponse])
 async def get_recent_errors(
     limit: int = Query(10, ge=1, le=100, description="Maximum number of errors to return"),
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """
     Get most recent failed executions.
@@ -216,5 +243,7 @@ async def get_recent_errors(
     ]
     ```
     """
-    errors = await monitoring_service.get_recent_errors(db, limit)
-    return errors
+    return await _cached_execution_list(
+        f"cache:monitoring:recent_errors:{limit}",
+        lambda: monitoring_service.get_recent_errors(db, limit),
+    )
@@ -16,13 +16,21 @@ Provides RESTful API endpoints for managing templates:
 - GET /templates/{template_id}/export - Export template as JSON
 """
 
-from typing import Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.cache import cache_get, cache_set
+from core.constants import CACHE_TEMPLATE_CATEGORIES_TTL, CACHE_TEMPLATE_LISTS_TTL
+from core.database import get_db, get_db_ro
 from core.dependencies import get_current_active_user
+from core.pagination import decode_cursor, encode_cursor
 from models.user import User
 from schemas.agent import AgentResponse
 from schemas.template import (
@@ -36,18 +44,156 @@ from schemas.template import (
     TemplateUpdate,
 )
 from services.template_service import (
+    TEMPLATE_LIST_MAX_LIMIT,
     DuplicateTemplateNameError,
     TemplateNotFoundError,
+    TemplatePermissionError,
     TemplateService,
     TemplateValidationError,
+    template_cache_key,
 )
 
-# Create router with prefix and tags
+# Create router with prefix and tags.
+# Routes are matched in declaration order: static paths (/categories,
+# /featured, /popular, /import) are declared before /{template_id} routes.
 router = APIRouter(prefix="/templates", tags=["templates"])
 
 # Initialize service
 template_service = TemplateService()
 
+# Categories, featured and popular lists are public and change rarely: they
+# are cached in Redis as serialized JSON and served with an ETag so clients
+# can revalidate with If-None-Match. Single templates carry Last-Modified
+# and are revalidated with If-Modified-Since.
+TEMPLATE_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=60"
+
+_template_list_adapter = TypeAdapter(list[TemplateResponse])
+
+
+async def _cached_payload(
+    key: str,
+    ttl: int,
+    producer: Callable[[], Awaitable[bytes]],
+) -> bytes:
+    """
+    Get a serialized JSON body from Redis, producing and caching it on a miss.
+
+    Args:
+        key: Cache key
+        ttl: Time-to-live in seconds
+        producer: Coroutine returning the serialized JSON body (bytes)
+
+    Returns:
+        Serialized JSON body
+    """
+    payload = await cache_get(key)
+    if payload is None:
+        payload = await producer()
+        await cache_set(key, payload, ttl)
+    return payload
+
+
+def _json_response(request: Request, payload: bytes) -> Response:
+    """
+    Wrap a JSON body in a cacheable response with an ETag.
+
+    Args:
+        request: Incoming request (for conditional headers)
+        payload: Serialized JSON body
+
+    Returns:
+        200 response with the body, or 304 if the client's ETag matches
+    """
+    etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    headers = {"Cache-Control": TEMPLATE_CACHE_CONTROL, "ETag": etag}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+async def _cached_json(
+    request: Request,
+    key: str,
+    ttl: int,
+    producer: Callable[[], Awaitable[bytes]],
+) -> Response:
+    """
+    Serve a JSON body from Redis, producing and caching it on a miss.
+
+    Args:
+        request: Incoming request (for conditional headers)
+        key: Cache key
+        ttl: Time-to-live in seconds
+        producer: Coroutine returning the serialized JSON body (bytes)
+
+    Returns:
+        200 response with the body, or 304 if the client's ETag matches
+    """
+    return _json_response(request, await _cached_payload(key, ttl, producer))
+
+
+async def _cached_template_list(
+    request: Request,
+    name: str,
+    limit: int,
+    fetch: Callable[[int], Awaitable[list]],
+) -> Response:
+    """
+    Serve the first ``limit`` templates of a cached featured/popular list.
+
+    The list is fetched and cached once at TEMPLATE_LIST_MAX_LIMIT entries,
+    so every ``limit`` shares one cache key and a write invalidates a
+    single key per list.
+
+    Args:
+        request: Incoming request (for conditional headers)
+        name: List name ("featured" or "popular")
+        limit: Number of templates to return
+        fetch: Coroutine returning up to the given number of templates
+
+    Returns:
+        200 response with the templates, or 304 if the client's ETag matches
+    """
+    async def produce() -> bytes:
+        templates = await fetch(TEMPLATE_LIST_MAX_LIMIT)
+        return _template_list_adapter.dump_json(
+            _template_list_adapter.validate_python(templates, from_attributes=True)
+        )
+
+    payload = await _cached_payload(
+        template_cache_key(name), CACHE_TEMPLATE_LISTS_TTL, produce
+    )
+    templates = orjson.loads(payload)
+    if len(templates) > limit:
+        payload = orjson.dumps(templates[:limit])
+    return _json_response(request, payload)
+
+
+def _not_modified_since(request: Request, last_modified: datetime) -> bool:
+    """
+    Check a conditional request's If-Modified-Since against a timestamp.
+
+    Args:
+        request: Incoming request
+        last_modified: When the resource last changed (naive values are UTC)
+
+    Returns:
+        True if the client's copy is still current
+    """
+    header = request.headers.get("if-modified-since")
+    if not header:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole-second precision
+    return last_modified.replace(microsecond=0) <= since
+
 
 # ============================================================================
 # POST /templates/ - Create Template
@@ -96,11 +242,6 @@ async def create_template(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create template: {str(e)}",
-        )
 
 
 # ============================================================================
@@ -114,52 +255,62 @@ async def list_templates(
     is_public: Optional[bool] = Query(None, description="Filter by public/private"),
     is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
     search: Optional[str] = Query(None, description="Search in name, description, tags"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (deprecated, use cursor)"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ):
     """
     List templates with filtering, search, and pagination.
 
-    Public endpoint (no authentication required).
+    Public endpoint (no authentication required). Templates are returned
+    newest first; pass the ``next_cursor`` of the previous response as
+    ``cursor`` to fetch the next page in constant time.
 
     Query Parameters:
         - category: Filter by category (research, coding, etc.)
         - is_public: Filter by public (true) or private (false)
         - is_featured: Filter by featured status
         - search: Full-text search in name, description, and tags
-        - skip: Pagination offset (default: 0)
+        - cursor: Opaque cursor from a previous response
+        - skip: Pagination offset (default: 0, ignored when cursor is set)
         - limit: Page size (default: 20, max: 100)
 
     Returns:
         Paginated list of templates with metadata
-    """
-    try:
-        templates, total = await template_service.list_templates(
-            db=db,
-            category=category,
-            is_public=is_public,
-            is_featured=is_featured,
-            search=search,
-            skip=skip,
-            limit=limit,
-        )
-
-        page = (skip // limit) + 1 if limit > 0 else 1
-        has_next = (skip + limit) < total
 
-        return TemplateListResponse(
-            templates=templates,
-            total=total,
-            page=page,
-            page_size=limit,
-            has_next=has_next,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list templates: {str(e)}",
-        )
+    Raises:
+        400: Invalid cursor
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    # One extra row tells whether another page exists
+    templates, total = await template_service.list_templates(
+        db=db,
+        category=category,
+        is_public=is_public,
+        is_featured=is_featured,
+        search=search,
+        skip=skip,
+        limit=limit + 1,
+        after=after,
+    )
+
+    has_next = len(templates) > limit
+    templates = templates[:limit]
+    next_cursor = (
+        encode_cursor(templates[-1].created_at, templates[-1].id) if has_next else None
+    )
+    page = 1 if after else (skip // limit) + 1
+
+    return TemplateListResponse(
+        templates=templates,
+        total=total,
+        page=page,
+        page_size=limit,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
 
 
 # ============================================================================
@@ -169,27 +320,31 @@ async def list_templates(
 
 @router.get("/categories", response_model=TemplateCategoryResponse)
 async def get_categories(
-    db: AsyncSession = Depends(get_db),
-):
+    request: Request,
+    db: AsyncSession = Depends(get_db_ro),
+) -> Response:
     """
     Get list of template categories.
 
-    Public endpoint (no authentication required).
+    Public endpoint (no authentication required). Served from cache with
+    an ETag; a matching ``If-None-Match`` gets ``304 Not Modified``.
 
     Returns:
         List of distinct categories
     """
-    try:
+    async def produce() -> bytes:
         categories = await template_service.get_categories(db=db)
         return TemplateCategoryResponse(
             categories=categories,
             total=len(categories),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get categories: {str(e)}",
-        )
+        ).model_dump_json().encode()
+
+    return await _cached_json(
+        request,
+        template_cache_key("categories"),
+        CACHE_TEMPLATE_CATEGORIES_TTL,
+        produce,
+    )
 
 
 # ============================================================================
@@ -199,13 +354,17 @@ async def get_categories(
 
 @router.get("/featured", response_model=list[TemplateResponse])
 async def get_featured_templates(
-    limit: int = Query(10, ge=1, le=50, description="Maximum number of templates"),
-    db: AsyncSession = Depends(get_db),
-):
+    request: Request,
+    limit: int = Query(
+        10, ge=1, le=TEMPLATE_LIST_MAX_LIMIT, description="Maximum number of templates"
+    ),
+    db: AsyncSession = Depends(get_db_ro),
+) -> Response:
     """
     Get featured templates.
 
-    Public endpoint (no authentication required).
+    Public endpoint (no authentication required). Served from cache with
+    an ETag; a matching ``If-None-Match`` gets ``304 Not Modified``.
 
     Args:
         limit: Maximum number of templates to return (default: 10, max: 50)
@@ -213,17 +372,10 @@ async def get_featured_templates(
     Returns:
         List of featured templates
     """
-    try:
-        templates = await template_service.get_featured_templates(
-            db=db,
-            limit=limit,
-        )
-        return templates
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get featured templates: {str(e)}",
-        )
+    async def fetch(count: int) -> list:
+        return await template_service.get_featured_templates(db=db, limit=count)
+
+    return await _cached_template_list(request, "featured", limit, fetch)
 
 
 # ============================================================================
@@ -233,13 +385,17 @@ async def get_featured_templates(
 
 @router.get("/popular", response_model=list[TemplateResponse])
 async def get_popular_templates(
-    limit: int = Query(10, ge=1, le=50, description="Maximum number of templates"),
-    db: AsyncSession = Depends(get_db),
-):
+    request: Request,
+    limit: int = Query(
+        10, ge=1, le=TEMPLATE_LIST_MAX_LIMIT, description="Maximum number of templates"
+    ),
+    db: AsyncSession = Depends(get_db_ro),
+) -> Response:
     """
     Get popular templates by use count.
 
-    Public endpoint (no authentication required).
+    Public endpoint (no authentication required). Served from cache with
+    an ETag; a matching ``If-None-Match`` gets ``304 Not Modified``.
 
     Args:
         limit: Maximum number of templates to return (default: 10, max: 50)
@@ -247,30 +403,85 @@ async def get_popular_templates(
     Returns:
         List of popular templates
     """
+    async def fetch(count: int) -> list:
+        return await template_service.get_popular_templates(db=db, limit=count)
+
+    return await _cached_template_list(request, "popular", limit, fetch)
+
+
+# ============================================================================
+# POST /templates/import - Import Template
+# ============================================================================
+
+
+@router.post("/import", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
+async def import_template(
+    template_data: TemplateImport,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Import a template from JSON.
+
+    Requires authentication.
+
+    Args:
+        template_data: Template import data
+        current_user: Current authenticated user
+        db: Database session (injected)
+
+    Returns:
+        Created template
+
+    Raises:
+        400: Validation error
+        401: Unauthorized
+        409: Conflict (duplicate name)
+        500: Internal server error
+    """
     try:
-        templates = await template_service.get_popular_templates(
+        template = await template_service.import_template(
             db=db,
-            limit=limit,
+            template_data=template_data,
+            created_by_id=current_user.id,
         )
-        return templates
-    except Exception as e:
+        return template
+
+    except DuplicateTemplateNameError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get popular templates: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
         )
+    except TemplateValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+# ============================================================================
+# GET /templates/{template_id} - Get Template
+# ============================================================================
+
 
 @router.get("/{template_id}", response_model=TemplateResponse)
 async def get_template(
     template_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_ro),
 ):
     """
     Get a template by ID.
 
-    Public endpoint (no authentication required).
+    Public endpoint (no authentication required). Responses carry
+    ``Last-Modified``; a request whose ``If-Modified-Since`` is not older
+    gets ``304 Not Modified`` without the body being serialized.
 
     Args:
         template_id: Template ID
+        request: Incoming request (for conditional headers)
+        response: Outgoing response (for caching headers)
         db: Database session (injected)
 
     Returns:
@@ -282,17 +493,27 @@ async def get_template(
     """
     try:
         template = await template_service.get_template(db=db, template_id=template_id)
-        return template
     except TemplateNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get template: {str(e)}",
-        )
+
+    # updated_at is also bumped by use count increments
+    last_modified = template.updated_at or template.created_at
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    last_modified = last_modified.astimezone(timezone.utc)
+    headers = {
+        "Cache-Control": TEMPLATE_CACHE_CONTROL,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+    }
+
+    if _not_modified_since(request, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return template
 
 
 # ============================================================================
@@ -330,22 +551,13 @@ async def update_template(
         500: Internal server error
     """
     try:
-        # Get existing template to check ownership
-        existing_template = await template_service.get_template(db, template_id)
-
-        # Check if user is the creator (simple ownership check)
+        # Ownership is checked in the UPDATE itself (simple creator check)
         # TODO: Add admin role check when RBAC is implemented
-        if existing_template.created_by_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to update this template",
-            )
-
-        # Update template
         template = await template_service.update_template(
             db=db,
             template_id=template_id,
             template_update=template_update,
+            user_id=current_user.id,
         )
         return template
 
@@ -354,6 +566,11 @@ async def update_template(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
+    except TemplatePermissionError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this template",
+        )
     except DuplicateTemplateNameError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -364,13 +581,6 @@ async def update_template(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except HTTPException:
-        raise  # Re-raise HTTP exceptions
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update template: {str(e)}",
-        )
 
 
 # ============================================================================
@@ -403,21 +613,12 @@ async def delete_template(
         500: Internal server error
     """
     try:
-        # Get existing template to check ownership
-        existing_template = await template_service.get_template(db, template_id)
-
-        # Check if user is the creator
-        if existing_template.created_by_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to delete this template",
-            )
-
-        # Delete template
+        # Ownership is checked in the DELETE/UPDATE itself
         await template_service.delete_template(
             db=db,
             template_id=template_id,
             hard_delete=hard_delete,
+            user_id=current_user.id,
         )
 
     except TemplateNotFoundError as e:
@@ -425,12 +626,10 @@ async def delete_template(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
-    except HTTPException:
-        raise  # Re-raise HTTP exceptions
-    except Exception as e:
+    except TemplatePermissionError:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete template: {str(e)}",
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this template",
         )
 
 
@@ -473,11 +672,6 @@ async def increment_use_count(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to increment use count: {str(e)}",
-        )
 
 
 # ============================================================================
@@ -542,68 +736,6 @@ async def create_agent_from_template(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except HTTPException:
-        raise  # Re-raise HTTP exceptions
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create agent from template: {str(e)}",
-        )
-
-
-# ============================================================================
-# POST /templates/import - Import Template
-# ============================================================================
-
-
-@router.post("/import", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
-async def import_template(
-    template_data: TemplateImport,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
-):
-    """
-    Import a template from JSON.
-
-    Requires authentication.
-
-    Args:
-        template_data: Template import data
-        current_user: Current authenticated user
-        db: Database session (injected)
-
-    Returns:
-        Created template
-
-    Raises:
-        400: Validation error
-        401: Unauthorized
-        409: Conflict (duplicate name)
-        500: Internal server error
-    """
-    try:
-        template = await template_service.import_template(
-            db=db,
-            template_data=template_data,
-            created_by_id=current_user.id,
-        )
-        return template
-
-    except DuplicateTemplateNameError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e),
-        )
-    except TemplateValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to import template: {str(e)}",
-        )
 
 
 # ============================================================================
@@ -644,8 +776,3 @@ async def export_template(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to export template: {str(e)}",
-        )
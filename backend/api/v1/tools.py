@@ -8,10 +8,11 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from loguru import logger
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
-from core.dependencies import get_current_active_user
+from core.database import get_db, get_db_read
+from core.dependencies import get_current_active_user, get_current_active_user_read
 from models.user import User
 from schemas.tool import (
     ToolCategoryResponse,
@@ -24,6 +25,9 @@ from services.tool_service import tool_service
 
 router = APIRouter(prefix="/tools", tags=["tools"])
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_tool_list_adapter = TypeAdapter(list[ToolResponse])
+
 
 # ============================================================================
 # Helper Functions - Authorization
@@ -100,16 +104,10 @@ async def create_tool(
     """
     try:
         tool = await tool_service.create_tool(db, tool_data, current_user.id)
-        return ToolResponse.model_validate(tool)
     except ValueError as e:
         logger.warning(f"Tool creation failed: {e}")
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error creating tool: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    return ToolResponse.model_validate(tool)
 
 
 @router.get("/", response_model=ToolListResponse)
@@ -119,8 +117,8 @@ async def list_tools(
     tool_type: Optional[str] = Query(None, description="Filter by tool type"),
     search: Optional[str] = Query(None, description="Search in name and description"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ) -> ToolListResponse:
     """
     List tools with optional filtering and pagination.
@@ -136,48 +134,33 @@ async def list_tools(
     Returns:
         Paginated list of tools with metadata
     """
-    try:
-        # Get tools
-        tools = await tool_service.list_tools(
-            db=db,
-            skip=skip,
-            limit=limit,
-            tool_type=tool_type,
-            search=search,
-            is_active=is_active,
-        )
-
-        # Get total count
-        total = await tool_service.count_tools(
-            db=db,
-            tool_type=tool_type,
-            search=search,
-            is_active=is_active,
-        )
-
-        # Calculate pagination metadata
-        page = skip // limit + 1 if limit > 0 else 1
-        has_next = (skip + limit) < total
-
-        return ToolListResponse(
-            tools=[ToolResponse.model_validate(t) for t in tools],
-            total=total,
-            page=page,
-            page_size=limit,
-            has_next=has_next,
-        )
-    except Exception as e:
-        logger.error(f"Error listing tools: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    # Get the page and the total count in one query
+    tools, total = await tool_service.list_tools_with_total(
+        db=db,
+        skip=skip,
+        limit=limit,
+        tool_type=tool_type,
+        search=search,
+        is_active=is_active,
+    )
+
+    # Calculate pagination metadata
+    page = skip // limit + 1 if limit > 0 else 1
+    has_next = (skip + limit) < total
+
+    return ToolListResponse(
+        tools=_tool_list_adapter.validate_python(tools, from_attributes=True),
+        total=total,
+        page=page,
+        page_size=limit,
+        has_next=has_next,
+    )
 
 
 @router.get("/categories", response_model=ToolCategoryResponse)
 async def get_tool_categories(
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ) -> ToolCategoryResponse:
     """
     Get list of tool categories/types.
@@ -188,22 +171,15 @@ async def get_tool_categories(
     Returns:
         List of unique tool categories
     """
-    try:
-        categories = await tool_service.get_tool_categories(db)
-        return ToolCategoryResponse(categories=categories)
-    except Exception as e:
-        logger.error(f"Error getting tool categories: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    categories = await tool_service.get_tool_categories(db)
+    return ToolCategoryResponse(categories=categories)
 
 
 @router.get("/{tool_id}", response_model=ToolResponse)
 async def get_tool(
     tool_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user_read),
+    db: AsyncSession = Depends(get_db_read),
 ) -> ToolResponse:
     """
     Get tool by ID.
@@ -218,22 +194,13 @@ async def get_tool(
     Raises:
         HTTPException 404: Tool not found
     """
-    try:
-        tool = await tool_service.get_tool(db, tool_id)
-        if not tool:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Tool {tool_id} not found",
-            )
-        return ToolResponse.model_validate(tool)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting tool {tool_id}: {e}", exc_info=True)
+    tool = await tool_service.get_tool(db, tool_id)
+    if not tool:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tool {tool_id} not found",
         )
+    return ToolResponse.model_validate(tool)
 
 
 @router.put("/{tool_id}", response_model=ToolResponse)
@@ -263,23 +230,15 @@ async def update_tool(
         HTTPException 404: Tool not found
         HTTPException 500: Internal server error
     """
-    try:
-        # Verify ownership before updating
-        await get_tool_or_403(tool_id, current_user.id, db)
+    # Verify ownership before updating
+    await get_tool_or_403(tool_id, current_user.id, db)
 
+    try:
         tool = await tool_service.update_tool(db, tool_id, tool_update)
-        return ToolResponse.model_validate(tool)
-    except HTTPException:
-        raise
     except ValueError as e:
         logger.warning(f"Tool update failed: {e}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error updating tool {tool_id}: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    return ToolResponse.model_validate(tool)
 
 
 @router.delete("/{tool_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -305,21 +264,12 @@ async def delete_tool(
         HTTPException 403: User doesn't own this tool
         HTTPException 404: Tool not found
     """
-    try:
-        # Verify ownership before deleting
-        await get_tool_or_403(tool_id, current_user.id, db)
-
-        success = await tool_service.delete_tool(db, tool_id, hard_delete)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Tool {tool_id} not found",
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting tool {tool_id}: {e}", exc_info=True)
+    # Verify ownership before deleting
+    await get_tool_or_403(tool_id, current_user.id, db)
+
+    success = await tool_service.delete_tool(db, tool_id, hard_delete)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tool {tool_id} not found",
         )
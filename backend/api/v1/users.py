@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_db
 from core.dependencies import get_current_active_user
-from core.security import verify_password
+from core.security import verify_password_async
 from models.user import User
 from schemas.auth import (
     UserResponse,
@@ -96,7 +96,9 @@ async def change_password(
         HTTPException: 400 if current password is incorrect or passwords don't match
     """
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password_async(
+        password_data.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
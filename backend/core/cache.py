@@ -3,23 +3,41 @@ Redis caching utilities for performance optimization.
 
 Provides decorators and utilities for caching expensive operations
 like analytics aggregations, reducing database load and improving response times.
+
+The shared client works in bytes (no decode_responses): cached results are
+stored as MessagePack (zstd-compressed when large) and cached response
+bodies as ready-to-send JSON bytes.
 """
 
+import asyncio
 import hashlib
-import json
-from datetime import datetime, date
+import inspect
+import time
+from collections import OrderedDict
 from decimal import Decimal
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Hashable, Optional, Union
 
+import orjson
+import ormsgpack
 import redis.asyncio as redis
+import zstandard
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
-from core.constants import CACHE_DEFAULT_TTL
-
-
-# Global Redis client (initialized lazily)
+from core.constants import (
+    CACHE_COMPRESS_MIN_BYTES,
+    CACHE_DEFAULT_TTL,
+    CACHE_MAX_VALUE_BYTES,
+    CACHE_SCAN_BATCH_SIZE,
+    LOCAL_CACHE_MAX_SIZE,
+    LOCAL_CACHE_RESULT_TTL,
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+)
+
+
+# Global Redis client (created at application startup, or lazily on first use)
 _redis_client: Optional[redis.Redis] = None
 
 
@@ -35,16 +53,38 @@ async def get_redis_client() -> redis.Redis:
     if _redis_client is None:
         _redis_client = redis.from_url(
             str(settings.REDIS_URL),
-            encoding="utf-8",
-            decode_responses=True
+            socket_keepalive=True,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
         )
 
     return _redis_client
 
 
+async def close_redis_client() -> None:
+    """Close the shared Redis client (called on application shutdown)."""
+    global _redis_client
+
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+# Dict keys need not be strings (MessagePack keeps int keys as ints)
+_PACK_OPTIONS = ormsgpack.OPT_NON_STR_KEYS
+
+# Large cached results are stored zstd-compressed (frames carry this magic)
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+_KEY_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+
 def _serialize_value(obj: Any) -> Any:
     """
-    Serialize complex types for JSON encoding.
+    Serialize types orjson/ormsgpack don't handle natively.
+
+    Datetimes, dates, enums and dataclasses are encoded by the libraries
+    themselves (datetimes as ISO 8601 strings).
 
     Args:
         obj: Object to serialize
@@ -52,9 +92,7 @@ def _serialize_value(obj: Any) -> Any:
     Returns:
         JSON-serializable representation
     """
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    elif isinstance(obj, Decimal):
+    if isinstance(obj, Decimal):
         return float(obj)
     elif isinstance(obj, bytes):
         return obj.decode('utf-8')
@@ -63,10 +101,60 @@ def _serialize_value(obj: Any) -> Any:
     return obj
 
 
+# Arguments spelled out in cache keys instead of hashed (see _make_cache_key)
+_KEY_SCALAR_TYPES = (int, bool, str, type(None))
+_KEY_MAX_SCALAR_ARGS = 3
+_KEY_MAX_SCALAR_LENGTH = 64
+
+
+def _is_key_scalar(value: Any) -> bool:
+    """Check whether an argument can be written into a cache key as-is."""
+    if type(value) not in _KEY_SCALAR_TYPES:
+        return False
+    return not isinstance(value, str) or len(value) <= _KEY_MAX_SCALAR_LENGTH
+
+
+def _pack_result(result: Any) -> bytes:
+    """
+    Encode a cached result as MessagePack, zstd-compressing large payloads.
+
+    Args:
+        result: Function result to cache
+
+    Returns:
+        Payload bytes for Redis
+    """
+    packed = ormsgpack.packb(result, default=_serialize_value, option=_PACK_OPTIONS)
+    if CACHE_COMPRESS_MIN_BYTES <= len(packed) <= CACHE_MAX_VALUE_BYTES:
+        return _zstd_compressor.compress(packed)
+    return packed
+
+
+def _unpack_result(payload: bytes) -> Any:
+    """
+    Decode a payload written by _pack_result().
+
+    A MessagePack document starting with the zstd magic byte is a single
+    integer, so a payload that begins with the full magic is compressed.
+
+    Args:
+        payload: Payload bytes from Redis or the local cache
+
+    Returns:
+        Decoded result
+    """
+    if payload[:4] == _ZSTD_MAGIC:
+        payload = _zstd_decompressor.decompress(payload)
+    return ormsgpack.unpackb(payload, option=_PACK_OPTIONS)
+
+
 def _make_cache_key(prefix: str, *args, **kwargs) -> str:
     """
     Generate cache key from function name and arguments.
 
+    A few short int/bool/str/None arguments (the common ``days=7`` case) are
+    written into the key with repr(); anything else is hashed.
+
     Args:
         prefix: Cache key prefix (usually function name)
         *args: Positional arguments
@@ -74,24 +162,40 @@ def _make_cache_key(prefix: str, *args, **kwargs) -> str:
 
     Returns:
         Cache key string
+
+    Examples:
+        ("monitoring:stats", days=7) -> cache:monitoring:stats:days=7
     """
+    if len(args) + len(kwargs) <= _KEY_MAX_SCALAR_ARGS and all(
+        _is_key_scalar(value) for value in (*args, *kwargs.values())
+    ):
+        parts = [repr(value) for value in args]
+        parts.extend(f"{name}={value!r}" for name, value in sorted(kwargs.items()))
+        return f"cache:{prefix}:" + ":".join(parts)
+
     # Serialize arguments to JSON (sorted for consistency)
     try:
-        args_str = json.dumps(args, default=_serialize_value, sort_keys=True)
-        kwargs_str = json.dumps(kwargs, default=_serialize_value, sort_keys=True)
-    except (TypeError, ValueError) as e:
+        key_data = orjson.dumps(
+            [args, kwargs], default=_serialize_value, option=_KEY_JSON_OPTIONS
+        )
+    except TypeError as e:
         logger.warning(f"Failed to serialize cache key arguments: {e}")
         # Fallback to string representation
-        args_str = str(args)
-        kwargs_str = str(sorted(kwargs.items()))
+        key_data = f"{args}:{sorted(kwargs.items())}".encode()
 
-    # Create hash to keep key length reasonable
-    key_data = f"{args_str}:{kwargs_str}"
-    key_hash = hashlib.md5(key_data.encode()).hexdigest()
+    # Create hash to keep key length reasonable (BLAKE2b is faster than MD5
+    # on these short inputs and still yields a 32-char hex digest)
+    key_hash = hashlib.blake2b(key_data, digest_size=16).hexdigest()
 
     return f"cache:{prefix}:{key_hash}"
 
 
+# Cache lookups in progress, by key. Concurrent callers for the same key
+# await the first caller's lookup and decode its payload (None if it failed)
+# rather than each paying for their own Redis GET, query and SETEX.
+_inflight_lookups: dict[str, asyncio.Future] = {}
+
+
 def cache_result(ttl: int = CACHE_DEFAULT_TTL, key_prefix: Optional[str] = None):
     """
     Decorator to cache function results in Redis.
@@ -113,47 +217,144 @@ def cache_result(ttl: int = CACHE_DEFAULT_TTL, key_prefix: Optional[str] = None)
             return results
     """
     def decorator(func: Callable) -> Callable:
+        # Fixed for the function, so worked out once here rather than per call
+        prefix = key_prefix or f"{func.__module__}.{func.__name__}"
+        strip_self = next(iter(inspect.signature(func).parameters), None) == "self"
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Skip first arg if it's 'self' (instance method)
-            cache_args = args[1:] if args and hasattr(args[0], '__dict__') else args
+            cache_args = args[1:] if strip_self else args
 
-            # Generate cache key
-            prefix = key_prefix or f"{func.__module__}.{func.__name__}"
-            cache_key = _make_cache_key(prefix, *cache_args, **kwargs)
+            # Database sessions differ per request and must not be part of the key
+            cache_args = tuple(a for a in cache_args if not isinstance(a, AsyncSession))
+            cache_kwargs = {
+                k: v for k, v in kwargs.items() if not isinstance(v, AsyncSession)
+            }
 
+            # Generate cache key
+            cache_key = _make_cache_key(prefix, *cache_args, **cache_kwargs)
+
+            # Normally created at startup; lazily resolved outside the app
+            redis_client = _redis_client or await get_redis_client()
+
+            # Payloads this worker read or wrote in the last few seconds skip
+            # the Redis round trip entirely
+            local = _local_results.get(cache_key)
+            if local is not None:
+                logger.debug(f"Cache LOCAL HIT: {cache_key}")
+                return _unpack_result(local)
+
+            # Share a lookup already in flight for this key (e.g. several
+            # clients polling the same dashboard) instead of repeating it
+            loop = asyncio.get_running_loop()
+            pending = _inflight_lookups.get(cache_key)
+            if pending is not None and pending.get_loop() is loop:
+                payload = await asyncio.shield(pending)
+                if payload is not None:
+                    logger.debug(f"Cache SHARED: {cache_key}")
+                    return _unpack_result(payload)
+                # The first caller failed; do our own lookup
+
+            lookup = loop.create_future()
+            _inflight_lookups[cache_key] = lookup
+            payload = None
+            keep_local = True
             try:
-                # Try to get from cache
-                redis_client = await get_redis_client()
-                cached = await redis_client.get(cache_key)
+                try:
+                    # Try to get from cache
+                    cached = await redis_client.get(cache_key)
+
+                    if cached is not None:
+                        logger.debug(f"Cache HIT: {cache_key}")
+                        payload = cached
+                        return _unpack_result(cached)
+
+                    logger.debug(f"Cache MISS: {cache_key}")
+
+                except Exception as e:
+                    logger.warning(f"Redis cache read error: {e}")
+                    # Continue without cache on error
+
+                # Execute function
+                result = await func(*args, **kwargs)
+
+                # Cache the result
+                try:
+                    payload = _pack_result(result)
+                    if len(payload) > CACHE_MAX_VALUE_BYTES:
+                        # Cheaper to recompute than to ship and hold in Redis
+                        keep_local = False
+                        logger.debug(
+                            f"Cache SKIP: {cache_key} ({len(payload)} bytes)"
+                        )
+                    else:
+                        await redis_client.setex(cache_key, ttl, payload)
+                        logger.debug(f"Cache SET: {cache_key} (TTL={ttl}s)")
+                except Exception as e:
+                    logger.warning(f"Redis cache write error: {e}")
+                    # Return result even if caching fails
+
+                return result
+            finally:
+                if _inflight_lookups.get(cache_key) is lookup:
+                    del _inflight_lookups[cache_key]
+                if payload is not None and keep_local:
+                    _local_results.set(cache_key, payload)
+                lookup.set_result(payload)
+
+        return wrapper
+    return decorator
+
 
-                if cached is not None:
-                    logger.debug(f"Cache HIT: {cache_key}")
-                    return json.loads(cached)
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Read a raw cached value.
 
-                logger.debug(f"Cache MISS: {cache_key}")
+    Args:
+        key: Cache key
 
-            except Exception as e:
-                logger.warning(f"Redis cache read error: {e}")
-                # Continue without cache on error
+    Returns:
+        Cached bytes, or None on a miss or Redis error
+    """
+    try:
+        redis_client = await get_redis_client()
+        return await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Redis cache read error: {e}")
+        return None
 
-            # Execute function
-            result = await func(*args, **kwargs)
 
-            # Cache the result
-            try:
-                redis_client = await get_redis_client()
-                serialized = json.dumps(result, default=_serialize_value)
-                await redis_client.setex(cache_key, ttl, serialized)
-                logger.debug(f"Cache SET: {cache_key} (TTL={ttl}s)")
-            except Exception as e:
-                logger.warning(f"Redis cache write error: {e}")
-                # Return result even if caching fails
+async def cache_set(key: str, value: Union[bytes, str], ttl: int) -> None:
+    """
+    Store a raw value with a TTL (errors are logged, not raised).
 
-            return result
+    Args:
+        key: Cache key
+        value: Serialized value
+        ttl: Time-to-live in seconds
+    """
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.setex(key, ttl, value)
+    except Exception as e:
+        logger.warning(f"Redis cache write error: {e}")
 
-        return wrapper
-    return decorator
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Delete cached values by exact key (errors are logged, not raised).
+
+    Args:
+        keys: Cache keys to delete
+    """
+    if not keys:
+        return
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Redis cache delete error: {e}")
 
 
 async def invalidate_cache_pattern(pattern: str) -> int:
@@ -170,20 +371,28 @@ async def invalidate_cache_pattern(pattern: str) -> int:
         # Invalidate all analytics caches
         await invalidate_cache_pattern("cache:analytics:*")
     """
+    # Local copies are only kept for a few seconds; drop them all
+    _local_results.clear()
+
     try:
         redis_client = await get_redis_client()
 
-        # Find all matching keys
-        keys = []
-        async for key in redis_client.scan_iter(match=pattern):
-            keys.append(key)
-
-        if keys:
-            deleted = await redis_client.delete(*keys)
+        # Unlink each SCAN batch as it arrives: memory stays bounded by the
+        # batch size and Redis frees the values in the background
+        deleted = 0
+        cursor = 0
+        while True:
+            cursor, keys = await redis_client.scan(
+                cursor, match=pattern, count=CACHE_SCAN_BATCH_SIZE
+            )
+            if keys:
+                deleted += await redis_client.unlink(*keys)
+            if cursor == 0:
+                break
+
+        if deleted:
             logger.info(f"Invalidated {deleted} cache keys matching '{pattern}'")
-            return deleted
-
-        return 0
+        return deleted
     except Exception as e:
         logger.error(f"Cache invalidation error: {e}")
         return 0
@@ -203,3 +412,63 @@ async def clear_all_cache() -> bool:
     except Exception as e:
         logger.error(f"Failed to clear cache: {e}")
         return False
+
+
+# ============================================================================
+# In-Process TTL Cache
+# ============================================================================
+
+
+class LocalTTLCache:
+    """
+    Small in-process cache with per-entry TTL and a size bound.
+
+    Used in front of hot, per-user point reads where a Redis round-trip would
+    cost about as much as the database query it replaces. Entries are local
+    to one worker process, so callers must invalidate on write and accept
+    up to `ttl` seconds of staleness in other workers.
+
+    Not thread-safe; intended for use from the event loop only.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = LOCAL_CACHE_MAX_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a key if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Recently seen cache_result payloads, checked before Redis. All cache_result
+# TTLs are far longer than LOCAL_CACHE_RESULT_TTL, so this adds at most a few
+# seconds of staleness in exchange for skipping repeat GETs in a worker.
+_local_results = LocalTTLCache(ttl=LOCAL_CACHE_RESULT_TTL)
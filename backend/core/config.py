@@ -5,9 +5,10 @@ Loads configuration from environment variables with validation and type safety.
 All settings can be overridden via environment variables.
 """
 
+from functools import cached_property
 from typing import Any
 
-from pydantic import Field, computed_field, field_validator
+from pydantic import AliasChoices, Field, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from core.constants import (
@@ -35,6 +36,21 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///:memory:",
         description="Database connection URL (PostgreSQL for production)",
     )
+    READ_REPLICA_URL: str | None = Field(
+        default=None,
+        description="Read replica URL for read-only endpoints (defaults to DATABASE_URL)",
+    )
+    DB_MAX_CONNECTIONS: int = Field(
+        default=100,
+        description="Connections the database server accepts (max_connections), shared by all workers",
+    )
+    WEB_CONCURRENCY: int = Field(
+        default=1,
+        ge=1,
+        # WORKERS is what the production image passes to uvicorn --workers
+        validation_alias=AliasChoices("WEB_CONCURRENCY", "WORKERS"),
+        description="Number of worker processes; each one holds its own connection pools",
+    )
 
     # Redis Configuration
     REDIS_URL: str = Field(
@@ -171,18 +187,21 @@ class Settings(BaseSettings):
     )
 
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def CORS_ORIGINS(self) -> list[str]:
         """
         Parse CORS origins from comma-separated string.
 
+        Settings are frozen, so the string is parsed on first access only.
+
         Returns:
             List of CORS origin strings
         """
         return [origin.strip() for origin in self.CORS_ORIGINS_STR.split(",") if origin.strip()]
 
-    def __repr__(self) -> str:
-        """Return string representation with masked secrets."""
+    @cached_property
+    def _masked_repr(self) -> str:
+        """String representation with masked secrets (settings are frozen)."""
         return (
             f"Settings(PROJECT_NAME='{self.PROJECT_NAME}', "
             f"VERSION='{self.VERSION}', "
@@ -191,6 +210,10 @@ class Settings(BaseSettings):
             f"SECRET_KEY='***masked***')"
         )
 
+    def __repr__(self) -> str:
+        """Return string representation with masked secrets."""
+        return self._masked_repr
+
 
 # Global settings instance
 settings = Settings()
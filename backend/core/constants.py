@@ -13,6 +13,10 @@ JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
 SECRET_KEY_MIN_LENGTH = 32
 
+# Authenticated User Cache (access token -> user, per worker)
+AUTH_USER_CACHE_TTL_SECONDS = 30  # Staleness bound for changes made in other workers
+AUTH_USER_CACHE_MAX_SIZE = 10_000  # Distinct tokens kept
+
 # Password Security
 BCRYPT_ROUNDS = 12  # bcrypt cost factor (2^12 iterations)
 PASSWORD_MIN_LENGTH = 8
@@ -63,10 +67,44 @@ RATE_LIMIT_MINUTE_SECONDS = 60  # 1 minute
 # ============================================================================
 
 # Connection Pool Configuration
+# Pool sizes below are upper bounds: each worker's pools are shrunk to fit
+# its share of settings.DB_MAX_CONNECTIONS (see core.database)
 DB_POOL_SIZE = 20  # Base connection pool size
 DB_MAX_OVERFLOW = 40  # Maximum overflow connections
+DB_RESERVED_CONNECTIONS = 10  # Left free for migrations, admin and monitoring sessions
 DB_POOL_RECYCLE_SECONDS = 3600  # Recycle connections after 1 hour
 
+# Dead-connection detection (replaces a SELECT 1 pre-ping on every checkout)
+DB_TCP_KEEPALIVES_IDLE_SECONDS = 30  # Idle time before the first keepalive probe
+DB_TCP_KEEPALIVES_INTERVAL_SECONDS = 10  # Time between unanswered probes
+DB_TCP_KEEPALIVES_COUNT = 3  # Unanswered probes before the connection is dropped
+DB_COMMAND_TIMEOUT_SECONDS = 30  # Client-side timeout for a single statement
+
+# Database Heartbeat (readiness probes read the last successful query time)
+DB_HEARTBEAT_INTERVAL_SECONDS = 10  # How often the background task runs SELECT 1
+DB_HEARTBEAT_STALE_SECONDS = 30  # Older heartbeats trigger a direct probe
+
+# Execution Summary Rollup (pre-aggregated daily totals for dashboards)
+EXECUTION_SUMMARY_ROLLUP_INTERVAL_SECONDS = 300  # 5 minutes
+EXECUTION_SUMMARY_ROLLUP_LOCK_ID = 0x6465_6570_0001  # Postgres advisory lock key
+
+# Share of a worker's connection budget given to each pool
+DB_MAIN_POOL_SHARE = 0.5
+DB_STREAM_POOL_SHARE = 0.25
+DB_READ_POOL_SHARE = 0.25
+
+# Streaming Connection Pool (long-lived WebSocket execution sessions)
+DB_STREAM_POOL_SIZE = 20  # Base pool size reserved for streaming endpoints
+DB_STREAM_MAX_OVERFLOW = 20  # Maximum overflow connections for streaming
+
+# Read-Only Connection Pool (dashboards and template reads, autocommit)
+DB_READ_POOL_SIZE = 30  # Base pool size for read-only endpoints
+DB_READ_MAX_OVERFLOW = 20  # Maximum overflow connections for reads
+
+# Health Check Connection Pool (heartbeat, readiness and deep health probes)
+DB_HEALTH_POOL_SIZE = 2  # Fixed pool, no overflow
+DB_HEALTH_POOL_TIMEOUT_SECONDS = 5  # Fail the probe rather than queue behind it
+
 # Query Limits
 DB_DEFAULT_LIMIT = 100  # Default pagination limit
 DB_MAX_LIMIT = 1000  # Maximum allowed pagination limit
@@ -75,12 +113,32 @@ DB_MAX_LIMIT = 1000  # Maximum allowed pagination limit
 # Cache Constants (Redis)
 # ============================================================================
 
+# Shared client connection health (PING idle connections before reuse)
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = 30
+
+# cache_result payload sizes: larger results are compressed, oversized ones
+# are not cached at all (recomputing beats shipping them through Redis)
+CACHE_COMPRESS_MIN_BYTES = 64 * 1024
+CACHE_MAX_VALUE_BYTES = 512 * 1024
+
+# Keys requested per SCAN (and unlinked per batch) by pattern invalidation
+CACHE_SCAN_BATCH_SIZE = 500
+
 # Default TTL (time-to-live) values in seconds
 CACHE_DEFAULT_TTL = 300  # 5 minutes
 CACHE_SHORT_TTL = 60  # 1 minute
 CACHE_MEDIUM_TTL = 600  # 10 minutes
 CACHE_LONG_TTL = 3600  # 1 hour
 CACHE_DAY_TTL = 86400  # 24 hours
+CACHE_RECENT_ACTIVITY_TTL = 5  # Recent executions/errors lists polled by dashboards
+CACHE_TEMPLATE_CATEGORIES_TTL = 300  # Template categories (invalidated on writes)
+CACHE_TEMPLATE_LISTS_TTL = 60  # Featured/popular template lists (invalidated on writes)
+CACHE_TEMPLATE_COUNT_TTL = 60  # Filtered template list totals (invalidated on writes)
+
+# In-process (per worker) caches for hot per-user reads
+LOCAL_CACHE_MAX_SIZE = 4096  # Maximum entries per local cache
+LOCAL_CACHE_TOOL_CONFIG_TTL = 30  # 30 seconds
+LOCAL_CACHE_RESULT_TTL = 5  # cache_result payloads kept in front of Redis
 
 # ============================================================================
 # Pagination Constants
@@ -103,6 +161,21 @@ PAGINATION_EXTERNAL_TOOLS = 50
 METRICS_LATENCY_BUCKETS = [0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0]
 METRICS_QUERY_BUCKETS = [0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
 
+# Entity count gauges (users/agents/templates) are refreshed at most this often
+METRICS_APP_STATS_TTL_SECONDS = 5.0
+
+# A rendered scrape is reused by scrapes arriving within this window
+# (HA Prometheus pairs, dashboards polling the endpoint directly)
+METRICS_RENDER_TTL_SECONDS = 1.0
+
+# Distinct values kept per user-derived metric label (agent_id, tool_name, ...);
+# further values are reported as METRICS_LABEL_OVERFLOW_VALUE
+METRICS_LABEL_CARDINALITY_LIMIT = 1000
+METRICS_LABEL_OVERFLOW_VALUE = "_other_"
+
+# Unhandled errors log a full traceback at most once per exception type per window
+ERROR_TRACEBACK_LOG_INTERVAL_SECONDS = 60.0
+
 # Alert Thresholds
 ALERT_ERROR_RATE_THRESHOLD = 0.05  # 5% error rate
 ALERT_HIGH_LATENCY_MS = 1000  # 1 second
@@ -4,19 +4,45 @@ Database configuration and session management for async SQLAlchemy.
 Provides:
 - AsyncEngine for async database operations
 - AsyncSession factory for dependency injection
+- Dedicated streaming engine for long-lived WebSocket sessions
+- Autocommit read engine (optionally a replica) for read-only endpoints
+- Small dedicated engine for health checks
+- Autocommit view of the primary for read-only endpoints needing fresh data
 - Base declarative class for all models
 """
 
-from typing import AsyncGenerator
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Optional, TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import QueuePool
 
 from core.config import settings
 from core.constants import (
+    DB_COMMAND_TIMEOUT_SECONDS,
+    DB_HEALTH_POOL_SIZE,
+    DB_HEALTH_POOL_TIMEOUT_SECONDS,
+    DB_MAIN_POOL_SHARE,
     DB_MAX_OVERFLOW,
     DB_POOL_RECYCLE_SECONDS,
     DB_POOL_SIZE,
+    DB_READ_MAX_OVERFLOW,
+    DB_READ_POOL_SHARE,
+    DB_READ_POOL_SIZE,
+    DB_RESERVED_CONNECTIONS,
+    DB_STREAM_MAX_OVERFLOW,
+    DB_STREAM_POOL_SHARE,
+    DB_STREAM_POOL_SIZE,
+    DB_TCP_KEEPALIVES_COUNT,
+    DB_TCP_KEEPALIVES_IDLE_SECONDS,
+    DB_TCP_KEEPALIVES_INTERVAL_SECONDS,
 )
 
 # Database URL loaded from settings (environment variables)
@@ -39,8 +65,51 @@ if settings.ENVIRONMENT == "production" and "postgresql" in DATABASE_URL.lower()
             "Add '?sslmode=require' to DATABASE_URL for security."
         )
 
+# Dead connections are detected out of band instead of with a SELECT 1 on
+# every checkout: the server sends TCP keepalives on idle connections, and
+# asyncpg times out statements that hang. A connection that died since its
+# last use still fails its first query (the request errors and the pool
+# discards it); pool_recycle bounds connection age as a backstop.
+if "asyncpg" in DATABASE_URL.lower():
+    connect_args.update({
+        "server_settings": {
+            "tcp_keepalives_idle": str(DB_TCP_KEEPALIVES_IDLE_SECONDS),
+            "tcp_keepalives_interval": str(DB_TCP_KEEPALIVES_INTERVAL_SECONDS),
+            "tcp_keepalives_count": str(DB_TCP_KEEPALIVES_COUNT),
+        },
+        "command_timeout": DB_COMMAND_TIMEOUT_SECONDS,
+    })
+
+# Every worker process has its own pools, so the server's connection limit
+# is divided between workers (after the health pool and a reserve for admin
+# sessions) and then between this worker's pools.
+WORKER_DB_CONNECTIONS = (
+    (settings.DB_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS) // settings.WEB_CONCURRENCY
+    - DB_HEALTH_POOL_SIZE
+)
+
+
+def pool_limits(pool_size: int, max_overflow: int, share: float) -> dict[str, int]:
+    """
+    Fit a pool into its share of this worker's connection budget.
+
+    A third of the share is kept open as the base pool and the rest is
+    overflow, never exceeding the configured pool_size / max_overflow.
+
+    Args:
+        pool_size: Configured base pool size (upper bound)
+        max_overflow: Configured overflow (upper bound)
+        share: Fraction of WORKER_DB_CONNECTIONS for this pool
+
+    Returns:
+        pool_size and max_overflow engine arguments
+    """
+    budget = max(3, int(WORKER_DB_CONNECTIONS * share))
+    size = max(2, min(pool_size, budget // 3))
+    return {"pool_size": size, "max_overflow": max(0, min(max_overflow, budget - size))}
+
+
 # Create async engine with connection pooling
-# Increased pool size for production concurrency (Problem #12)
 # Note: pool_size/max_overflow not used for SQLite
 engine_kwargs = {
     "echo": settings.ENVIRONMENT == "development",  # Logging only in development
@@ -50,14 +119,75 @@ engine_kwargs = {
 # Only add pool parameters for PostgreSQL (not supported by SQLite)
 if "postgresql" in DATABASE_URL.lower():
     engine_kwargs.update({
-        "pool_pre_ping": True,  # Verify connections before using them
-        "pool_size": DB_POOL_SIZE,  # Base connection pool size
-        "max_overflow": DB_MAX_OVERFLOW,  # Maximum overflow connections
+        **pool_limits(DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_MAIN_POOL_SHARE),
         "pool_recycle": DB_POOL_RECYCLE_SECONDS,  # Recycle connections after 1 hour
+        # Reuse the most recently returned connection, so a quiet period
+        # keeps a small warm set busy and lets the rest idle out
+        "pool_use_lifo": True,
     })
 
 engine = create_async_engine(DATABASE_URL, **engine_kwargs)
 
+# Separate engine for streaming endpoints (WebSocket execution streams hold a
+# session for the whole execution). Keeping them on their own pool prevents a
+# handful of long streams from exhausting the pool used by short HTTP requests.
+# SQLite has no real pool (and in-memory databases are per-engine), so it
+# shares the main engine.
+if "postgresql" in DATABASE_URL.lower():
+    stream_engine = create_async_engine(
+        DATABASE_URL,
+        **{
+            **engine_kwargs,
+            **pool_limits(DB_STREAM_POOL_SIZE, DB_STREAM_MAX_OVERFLOW, DB_STREAM_POOL_SHARE),
+        },
+    )
+else:
+    stream_engine = engine
+
+# Engine for read-only endpoints (dashboards, template catalogue). Points at
+# READ_REPLICA_URL when configured, otherwise at the primary. AUTOCOMMIT
+# skips the BEGIN/COMMIT round trips a plain SELECT doesn't need, and the
+# separate pool keeps heavy dashboard polling from starving writes. Replica
+# reads may lag the primary slightly. SQLite shares the main engine.
+READ_DATABASE_URL = settings.READ_REPLICA_URL or DATABASE_URL
+if "postgresql" in READ_DATABASE_URL.lower():
+    read_engine = create_async_engine(
+        READ_DATABASE_URL,
+        **{
+            **engine_kwargs,
+            **pool_limits(DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW, DB_READ_POOL_SHARE),
+        },
+        isolation_level="AUTOCOMMIT",
+    )
+else:
+    read_engine = engine
+
+# Autocommit view of the main engine (same pool, primary database) for GET
+# endpoints that must see the caller's own writes, which a replica behind
+# read_engine may not have yet. Plain SELECTs then skip the BEGIN and COMMIT
+# round trips of a transactional session.
+if "postgresql" in DATABASE_URL.lower():
+    primary_read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+else:
+    primary_read_engine = engine
+
+# Tiny engine for the database heartbeat and health probes. With its own
+# pool, probes still get a connection when request traffic has exhausted
+# the main pool, so a busy instance isn't reported unhealthy and restarted.
+# SQLite shares the main engine.
+if "postgresql" in DATABASE_URL.lower():
+    health_engine = create_async_engine(
+        DATABASE_URL,
+        **{
+            **engine_kwargs,
+            "pool_size": DB_HEALTH_POOL_SIZE,
+            "max_overflow": 0,
+            "pool_timeout": DB_HEALTH_POOL_TIMEOUT_SECONDS,
+        },
+    )
+else:
+    health_engine = engine
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -68,6 +198,36 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Session factory bound to the streaming engine
+StreamSessionLocal = async_sessionmaker(
+    stream_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+# Session factory bound to the autocommit view of the primary
+PrimaryReadSessionLocal = async_sessionmaker(
+    primary_read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+# Session factory bound to the read-only engine
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     pass
@@ -96,12 +256,138 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_stream_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting sessions for long-lived streaming endpoints.
+
+    Same semantics as get_db(), but sessions come from the dedicated
+    streaming pool so they don't compete with regular HTTP requests.
+
+    Yields:
+        AsyncSession: Database session bound to the streaming engine
+    """
+    async with StreamSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting sessions for read-only endpoints.
+
+    Sessions come from the autocommit read pool and are never committed,
+    so only use this for endpoints that don't write.
+
+    Yields:
+        AsyncSession: Database session bound to the read engine
+    """
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+async def get_db_read() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting sessions for read-only endpoints on the primary.
+
+    Like get_db_ro, but always reads the primary database, so results
+    include the caller's earlier writes. Sessions are autocommit and never
+    committed; only use this for endpoints that don't write.
+
+    Autocommit sessions never open a transaction, and asyncpg refuses to
+    create server-side cursors outside one: endpoints that stream results
+    (db.stream / db.stream_scalars) must use get_db or get_stream_db.
+
+    Yields:
+        AsyncSession: Autocommit database session on the primary
+    """
+    async with PrimaryReadSessionLocal() as session:
+        yield session
+
+
+T = TypeVar("T")
+
+
+async def start_stream(rows: AsyncIterator[T]) -> Optional[AsyncIterator[T]]:
+    """
+    Run a streamed query and fetch its first row before responding.
+
+    A StreamingResponse sends its 200 status with the first body chunk,
+    so a query that fails inside the body generator ends as a truncated
+    200. Starting the stream in the endpoint instead lets database errors
+    reach the exception handlers as a normal 500.
+
+    Args:
+        rows: Async iterator over query results (a service ``stream_*`` method)
+
+    Returns:
+        None if there are no rows, otherwise an iterator over every row
+        (the first one included)
+    """
+    try:
+        first = await anext(rows)
+    except StopAsyncIteration:
+        return None
+
+    async def replay() -> AsyncIterator[T]:
+        yield first
+        async for row in rows:
+            yield row
+
+    return replay()
+
+
 async def init_db() -> None:
     """
     Initialize database by creating all tables.
 
     This should be called on application startup.
     In production, use Alembic migrations instead.
+
+    The existing table names are read in one query first; when every
+    model table is already there, create_all (one existence check per
+    table) is skipped.
     """
     async with engine.begin() as conn:
+        existing = await conn.run_sync(
+            lambda sync_conn: set(inspect(sync_conn).get_table_names())
+        )
+        if existing.issuperset(Base.metadata.tables):
+            return
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_pool(target_engine: AsyncEngine) -> int:
+    """
+    Open the engine's base pool of connections ahead of traffic.
+
+    Connections are opened concurrently and returned to the pool, so the
+    first requests after startup don't each pay the connect (and TLS)
+    cost. Engines without a sized pool (SQLite) are left alone.
+
+    Args:
+        target_engine: Engine whose pool to fill
+
+    Returns:
+        Number of connections opened
+    """
+    pool = target_engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0
+
+    results = await asyncio.gather(
+        *(target_engine.connect() for _ in range(pool.size())),
+        return_exceptions=True,
+    )
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in connections))
+
+    errors = [exc for exc in results if isinstance(exc, BaseException)]
+    if errors:
+        raise errors[0]
+    return len(connections)
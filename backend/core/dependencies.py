@@ -12,7 +12,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.database import get_db, get_db_read
 from core.security import decode_access_token
 from models.user import User
 from services.auth_service import AuthService
@@ -22,25 +22,26 @@ from services.auth_service import AuthService
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+async def _authenticate_token(token: str, db: AsyncSession) -> User:
     """
-    Get current authenticated user from JWT token.
+    Resolve the user a bearer token belongs to.
+
+    Tokens seen recently skip decoding and the user query: the user is
+    rebuilt from AuthService's token cache and attached to the session.
 
     Args:
-        credentials: HTTP Authorization credentials (Bearer token)
-        db: Database session
+        token: Bearer token
+        db: Session to load (or attach) the user on
 
     Returns:
-        Current authenticated user
+        Authenticated user
 
     Raises:
         HTTPException: 401 if token is invalid or user not found
     """
-    # Extract token from Authorization header
-    token = credentials.credentials
+    user = await AuthService.get_cached_token_user(db, token)
+    if user is not None:
+        return user
 
     # Decode JWT token
     try:
@@ -78,9 +79,74 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if "exp" in token_data:
+        AuthService.cache_token_user(token, token_data["exp"], user)
     return user
 
 
+def _require_active(user: User) -> User:
+    """
+    Reject inactive users.
+
+    Raises:
+        HTTPException: 400 if user is inactive
+    """
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    return user
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Get current authenticated user from JWT token.
+
+    FastAPI caches dependencies per request, so endpoints that also depend
+    on get_db receive this same session; no second session is opened.
+    Endpoints reading through get_db_read use get_current_user_read.
+
+    Args:
+        credentials: HTTP Authorization credentials (Bearer token)
+        db: Database session
+
+    Returns:
+        Current authenticated user
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+    """
+    return await _authenticate_token(credentials.credentials, db)
+
+
+async def get_current_user_read(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db_read),
+) -> User:
+    """
+    Get current authenticated user on the get_db_read session.
+
+    Read-only endpoints take their session from get_db_read; resolving
+    the user on that same session keeps such requests to one pooled
+    connection, with no transaction to commit.
+
+    Args:
+        credentials: HTTP Authorization credentials (Bearer token)
+        db: Autocommit read session on the primary
+
+    Returns:
+        Current authenticated user
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+    """
+    return await _authenticate_token(credentials.credentials, db)
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -96,12 +162,25 @@ async def get_current_active_user(
     Raises:
         HTTPException: 400 if user is inactive
     """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
-    return current_user
+    return _require_active(current_user)
+
+
+async def get_current_active_user_read(
+    current_user: User = Depends(get_current_user_read),
+) -> User:
+    """
+    Get current active user for endpoints that read through get_db_read.
+
+    Args:
+        current_user: Current user from get_current_user_read dependency
+
+    Returns:
+        Current active user
+
+    Raises:
+        HTTPException: 400 if user is inactive
+    """
+    return _require_active(current_user)
 
 
 async def get_current_admin_user(
@@ -148,6 +227,10 @@ async def get_optional_user(
 
     try:
         token = credentials.credentials
+        user = await AuthService.get_cached_token_user(db, token)
+        if user is not None:
+            return user
+
         token_data = decode_access_token(token)
         if token_data is None:
             return None
@@ -157,6 +240,8 @@ async def get_optional_user(
             return None
 
         user = await AuthService.get_user_by_username(db, username=username)
+        if user is not None and "exp" in token_data:
+            AuthService.cache_token_user(token, token_data["exp"], user)
         return user
     except Exception:
         return None
@@ -11,6 +11,8 @@ Security Features:
 """
 
 import os
+import re
+from functools import lru_cache
 from typing import Any, Dict
 
 from cryptography.fernet import Fernet, InvalidToken
@@ -71,7 +73,7 @@ class CredentialEncryption:
             encrypted_bytes = self.fernet.encrypt(plaintext.encode())
             return encrypted_bytes.decode()
         except Exception as e:
-            logger.error(f"Encryption failed: {type(e).__name__}")
+            logger.error("Encryption failed: {}", type(e).__name__)
             raise ValueError("Failed to encrypt credential")
 
     def decrypt(self, encrypted: str) -> str:
@@ -97,7 +99,7 @@ class CredentialEncryption:
             logger.error("Decryption failed: Invalid token or wrong encryption key")
             raise ValueError("Failed to decrypt credential (invalid token or key)")
         except Exception as e:
-            logger.error(f"Decryption failed: {type(e).__name__}")
+            logger.error("Decryption failed: {}", type(e).__name__)
             raise ValueError("Failed to decrypt credential")
 
     def encrypt_dict_fields(
@@ -113,23 +115,27 @@ class CredentialEncryption:
             fields_to_encrypt: List of field names to encrypt
 
         Returns:
-            New dictionary with encrypted fields
+            New dictionary with encrypted fields, or data itself when none
+            of the fields are set
 
         Example:
             config = {"host": "localhost", "password": "secret123"}
             encrypted_config = encryptor.encrypt_dict_fields(config, ["password"])
             # Returns: {"host": "localhost", "password": "***ENCRYPTED***"}
         """
+        present = [field for field in fields_to_encrypt if data.get(field)]
+        if not present:
+            return data
+
         encrypted_data = data.copy()
 
-        for field in fields_to_encrypt:
-            if field in encrypted_data and encrypted_data[field]:
-                try:
-                    encrypted_data[field] = self.encrypt(str(encrypted_data[field]))
-                except Exception as e:
-                    logger.error(f"Failed to encrypt field '{field}': {e}")
-                    # Continue with other fields, don't fail entire operation
-                    encrypted_data[field] = "***ENCRYPTION_FAILED***"
+        for field in present:
+            try:
+                encrypted_data[field] = self.encrypt(str(encrypted_data[field]))
+            except Exception as e:
+                logger.error("Failed to encrypt field '{}': {}", field, e)
+                # Continue with other fields, don't fail entire operation
+                encrypted_data[field] = "***ENCRYPTION_FAILED***"
 
         return encrypted_data
 
@@ -144,28 +150,50 @@ class CredentialEncryption:
             fields_to_decrypt: List of field names to decrypt
 
         Returns:
-            New dictionary with decrypted fields
+            New dictionary with decrypted fields, or data itself when none
+            of the fields hold encrypted values
 
         Raises:
             ValueError: If decryption fails for any field
         """
-        decrypted_data = data.copy()
+        # Skip empty fields and special markers
+        present = [
+            field
+            for field in fields_to_decrypt
+            if data.get(field)
+            and data[field] not in ["***ENCRYPTED***", "***ENCRYPTION_FAILED***"]
+        ]
+        if not present:
+            return data
 
-        for field in fields_to_decrypt:
-            if field in decrypted_data and decrypted_data[field]:
-                # Skip if already decrypted or special markers
-                if decrypted_data[field] in ["***ENCRYPTED***", "***ENCRYPTION_FAILED***"]:
-                    continue
+        decrypted_data = data.copy()
 
-                try:
-                    decrypted_data[field] = self.decrypt(str(decrypted_data[field]))
-                except Exception as e:
-                    logger.error(f"Failed to decrypt field '{field}'")
-                    raise ValueError(f"Failed to decrypt field '{field}'")
+        for field in present:
+            try:
+                decrypted_data[field] = self.decrypt(str(decrypted_data[field]))
+            except ValueError:
+                # decrypt() has logged the cause; the caller reports the field
+                raise ValueError(f"Failed to decrypt field '{field}'")
 
         return decrypted_data
 
 
+# Credential-looking substrings and their replacements, applied in order.
+# These stay separate passes: one alternation would take the leftmost match,
+# and "Bearer token='x'" would then match as a bearer token and keep 'x'.
+_SANITIZE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    # password='..' or password="..."
+    (
+        re.compile(r"(password|token|key|secret)\s*=\s*['\"]([^'\"]+)['\"]", re.IGNORECASE),
+        r"\1='***SANITIZED***'",
+    ),
+    # Bearer tokens
+    (re.compile(r"Bearer\s+[A-Za-z0-9\-._~+/]+=*"), "Bearer ***SANITIZED***"),
+    # API keys (often look like: sk-..., glpat-..., etc.)
+    (re.compile(r"\b(sk-|glpat-|ghp_|gho_)[A-Za-z0-9_-]{20,}\b"), "***SANITIZED***"),
+)
+
+
 class CredentialSanitizer:
     """
     Sanitizes sensitive data from logs, error messages, and API responses.
@@ -189,6 +217,9 @@ class CredentialSanitizer:
         "encryption_key",
     ]
 
+    # Matches a key containing any of the fields in one scan
+    _SENSITIVE_KEY_RE = re.compile("|".join(map(re.escape, SENSITIVE_FIELDS)))
+
     @classmethod
     def sanitize_dict(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -198,33 +229,59 @@ class CredentialSanitizer:
             data: Dictionary that may contain sensitive data
 
         Returns:
-            New dictionary with sensitive fields replaced by '***SANITIZED***'
+            New dictionary with sensitive fields replaced by '***SANITIZED***',
+            or data itself when it holds no sensitive fields
 
         Example:
             config = {"host": "localhost", "password": "secret123", "port": 5432}
             sanitized = CredentialSanitizer.sanitize_dict(config)
             # Returns: {"host": "localhost", "password": "***SANITIZED***", "port": 5432}
         """
-        sanitized = {}
-
-        for key, value in data.items():
-            # Check if key contains sensitive field name
-            if any(sensitive in key.lower() for sensitive in cls.SENSITIVE_FIELDS):
-                sanitized[key] = "***SANITIZED***"
-            elif isinstance(value, dict):
-                # Recursively sanitize nested dictionaries
-                sanitized[key] = cls.sanitize_dict(value)
-            elif isinstance(value, list):
-                # Sanitize lists of dictionaries
-                sanitized[key] = [
-                    cls.sanitize_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                sanitized[key] = value
+        if not cls._has_sensitive_key(data):
+            return data
+
+        is_sensitive = cls._SENSITIVE_KEY_RE.search
+        sanitized: Dict[str, Any] = {}
+
+        # Walk nested containers with an explicit stack instead of recursion
+        stack = [(data, sanitized)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if is_sensitive(key.lower()):
+                    target[key] = "***SANITIZED***"
+                elif isinstance(value, dict):
+                    target[key] = nested = {}
+                    stack.append((value, nested))
+                elif isinstance(value, list):
+                    # Sanitize lists of dictionaries
+                    target[key] = items = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            nested = {}
+                            stack.append((item, nested))
+                            item = nested
+                        items.append(item)
+                else:
+                    target[key] = value
 
         return sanitized
 
+    @classmethod
+    def _has_sensitive_key(cls, data: Dict[str, Any]) -> bool:
+        """Check whether sanitize_dict would replace anything in data."""
+        is_sensitive = cls._SENSITIVE_KEY_RE.search
+        stack = [data]
+        while stack:
+            for key, value in stack.pop().items():
+                if is_sensitive(key.lower()):
+                    return True
+                if isinstance(value, dict):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(item for item in value if isinstance(item, dict))
+        return False
+
     @classmethod
     def sanitize_string(cls, text: str) -> str:
         """
@@ -244,42 +301,19 @@ class CredentialSanitizer:
             sanitized = CredentialSanitizer.sanitize_string(message)
             # Returns: "Connection failed for user@localhost with password='***SANITIZED***'"
         """
-        import re
-
-        # Pattern for password='..' or password="..."
-        text = re.sub(
-            r"(password|token|key|secret)\s*=\s*['\"]([^'\"]+)['\"]",
-            r"\1='***SANITIZED***'",
-            text,
-            flags=re.IGNORECASE,
-        )
-
-        # Pattern for Bearer tokens
-        text = re.sub(
-            r"Bearer\s+[A-Za-z0-9\-._~+/]+=*",
-            "Bearer ***SANITIZED***",
-            text,
-        )
-
-        # Pattern for API keys (often look like: sk-..., glpat-..., etc.)
-        text = re.sub(
-            r"\b(sk-|glpat-|ghp_|gho_)[A-Za-z0-9_-]{20,}\b",
-            "***SANITIZED***",
-            text,
-        )
+        for pattern, replacement in _SANITIZE_PATTERNS:
+            text = pattern.sub(replacement, text)
 
         return text
 
 
-# Global encryptor instance (lazy initialization)
-_encryptor: CredentialEncryption | None = None
-
-
+@lru_cache(maxsize=1)
 def get_encryptor() -> CredentialEncryption:
     """
     Get the global CredentialEncryption instance.
 
-    Lazily initializes the encryptor on first use.
+    Lazily initializes the encryptor on first use. A failed initialization
+    is not cached, so the next call retries.
 
     Returns:
         CredentialEncryption instance
@@ -287,7 +321,4 @@ def get_encryptor() -> CredentialEncryption:
     Raises:
         ValueError: If CREDENTIAL_ENCRYPTION_KEY is not set
     """
-    global _encryptor
-    if _encryptor is None:
-        _encryptor = CredentialEncryption()
-    return _encryptor
+    return CredentialEncryption()
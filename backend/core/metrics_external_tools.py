@@ -2,10 +2,16 @@
 Prometheus Metrics for External Tools Integration.
 
 Tracks tool usage, performance, and errors for monitoring and analytics.
+
+Per-user breakdowns are deliberately not exported as labels: every user
+would add a permanent series to each metric. Per-user usage lives in the
+tool execution log table instead.
 """
 
 from prometheus_client import Counter, Gauge, Histogram
 
+from core.metrics_registry import APP_REGISTRY, BoundedLabel, labeled
+
 # ============================================================================
 # Tool Execution Metrics
 # ============================================================================
@@ -14,7 +20,8 @@ from prometheus_client import Counter, Gauge, Histogram
 tool_executions_total = Counter(
     "tool_executions_total",
     "Total number of external tool executions",
-    labelnames=["tool_type", "tool_name", "success", "user_id"],
+    labelnames=["tool_type", "tool_name", "success"],
+    registry=APP_REGISTRY,
 )
 
 # Tool execution duration histogram
@@ -23,6 +30,7 @@ tool_execution_duration_seconds = Histogram(
     "External tool execution duration in seconds",
     labelnames=["tool_type", "tool_name"],
     buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0],  # Custom buckets for tool execution
+    registry=APP_REGISTRY,
 )
 
 # Tool connection errors counter
@@ -30,6 +38,7 @@ tool_connection_errors_total = Counter(
     "tool_connection_errors_total",
     "Total number of tool connection errors",
     labelnames=["tool_type", "error_type"],
+    registry=APP_REGISTRY,
 )
 
 # Tool configuration tests counter
@@ -37,6 +46,7 @@ tool_connection_tests_total = Counter(
     "tool_connection_tests_total",
     "Total number of tool connection tests",
     labelnames=["tool_type", "success"],
+    registry=APP_REGISTRY,
 )
 
 # ============================================================================
@@ -47,7 +57,8 @@ tool_connection_tests_total = Counter(
 tool_configs_active = Gauge(
     "tool_configs_active",
     "Number of active external tool configurations",
-    labelnames=["tool_type", "user_id"],
+    labelnames=["tool_type"],
+    registry=APP_REGISTRY,
 )
 
 # Total tool configurations gauge
@@ -55,6 +66,7 @@ tool_configs_total = Gauge(
     "tool_configs_total",
     "Total number of external tool configurations",
     labelnames=["tool_type"],
+    registry=APP_REGISTRY,
 )
 
 # Tool configurations by provider
@@ -62,6 +74,7 @@ tool_configs_by_provider = Gauge(
     "tool_configs_by_provider",
     "Number of tool configurations by provider",
     labelnames=["provider"],
+    registry=APP_REGISTRY,
 )
 
 # ============================================================================
@@ -72,14 +85,16 @@ tool_configs_by_provider = Gauge(
 rate_limit_hits_total = Counter(
     "rate_limit_hits_total",
     "Total number of rate limit hits",
-    labelnames=["limit_type", "user_id"],
+    labelnames=["limit_type"],
+    registry=APP_REGISTRY,
 )
 
 # Rate limit remaining gauge
 rate_limit_remaining = Gauge(
     "rate_limit_remaining",
-    "Current rate limit remaining for user",
-    labelnames=["limit_type", "user_id"],
+    "Rate limit remaining at the most recent check",
+    labelnames=["limit_type"],
+    registry=APP_REGISTRY,
 )
 
 # ============================================================================
@@ -91,6 +106,7 @@ external_tools_api_requests_total = Counter(
     "external_tools_api_requests_total",
     "Total number of external tools API requests",
     labelnames=["endpoint", "method", "status_code"],
+    registry=APP_REGISTRY,
 )
 
 # External tools API request duration
@@ -99,6 +115,7 @@ external_tools_api_duration_seconds = Histogram(
     "External tools API request duration in seconds",
     labelnames=["endpoint", "method"],
     buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+    registry=APP_REGISTRY,
 )
 
 # ============================================================================
@@ -110,13 +127,14 @@ tool_usage_by_category = Counter(
     "tool_usage_by_category",
     "Tool usage count by category",
     labelnames=["category"],  # database, git, logs, monitoring, http
+    registry=APP_REGISTRY,
 )
 
 # Tool catalog views
 tool_catalog_views_total = Counter(
     "tool_catalog_views_total",
     "Total number of tool catalog views",
-    labelnames=["user_id"],
+    registry=APP_REGISTRY,
 )
 
 # Tool marketplace actions
@@ -124,8 +142,29 @@ tool_marketplace_actions_total = Counter(
     "tool_marketplace_actions_total",
     "Total number of tool marketplace actions",
     labelnames=["action", "tool_type"],  # action: view, configure, test, connect
+    registry=APP_REGISTRY,
 )
 
+# User-derived label values are capped to keep series counts bounded
+_tool_name_label = BoundedLabel("tool_name")
+
+# Label values for success flags
+_SUCCESS_LABELS = {True: "true", False: "false"}
+
+# Tool type -> tool_usage_by_category label
+_TOOL_CATEGORIES = {
+    "postgresql": "database",
+    "mysql": "database",
+    "mongodb": "database",
+    "gitlab": "git",
+    "github": "git",
+    "elasticsearch": "logs",
+    "splunk": "logs",
+    "sentry": "monitoring",
+    "datadog": "monitoring",
+    "http": "http",
+}
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -136,7 +175,6 @@ def record_tool_execution(
     tool_name: str,
     duration_seconds: float,
     success: bool,
-    user_id: int,
 ):
     """
     Record a tool execution in metrics.
@@ -146,25 +184,21 @@ def record_tool_execution(
         tool_name: Name of tool configuration
         duration_seconds: Execution duration in seconds
         success: Whether execution succeeded
-        user_id: User ID
     """
+    tool_name = _tool_name_label(tool_name)
+
     # Increment execution counter
-    tool_executions_total.labels(
-        tool_type=tool_type,
-        tool_name=tool_name,
-        success=str(success).lower(),
-        user_id=str(user_id),
+    labeled(
+        tool_executions_total, tool_type, tool_name, _SUCCESS_LABELS[bool(success)]
     ).inc()
 
     # Record execution duration
-    tool_execution_duration_seconds.labels(
-        tool_type=tool_type,
-        tool_name=tool_name,
-    ).observe(duration_seconds)
+    labeled(tool_execution_duration_seconds, tool_type, tool_name).observe(
+        duration_seconds
+    )
 
     # Increment category usage
-    category = get_tool_category(tool_type)
-    tool_usage_by_category.labels(category=category).inc()
+    labeled(tool_usage_by_category, _TOOL_CATEGORIES.get(tool_type, "other")).inc()
 
 
 def record_connection_error(tool_type: str, error_type: str):
@@ -175,10 +209,7 @@ def record_connection_error(tool_type: str, error_type: str):
         tool_type: Type of tool
         error_type: Type of error (timeout, auth_failed, network_error, etc.)
     """
-    tool_connection_errors_total.labels(
-        tool_type=tool_type,
-        error_type=error_type,
-    ).inc()
+    labeled(tool_connection_errors_total, tool_type, error_type).inc()
 
 
 def record_connection_test(tool_type: str, success: bool):
@@ -189,9 +220,8 @@ def record_connection_test(tool_type: str, success: bool):
         tool_type: Type of tool
         success: Whether test succeeded
     """
-    tool_connection_tests_total.labels(
-        tool_type=tool_type,
-        success=str(success).lower(),
+    labeled(
+        tool_connection_tests_total, tool_type, _SUCCESS_LABELS[bool(success)]
     ).inc()
 
 
@@ -199,54 +229,39 @@ def update_tool_config_gauges(
     tool_type: str,
     active_count: int,
     total_count: int,
-    user_id: int,
 ):
     """
     Update tool configuration gauges.
 
     Args:
         tool_type: Type of tool
-        active_count: Number of active configurations
-        total_count: Total number of configurations
-        user_id: User ID
+        active_count: Number of active configurations of this type
+        total_count: Total number of configurations of this type
     """
-    tool_configs_active.labels(
-        tool_type=tool_type,
-        user_id=str(user_id),
-    ).set(active_count)
+    labeled(tool_configs_active, tool_type).set(active_count)
 
-    tool_configs_total.labels(
-        tool_type=tool_type,
-    ).set(total_count)
+    labeled(tool_configs_total, tool_type).set(total_count)
 
 
-def record_rate_limit_hit(limit_type: str, user_id: int):
+def record_rate_limit_hit(limit_type: str):
     """
     Record a rate limit hit.
 
     Args:
         limit_type: Type of limit (tool_exec, oauth, api)
-        user_id: User ID
     """
-    rate_limit_hits_total.labels(
-        limit_type=limit_type,
-        user_id=str(user_id),
-    ).inc()
+    labeled(rate_limit_hits_total, limit_type).inc()
 
 
-def update_rate_limit_remaining(limit_type: str, user_id: int, remaining: int):
+def update_rate_limit_remaining(limit_type: str, remaining: int):
     """
     Update rate limit remaining gauge.
 
     Args:
         limit_type: Type of limit
-        user_id: User ID
         remaining: Remaining requests
     """
-    rate_limit_remaining.labels(
-        limit_type=limit_type,
-        user_id=str(user_id),
-    ).set(remaining)
+    labeled(rate_limit_remaining, limit_type).set(remaining)
 
 
 def record_api_request(
@@ -264,16 +279,14 @@ def record_api_request(
         status_code: HTTP status code
         duration_seconds: Request duration in seconds
     """
-    external_tools_api_requests_total.labels(
-        endpoint=endpoint,
-        method=method,
-        status_code=str(status_code),
+    # labels() stringifies the status code once, when the child is created
+    labeled(
+        external_tools_api_requests_total, endpoint, method, status_code
     ).inc()
 
-    external_tools_api_duration_seconds.labels(
-        endpoint=endpoint,
-        method=method,
-    ).observe(duration_seconds)
+    labeled(external_tools_api_duration_seconds, endpoint, method).observe(
+        duration_seconds
+    )
 
 
 def record_marketplace_action(action: str, tool_type: str):
@@ -284,10 +297,7 @@ def record_marketplace_action(action: str, tool_type: str):
         action: Action type (view, configure, test, connect)
         tool_type: Tool type
     """
-    tool_marketplace_actions_total.labels(
-        action=action,
-        tool_type=tool_type,
-    ).inc()
+    labeled(tool_marketplace_actions_total, action, tool_type).inc()
 
 
 def get_tool_category(tool_type: str) -> str:
@@ -300,16 +310,4 @@ def get_tool_category(tool_type: str) -> str:
     Returns:
         Category string
     """
-    category_map = {
-        "postgresql": "database",
-        "mysql": "database",
-        "mongodb": "database",
-        "gitlab": "git",
-        "github": "git",
-        "elasticsearch": "logs",
-        "splunk": "logs",
-        "sentry": "monitoring",
-        "datadog": "monitoring",
-        "http": "http",
-    }
-    return category_map.get(tool_type, "other")
+    return _TOOL_CATEGORIES.get(tool_type, "other")
@@ -0,0 +1,97 @@
+"""
+Prometheus registry for application metrics.
+
+All application metrics register here instead of prometheus_client's
+global REGISTRY, so /metrics only serializes metrics the app defines
+(plus process CPU/memory) rather than every default collector.
+
+Also provides BoundedLabel, which caps the number of distinct values a
+user-derived label (IDs, names) can take, and labeled(), which reuses
+resolved label children on hot paths.
+"""
+
+from typing import Any
+
+from prometheus_client import CollectorRegistry, Gauge, ProcessCollector
+
+from core.constants import METRICS_LABEL_CARDINALITY_LIMIT, METRICS_LABEL_OVERFLOW_VALUE
+
+APP_REGISTRY = CollectorRegistry()
+
+# Process CPU, memory and file descriptor metrics (process_*)
+ProcessCollector(registry=APP_REGISTRY)
+
+# Headroom of bounded labels (alert when approaching the limit)
+metric_label_values = Gauge(
+    "metric_label_values",
+    "Distinct values tracked for a bounded metric label",
+    ["label"],
+    registry=APP_REGISTRY,
+)
+
+
+class BoundedLabel:
+    """
+    Limit the distinct values of a metric label.
+
+    The first ``limit`` distinct values pass through unchanged; any further
+    new value is replaced by METRICS_LABEL_OVERFLOW_VALUE, so one noisy
+    dimension can't grow the registry (and Prometheus) without bound.
+
+    Example:
+        agent_id_label = BoundedLabel("agent_id")
+        counter.labels(agent_id=agent_id_label(agent_id)).inc()
+    """
+
+    def __init__(self, name: str, limit: int = METRICS_LABEL_CARDINALITY_LIMIT):
+        self.name = name
+        self.limit = limit
+        self._seen: set[str] = set()
+        # Raw value -> label string for admitted values, so repeat values
+        # (typically integer IDs) skip the str() conversion
+        self._labels: dict[Any, str] = {}
+
+    def __call__(self, value: Any) -> str:
+        """Return the label value to record for ``value``."""
+        label = self._labels.get(value)
+        if label is not None:
+            return label
+
+        label = str(value)
+        if label not in self._seen:
+            if len(self._seen) >= self.limit:
+                return METRICS_LABEL_OVERFLOW_VALUE
+
+            self._seen.add(label)
+            metric_label_values.labels(label=self.name).set(len(self._seen))
+
+        self._labels[value] = label
+        return label
+
+
+# Resolved children keyed by (metric, label values). Safe to keep forever:
+# every label recorded through labeled() has a bounded set of values.
+_label_children: dict[tuple, Any] = {}
+
+
+def labeled(metric: Any, *label_values: Any) -> Any:
+    """
+    Return ``metric.labels(*label_values)``, cached per label values.
+
+    Resolving a child through ``.labels()`` validates and stringifies the
+    values and takes the metric's lock on every call, which costs several
+    times more than the increment itself. Hot-path recorders go through
+    this cache instead.
+
+    Args:
+        metric: Labeled Counter, Gauge or Histogram
+        *label_values: Label values in the metric's labelnames order
+
+    Returns:
+        The metric child for these label values
+    """
+    key = (metric, label_values)
+    child = _label_children.get(key)
+    if child is None:
+        child = _label_children[key] = metric.labels(*label_values)
+    return child
@@ -8,14 +8,22 @@ This module provides:
 """
 
 import time
-from typing import Callable
+from typing import Callable, Dict, Tuple
 
 from fastapi import Request, Response
 from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import BaseRoute
 
 from api.v1.metrics import record_error, record_http_request
 
+# Endpoint label per matched route, keyed by id(route). Routes live as long
+# as the app, so each label is built once and the same string is reused for
+# every request to that route (each router is included once, so a route
+# always carries the same prefix). The route is stored alongside its label so a
+# recycled id (e.g. apps built in tests) can't return another route's label.
+_endpoint_labels: Dict[int, Tuple[BaseRoute, str]] = {}
+
 
 class MetricsMiddleware(BaseHTTPMiddleware):
     """
@@ -41,12 +49,9 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         # Record start time
         start_time = time.time()
 
-        # Extract request information
+        # Extract request information (raw scope path, no URL parsing)
         method = request.method
-        path = request.url.path
-
-        # Normalize endpoint path (remove IDs for better grouping)
-        endpoint = self._normalize_path(path)
+        path = request.scope["path"]
 
         try:
             # Process request
@@ -58,7 +63,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             # Record metrics
             record_http_request(
                 method=method,
-                endpoint=endpoint,
+                endpoint=self._endpoint_label(request),
                 status=response.status_code,
                 duration=duration,
             )
@@ -83,7 +88,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             # Record as 500 error
             record_http_request(
                 method=method,
-                endpoint=endpoint,
+                endpoint=self._endpoint_label(request),
                 status=500,
                 duration=duration,
             )
@@ -97,37 +102,61 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             raise
 
     @staticmethod
-    def _normalize_path(path: str) -> str:
+    def _endpoint_label(request: Request) -> str:
         """
-        Normalize URL path for better metric grouping.
+        Get the endpoint label for a request.
 
-        Replaces UUIDs and numeric IDs with placeholders to prevent
-        high cardinality in metrics.
+        Uses the matched route's path template, so IDs never reach the
+        label and its cardinality is bounded by the number of routes.
+        Requests that matched no route share a single label. The label is
+        built on the first request to a route and looked up afterwards.
 
         Args:
-            path: Original URL path
+            request: Processed HTTP request (routing has filled the scope)
 
         Returns:
-            Normalized path with ID placeholders
+            Route path template or "unmatched"
 
         Examples:
-            /api/v1/agents/123 -> /api/v1/agents/{id}
-            /api/v1/executions/abc-def -> /api/v1/executions/{id}
+            /api/v1/agents/123 -> /api/v1/agents/{agent_id}
+            /wp-login.php -> unmatched
         """
-        import re
-
-        # Replace UUIDs with {id}
-        path = re.sub(
-            r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-            "/{id}",
-            path,
-            flags=re.IGNORECASE,
-        )
+        route = request.scope.get("route")
+        if route is None:
+            return "unmatched"
 
-        # Replace numeric IDs with {id}
-        path = re.sub(r"/\d+", "/{id}", path)
+        cached = _endpoint_labels.get(id(route))
+        if cached is not None and cached[0] is route:
+            return cached[1]
 
-        return path
+        label = MetricsMiddleware._route_label(route, request.scope["path"])
+        _endpoint_labels[id(route)] = (route, label)
+        return label
+
+    @staticmethod
+    def _route_label(route: BaseRoute, path: str) -> str:
+        """
+        Build the full path template label for a matched route.
+
+        Args:
+            route: Route the router matched
+            path: Raw request path the route matched
+
+        Returns:
+            Route path template (including any include prefix) or "unmatched"
+        """
+        template = getattr(route, "path", None)
+        if not template:
+            return "unmatched"
+
+        # Routes of included routers report their path relative to the
+        # include prefix; recover that (static) prefix as the shortest part
+        # of the raw path in front of a suffix the route itself matches.
+        for index, char in enumerate(path):
+            if char == "/" and route.path_regex.match(path[index:]):
+                return path[:index] + template
+
+        return template
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
@@ -7,6 +7,9 @@ Provides:
 - Secure authentication helpers
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from jose import JWTError, jwt
@@ -17,6 +20,13 @@ from core.config import settings
 # Password hashing context using bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt takes tens of milliseconds of CPU per call (and releases the GIL),
+# so async code runs it here instead of on the event loop. A dedicated pool
+# keeps login storms from queueing behind other asyncio.to_thread work.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -49,6 +59,39 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+
+    Same result as verify_password(), computed on the password thread pool.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Bcrypt hashed password
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+
+    Args:
+        password: Plain text password to hash
+
+    Returns:
+        Bcrypt hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token.
@@ -159,7 +159,6 @@ class ToolExecutionLoggerWrapper(BaseTool):
                     tool_name=self.tool_name,
                     duration_seconds=duration_ms / 1000,
                     success=success,
-                    user_id=self.user_id,
                 )
             except Exception as metric_error:
                 logger.error(f"Failed to record tool execution metric: {metric_error}")
@@ -225,7 +224,6 @@ class ToolExecutionLoggerWrapper(BaseTool):
                     tool_name=self.tool_name,
                     duration_seconds=duration_ms / 1000,
                     success=success,
-                    user_id=self.user_id,
                 )
             except Exception as metric_error:
                 logger.error(f"Failed to record tool execution metric: {metric_error}")
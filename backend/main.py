@@ -9,17 +9,25 @@ Main application setup including:
 - OpenAPI documentation
 """
 
-from contextlib import asynccontextmanager
-from typing import Any
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import Any, Dict
 
+import httpx
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
 
+from api.v1.metrics import record_error
+from core.cache import close_redis_client, get_redis_client
 from core.config import settings
-from core.database import engine
+from core.constants import ERROR_TRACEBACK_LOG_INTERVAL_SECONDS
+from core.database import engine, health_engine, read_engine, stream_engine, warm_pool
+from core.encryption import get_encryptor
 
 
 @asynccontextmanager
@@ -28,7 +36,12 @@ async def lifespan(app: FastAPI):
     Application lifespan manager for startup and shutdown events.
 
     Handles:
-    - Database connection initialization on startup
+    - Database connection initialization and pool warm-up on startup
+    - Shared Redis client (core.cache) created and connected on startup
+    - Credential encryptor built (and its key validated) on startup
+    - Shared outbound HTTP client (app.state.http_client)
+    - Database heartbeat task used by readiness probes
+    - Daily execution summary rollup task used by monitoring dashboards
     - Cleanup on shutdown
     """
     # Startup
@@ -45,15 +58,83 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database connection failed: {e}")
         logger.warning("Application starting without database connection")
 
+    # Fill the request pools so early traffic doesn't wait on connects
+    for pool_engine in dict.fromkeys((engine, read_engine)):
+        try:
+            warmed = await warm_pool(pool_engine)
+            if warmed:
+                logger.info(f"Warmed {warmed} database connections")
+        except Exception as e:
+            logger.warning(f"Database pool warm-up failed: {e}")
+
+    # Create the shared Redis client up front and open its first connection
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.ping()
+        logger.info("Redis connection successful")
+    except Exception as e:
+        logger.warning(f"Redis connection failed: {e}. Continuing without cache")
+
+    # Build the credential encryptor now, so a bad key is reported at startup
+    # rather than on the first external tool request
+    if os.getenv("CREDENTIAL_ENCRYPTION_KEY"):
+        try:
+            get_encryptor()
+        except ValueError as e:
+            logger.error(f"Credential encryption unavailable: {e}")
+
+    # Shared HTTP client for outbound probes (keeps TLS connections alive)
+    app.state.http_client = httpx.AsyncClient(
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+    # Keep app.state.db_last_ok fresh for readiness probes
+    from api.v1.health import run_db_heartbeat
+
+    app.state.db_last_ok = 0.0
+    heartbeat_task = asyncio.create_task(run_db_heartbeat(app.state))
+
+    background_tasks = [heartbeat_task]
+
+    # Pre-aggregate complete days of executions for the monitoring dashboard
+    from services.monitoring_service import (
+        daily_summary_rollup_enabled,
+        run_daily_summary_rollup,
+    )
+
+    try:
+        if await daily_summary_rollup_enabled():
+            background_tasks.append(asyncio.create_task(run_daily_summary_rollup()))
+        else:
+            logger.info("Execution summary rollup disabled")
+    except Exception as e:
+        logger.warning(f"Execution summary rollup not started: {e}")
+
     yield
 
     # Shutdown
     logger.info("Shutting down DeepAgents Control Platform API")
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await app.state.http_client.aclose()
+    await close_redis_client()
     await engine.dispose()
+    if stream_engine is not engine:
+        await stream_engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+    if health_engine is not engine:
+        await health_engine.dispose()
     logger.info("Database connections closed")
 
 
 # Create FastAPI application
+# No default_response_class: routes with a response model are serialized
+# straight to JSON bytes by Pydantic, which only happens while the default
+# response class is left in place (ORJSONResponse would disable it).
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
@@ -154,11 +235,21 @@ async def validation_exception_handler(
     )
 
 
+# Exception type name -> monotonic time its traceback was last logged
+_traceback_logged_at: Dict[str, float] = {}
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
     Handle unexpected exceptions with error logging.
 
+    Endpoints only translate their domain errors; anything else ends up
+    here, is counted in the errors_total metric (component = the router
+    module that raised it) and is reported without internal details.
+    The traceback is logged once per exception type per
+    ERROR_TRACEBACK_LOG_INTERVAL_SECONDS.
+
     Args:
         request: The request that caused the exception
         exc: The exception
@@ -166,8 +257,21 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     Returns:
         JSON response with generic error message
     """
-    exc_str = str(exc).replace("{", "{{").replace("}", "}}")
-    logger.error(f"Unexpected error on {request.url}: {exc_str}", exc_info=True)
+    exc_type = type(exc).__name__
+    path = request.scope["path"]
+    now = time.monotonic()
+    last_logged = _traceback_logged_at.get(exc_type)
+    if last_logged is None or now - last_logged >= ERROR_TRACEBACK_LOG_INTERVAL_SECONDS:
+        _traceback_logged_at[exc_type] = now
+        logger.opt(exception=exc).error("Unexpected {} on {}", exc_type, path)
+    else:
+        # The same failure repeating (e.g. a database outage): skip the
+        # traceback walk and log one line
+        logger.error("Unexpected {} on {}: {}", exc_type, path, exc)
+
+    endpoint = request.scope.get("endpoint")
+    component = endpoint.__module__.rsplit(".", 1)[-1] if endpoint else "app"
+    record_error(exc_type, component)
 
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -180,6 +284,14 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
 
 # Health Check Endpoint
 
+# Payload never changes for the lifetime of the process (settings are frozen)
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+    "service": settings.PROJECT_NAME,
+}
+
 
 @app.get("/health", tags=["Health"])
 async def health_check() -> dict[str, Any]:
@@ -189,12 +301,7 @@ async def health_check() -> dict[str, Any]:
     Returns:
         Health status and version information
     """
-    return {
-        "status": "healthy",
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-        "service": settings.PROJECT_NAME,
-    }
+    return _HEALTH_PAYLOAD
 
 
 # API Routers
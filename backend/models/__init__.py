@@ -9,6 +9,7 @@ Provides:
 - Subagent: Hierarchical subagent configuration
 - Execution: Agent execution tracking
 - Trace: Granular execution event logging
+- ExecutionDailySummary: Pre-aggregated daily execution totals
 - Plan: Agent execution plan storage (planning tool)
 - Template: Pre-configured agent templates
 
@@ -34,7 +35,7 @@ from .advanced_config import (
     ExecutionApproval,
 )
 from .agent import Agent, AgentTool, Subagent
-from .execution import Execution, Trace
+from .execution import Execution, ExecutionDailySummary, Trace
 from .external_tool import ExternalToolConfig, ToolExecutionLog
 from .plan import Plan
 from .template import Template
@@ -50,6 +51,7 @@ __all__ = [
     "Template",
     "Execution",
     "Trace",
+    "ExecutionDailySummary",
     "Plan",
     "AgentBackendConfig",
     "AgentMemoryNamespace",
@@ -3,13 +3,26 @@ Execution and Trace models for agent run tracking and monitoring.
 
 Execution represents a single agent run, while Trace captures
 individual events during execution for real-time streaming and analysis.
+ExecutionDailySummary holds pre-aggregated per-day execution totals for
+monitoring dashboards.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import DECIMAL, DateTime, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy import (
+    DECIMAL,
+    BigInteger,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -153,6 +166,9 @@ class Execution(Base):
         Index(
             "idx_executions_agent_started_status", "agent_id", "started_at", "status"
         ),  # For filtered timeline queries (5-10x speedup)
+        # Recent activity feeds (ORDER BY created_at DESC LIMIT n)
+        Index("idx_executions_created", "created_at"),
+        Index("idx_executions_status_created", "status", "created_at"),
     )
 
     def __repr__(self) -> str:
@@ -244,3 +260,47 @@ class Trace(Base):
 
     def __repr__(self) -> str:
         return f"<Trace(id={self.id}, execution_id={self.execution_id}, type='{self.event_type}', seq={self.sequence_number})>"
+
+
+class ExecutionDailySummary(Base):
+    """
+    Pre-aggregated execution totals per agent, user and day.
+
+    Maintained by MonitoringService.rollup_daily_summaries() for complete
+    (past) days only, so dashboard queries read O(days x agents) rows
+    instead of scanning the executions table. Days are bucketed by
+    Execution.created_at.
+
+    Relationships:
+    - Many-to-one with Agent and User (cascade on delete)
+    """
+
+    __tablename__ = "execution_daily_summary"
+
+    # Composite primary key
+    agent_id: Mapped[int] = mapped_column(
+        ForeignKey("agents.id", ondelete="CASCADE"), primary_key=True
+    )
+    created_by_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # Aggregates
+    total_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    success_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_cost: Mapped[Decimal] = mapped_column(
+        DECIMAL(14, 6), nullable=False, default=0
+    )
+
+    __table_args__ = (
+        Index("idx_execution_daily_summary_user_date", "created_by_id", "date"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ExecutionDailySummary(agent_id={self.agent_id}, "
+            f"created_by_id={self.created_by_id}, date={self.date})>"
+        )
@@ -117,6 +117,8 @@ class ExternalToolConfig(Base):
         Index("idx_external_tool_configs_user_tool_name", "user_id", "tool_name", unique=True),
         Index("idx_external_tool_configs_tool_type", "tool_type"),
         Index("idx_external_tool_configs_provider", "provider"),
+        # Keyset pagination: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+        Index("idx_external_tool_configs_user_created_id", "user_id", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
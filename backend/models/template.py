@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from core.database import Base
 
@@ -104,6 +104,20 @@ class Template(Base):
         Index("idx_templates_public_featured", "is_public", "is_featured"),
         Index("idx_templates_use_count_desc", "use_count"),
         Index("idx_templates_created_by_active", "created_by_id", "is_active"),
+        # Keyset pagination of the template list, newest first
+        Index("idx_templates_created_id", "created_at", "id"),
+        Index(
+            "idx_templates_featured_created_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active AND is_featured"),
+        ),
+        Index(
+            "idx_templates_public_created_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active AND is_public"),
+        ),
     )
 
     def __repr__(self) -> str:
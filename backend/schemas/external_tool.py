@@ -10,6 +10,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from core.encryption import CredentialSanitizer
+
 
 # ============================================================================
 # Tool Configuration Schemas
@@ -92,8 +94,6 @@ class ExternalToolConfigResponse(ExternalToolConfigBase):
     @classmethod
     def sanitize_configuration(cls, v: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize configuration to hide encrypted credentials."""
-        from core.encryption import CredentialSanitizer
-
         return CredentialSanitizer.sanitize_dict(v)
 
 
@@ -200,8 +200,6 @@ class ToolExecutionLogResponse(BaseModel):
     @classmethod
     def sanitize_input_params(cls, v: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize input params to hide sensitive data."""
-        from core.encryption import CredentialSanitizer
-
         return CredentialSanitizer.sanitize_dict(v)
 
 
@@ -250,6 +248,9 @@ class ExternalToolConfigListResponse(BaseModel):
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=50, ge=1, le=100)
     has_more: bool
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (pass as ?cursor=)"
+    )
 
 
 class ToolExecutionLogListResponse(BaseModel):
@@ -168,6 +168,9 @@ class TemplateListResponse(BaseModel):
     page: int
     page_size: int
     has_next: bool
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (pass as ?cursor=)"
+    )
 
 
 class TemplateCategoryResponse(BaseModel):
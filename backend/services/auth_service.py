@@ -8,20 +8,80 @@ This service handles:
 - User retrieval operations
 """
 
+import time
 from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from loguru import logger
 
 from models.user import User
-from core.security import verify_password, get_password_hash
+from core.cache import LocalTTLCache
+from core.constants import AUTH_USER_CACHE_MAX_SIZE, AUTH_USER_CACHE_TTL_SECONDS
+from core.security import get_password_hash_async, verify_password_async
 from schemas.auth import UserRegister
 from services.lockout_service import get_lockout_service
 
 
+# Access token -> (token expiry, column values of its user). Authenticated
+# requests rebuild the user from here instead of selecting it again; user
+# writes below clear it, other workers see changes within the TTL.
+_token_users = LocalTTLCache(
+    ttl=AUTH_USER_CACHE_TTL_SECONDS, maxsize=AUTH_USER_CACHE_MAX_SIZE
+)
+
+_USER_COLUMNS = tuple(column.key for column in User.__mapper__.column_attrs)
+
+
 class AuthService:
     """Service for authentication and user management operations."""
 
+    @staticmethod
+    async def get_cached_token_user(
+        db: AsyncSession, token: str
+    ) -> Optional[User]:
+        """
+        Get the user of a recently validated access token without a query.
+
+        Args:
+            db: Database session the user is attached to
+            token: Raw access token
+
+        Returns:
+            User if the token was validated recently and hasn't expired,
+            None otherwise
+        """
+        entry = _token_users.get(token)
+        if entry is None:
+            return None
+
+        expires_at, values = entry
+        if expires_at <= time.time():
+            _token_users.pop(token)
+            return None
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    @staticmethod
+    def cache_token_user(token: str, expires_at: float, user: User) -> None:
+        """
+        Remember the user of a validated access token.
+
+        Args:
+            token: Raw access token
+            expires_at: Token expiry (``exp`` claim, Unix time)
+            user: User the token belongs to
+        """
+        values = {key: getattr(user, key) for key in _USER_COLUMNS}
+        _token_users.set(token, (expires_at, values))
+
+    @staticmethod
+    def clear_token_user_cache() -> None:
+        """Forget all cached token users (call after any user write)."""
+        _token_users.clear()
+
     @staticmethod
     async def get_user_by_username(
         db: AsyncSession, username: str
@@ -123,7 +183,7 @@ class AuthService:
             return None
 
         # Verify password
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             # Record failed attempt
             result = await lockout_service.record_failed_attempt(username)
 
@@ -174,7 +234,7 @@ class AuthService:
             raise ValueError("Email already registered")
 
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         db_user = User(
             username=user_data.username,
             email=user_data.email,
@@ -203,8 +263,9 @@ class AuthService:
         Returns:
             Updated user
         """
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await get_password_hash_async(new_password)
         await db.commit()
+        AuthService.clear_token_user_cache()
         await db.refresh(user)
         return user
 
@@ -233,6 +294,7 @@ class AuthService:
 
         user.email = new_email
         await db.commit()
+        AuthService.clear_token_user_cache()
         await db.refresh(user)
         return user
 
@@ -252,6 +314,7 @@ class AuthService:
         """
         user.is_active = False
         await db.commit()
+        AuthService.clear_token_user_cache()
         await db.refresh(user)
         return user
 
@@ -271,5 +334,6 @@ class AuthService:
         """
         user.is_active = True
         await db.commit()
+        AuthService.clear_token_user_cache()
         await db.refresh(user)
         return user
@@ -164,6 +164,8 @@ class ExecutionService:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        user_id: Optional[int] = None,
+        require_agent_owner: bool = False,
     ) -> List[Execution]:
         """
         List executions with optional filters.
@@ -174,6 +176,10 @@ class ExecutionService:
             status: Filter by status
             skip: Pagination offset
             limit: Pagination limit
+            user_id: Only return executions created by this user
+            require_agent_owner: When filtering by agent_id, also require the
+                agent to be owned by user_id (joined in the same query, so no
+                separate ownership lookup is needed)
 
         Returns:
             List of executions matching filters
@@ -183,8 +189,13 @@ class ExecutionService:
         conditions = []
         if agent_id:
             conditions.append(Execution.agent_id == agent_id)
+            if require_agent_owner and user_id is not None:
+                query = query.join(Agent, Agent.id == Execution.agent_id)
+                conditions.append(Agent.created_by_id == user_id)
         if status:
             conditions.append(Execution.status == status)
+        if user_id is not None:
+            conditions.append(Execution.created_by_id == user_id)
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -243,6 +254,38 @@ class ExecutionService:
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    async def stream_execution_traces(
+        self, db: AsyncSession, execution_id: int, skip: int = 0, limit: int = 1000
+    ) -> AsyncIterator[Trace]:
+        """
+        Stream traces for an execution without materializing the full page.
+
+        Rows are fetched through a server-side cursor and yielded one by one,
+        so memory stays flat regardless of the page size.
+
+        Args:
+            db: Database session
+            execution_id: Execution ID
+            skip: Pagination offset
+            limit: Pagination limit
+
+        Yields:
+            Trace objects ordered by sequence number
+        """
+        query = (
+            select(Trace)
+            .where(Trace.execution_id == execution_id)
+            .order_by(Trace.sequence_number)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.stream_scalars(query)
+        try:
+            async for trace in result:
+                yield trace
+        finally:
+            await result.close()
+
 
 # Singleton instance for convenience
 execution_service = ExecutionService()
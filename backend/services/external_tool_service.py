@@ -6,10 +6,11 @@ connection testing, and tool instantiation.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from loguru import logger
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.encryption import get_encryptor
@@ -32,6 +33,31 @@ from schemas.external_tool import (
 )
 
 
+# Unique index behind "tool name already exists" errors
+_TOOL_NAME_UNIQUE_INDEX = "idx_external_tool_configs_user_tool_name"
+
+
+def _violates_tool_name_index(error: IntegrityError) -> bool:
+    """
+    Check whether an IntegrityError comes from the (user_id, tool_name) index.
+
+    PostgreSQL drivers report the violated constraint by name (asyncpg on
+    the wrapped driver exception, psycopg via ``diag``); SQLite only names
+    the indexed columns in its message.
+    """
+    orig = error.orig
+    constraint = getattr(getattr(orig, "__cause__", None), "constraint_name", None)
+    if constraint is None:
+        constraint = getattr(getattr(orig, "diag", None), "constraint_name", None)
+    if constraint is not None:
+        return constraint == _TOOL_NAME_UNIQUE_INDEX
+
+    return (
+        "UNIQUE constraint failed: "
+        "external_tool_configs.user_id, external_tool_configs.tool_name"
+    ) in str(orig)
+
+
 class ExternalToolService:
     """Service for managing external tool configurations."""
 
@@ -63,19 +89,6 @@ class ExternalToolService:
         Raises:
             ValueError: If tool_name already exists or configuration invalid
         """
-        # Check if tool_name already exists for this user
-        stmt = select(ExternalToolConfig).where(
-            and_(
-                ExternalToolConfig.user_id == user_id,
-                ExternalToolConfig.tool_name == data.tool_name,
-            )
-        )
-        result = await db.execute(stmt)
-        existing_tool = result.scalar_one_or_none()
-
-        if existing_tool:
-            raise ValueError(f"Tool '{data.tool_name}' already exists")
-
         # Encrypt sensitive fields in configuration
         encrypted_config = await self._encrypt_configuration(
             data.tool_type, data.configuration
@@ -92,8 +105,10 @@ class ExternalToolService:
             test_status="not_tested",
         )
 
+        # Duplicate names are rejected by the unique (user_id, tool_name)
+        # index on commit (after encryption), with no existence query first
         db.add(tool_config)
-        await db.commit()
+        await self._commit_unique_name(db, data.tool_name)
         await db.refresh(tool_config)
 
         logger.info(
@@ -102,14 +117,84 @@ class ExternalToolService:
         )
 
         # Update metrics
-        await self._update_metrics_for_user(db, user_id, data.tool_type)
+        await self._update_metrics_for_tool_type(db, data.tool_type)
 
         # Record marketplace action
         record_marketplace_action("configure", data.tool_type)
 
         return tool_config
 
-    async def list_tool_configs(
+    @staticmethod
+    async def _commit_unique_name(db: AsyncSession, tool_name: str) -> None:
+        """
+        Commit, translating a (user_id, tool_name) unique violation.
+
+        Other integrity errors (foreign keys, NOT NULL) are re-raised as is.
+
+        Raises:
+            ValueError: If the user already has a tool with this name
+            IntegrityError: On any other constraint violation
+        """
+        try:
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            if _violates_tool_name_index(e):
+                raise ValueError(f"Tool '{tool_name}' already exists")
+            raise
+
+    @staticmethod
+    def _filter_conditions(
+        user_id: int,
+        tool_type: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> list:
+        """Build the WHERE conditions shared by list and count queries."""
+        conditions = [ExternalToolConfig.user_id == user_id]
+
+        if tool_type:
+            conditions.append(ExternalToolConfig.tool_type == tool_type)
+
+        if is_active is not None:
+            conditions.append(ExternalToolConfig.is_active == is_active)
+
+        return conditions
+
+    def _list_statement(
+        self,
+        user_id: int,
+        tool_type: Optional[str],
+        is_active: Optional[bool],
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]],
+        *extra_columns,
+    ):
+        """Build the paginated (offset or keyset) tool config SELECT."""
+        conditions = self._filter_conditions(user_id, tool_type, is_active)
+
+        if after is not None:
+            after_created_at, after_id = after
+            conditions.append(
+                or_(
+                    ExternalToolConfig.created_at < after_created_at,
+                    and_(
+                        ExternalToolConfig.created_at == after_created_at,
+                        ExternalToolConfig.id < after_id,
+                    ),
+                )
+            )
+            skip = 0
+
+        return (
+            select(ExternalToolConfig, *extra_columns)
+            .where(and_(*conditions))
+            .order_by(ExternalToolConfig.created_at.desc(), ExternalToolConfig.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+    async def stream_tool_configs_with_total(
         self,
         db: AsyncSession,
         user_id: int,
@@ -117,42 +202,47 @@ class ExternalToolService:
         is_active: Optional[bool] = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> List[ExternalToolConfig]:
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> AsyncIterator[Tuple[ExternalToolConfig, int]]:
         """
-        List user's external tool configurations.
+        Stream tool configurations together with the total count.
+
+        The total is selected as a scalar subquery next to each row (it only
+        applies the filters, not the pagination), so the page and its count
+        share a single round trip. Rows are fetched through a server-side
+        cursor and yielded one by one, so memory stays flat regardless of
+        the page size. An empty page yields nothing; callers that need the
+        total then should use count_tool_configs().
 
         Args:
             db: Database session
             user_id: User ID
             tool_type: Filter by tool type
             is_active: Filter by active status
-            skip: Pagination offset
+            skip: Pagination offset (ignored when ``after`` is given)
             limit: Maximum results
+            after: Keyset cursor as (created_at, id) of the last seen row
 
-        Returns:
-            List of tool configurations
+        Yields:
+            Tuples of (tool configuration, total matching configurations)
         """
-        # Build query
-        conditions = [ExternalToolConfig.user_id == user_id]
-
-        if tool_type:
-            conditions.append(ExternalToolConfig.tool_type == tool_type)
-
-        if is_active is not None:
-            conditions.append(ExternalToolConfig.is_active == is_active)
-
-        stmt = (
-            select(ExternalToolConfig)
-            .where(and_(*conditions))
-            .order_by(ExternalToolConfig.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        total_column = (
+            select(func.count())
+            .select_from(ExternalToolConfig)
+            .where(and_(*self._filter_conditions(user_id, tool_type, is_active)))
+            .scalar_subquery()
+            .label("total")
+        )
+        stmt = self._list_statement(
+            user_id, tool_type, is_active, skip, limit, after, total_column
         )
 
-        result = await db.execute(stmt)
-        tool_configs = result.scalars().all()
-
-        return list(tool_configs)
+        result = await db.stream(stmt)
+        try:
+            async for tool_config, total in result:
+                yield tool_config, total
+        finally:
+            await result.close()
 
     async def count_tool_configs(
         self,
@@ -173,13 +263,7 @@ class ExternalToolService:
         Returns:
             Total count
         """
-        conditions = [ExternalToolConfig.user_id == user_id]
-
-        if tool_type:
-            conditions.append(ExternalToolConfig.tool_type == tool_type)
-
-        if is_active is not None:
-            conditions.append(ExternalToolConfig.is_active == is_active)
+        conditions = self._filter_conditions(user_id, tool_type, is_active)
 
         stmt = select(func.count()).select_from(ExternalToolConfig).where(and_(*conditions))
 
@@ -241,21 +325,8 @@ class ExternalToolService:
         if not tool_config:
             return None
 
-        # Check tool_name conflict if changing name
+        # Rename (conflicts surface from the unique index on commit)
         if data.tool_name and data.tool_name != tool_config.tool_name:
-            stmt = select(ExternalToolConfig).where(
-                and_(
-                    ExternalToolConfig.user_id == user_id,
-                    ExternalToolConfig.tool_name == data.tool_name,
-                    ExternalToolConfig.id != tool_id,
-                )
-            )
-            result = await db.execute(stmt)
-            existing_tool = result.scalar_one_or_none()
-
-            if existing_tool:
-                raise ValueError(f"Tool '{data.tool_name}' already exists")
-
             tool_config.tool_name = data.tool_name
 
         # Update configuration if provided
@@ -275,7 +346,7 @@ class ExternalToolService:
 
         tool_config.updated_at = datetime.utcnow()
 
-        await db.commit()
+        await self._commit_unique_name(db, tool_config.tool_name)
         await db.refresh(tool_config)
 
         logger.info(f"Updated external tool config: {tool_config.tool_name} (id={tool_id})")
@@ -561,21 +632,19 @@ class ExternalToolService:
 
         return encrypted_config
 
-    async def _update_metrics_for_user(
-        self, db: AsyncSession, user_id: int, tool_type: str
+    async def _update_metrics_for_tool_type(
+        self, db: AsyncSession, tool_type: str
     ) -> None:
         """
-        Update Prometheus metrics for user's tool configurations.
+        Update Prometheus metrics for all configurations of a tool type.
 
         Args:
             db: Database session
-            user_id: User ID
             tool_type: Tool type
         """
         # Count active configs
         active_stmt = select(func.count()).select_from(ExternalToolConfig).where(
             and_(
-                ExternalToolConfig.user_id == user_id,
                 ExternalToolConfig.tool_type == tool_type,
                 ExternalToolConfig.is_active == True,
             )
@@ -585,16 +654,13 @@ class ExternalToolService:
 
         # Count total configs
         total_stmt = select(func.count()).select_from(ExternalToolConfig).where(
-            and_(
-                ExternalToolConfig.user_id == user_id,
-                ExternalToolConfig.tool_type == tool_type,
-            )
+            ExternalToolConfig.tool_type == tool_type
         )
         total_result = await db.execute(total_stmt)
         total_count = total_result.scalar_one()
 
         # Update metrics
-        update_tool_config_gauges(tool_type, active_count, total_count, user_id)
+        update_tool_config_gauges(tool_type, active_count, total_count)
 
 
 # Global service instance
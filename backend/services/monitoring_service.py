@@ -1,17 +1,28 @@
 """Service layer for monitoring and analytics."""
 
+import asyncio
 from typing import Dict, Any, List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc, case
-from datetime import datetime, timedelta
-
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy import select, func, and_, desc, case, delete, insert, inspect
+from sqlalchemy.orm import raiseload
+from datetime import datetime, time, timedelta
+
+from core.cache import cache_result
+from core.config import settings
+from core.constants import (
+    EXECUTION_SUMMARY_ROLLUP_INTERVAL_SECONDS,
+    EXECUTION_SUMMARY_ROLLUP_LOCK_ID,
+)
+from core.database import AsyncSessionLocal, engine
 from models.agent import Agent
-from models.execution import Execution
+from models.execution import Execution, ExecutionDailySummary
 
 
 class MonitoringService:
     """Service for managing monitoring and analytics operations."""
 
+    @cache_result(ttl=30, key_prefix="monitoring:dashboard")  # 30 seconds cache
     async def get_dashboard_overview(
         self,
         db: AsyncSession,
@@ -39,11 +50,38 @@ class MonitoringService:
             query = query.where(Agent.created_by_id == user_id)
         total_agents = await db.scalar(query)
 
-        # Count total executions
-        query = select(func.count(Execution.id))
+        # Complete days come from the pre-aggregated summary; only executions
+        # created after the last summarized day are aggregated live
+        query = select(func.max(ExecutionDailySummary.date))
+        last_summary_date = await db.scalar(query)
+
+        query = select(
+            func.sum(ExecutionDailySummary.total_count),
+            func.sum(ExecutionDailySummary.success_count),
+            func.sum(ExecutionDailySummary.total_tokens),
+            func.sum(ExecutionDailySummary.total_cost),
+        )
+        if user_id:
+            query = query.where(ExecutionDailySummary.created_by_id == user_id)
+        summary = (await db.execute(query)).first()
+
+        query = select(
+            func.count(Execution.id),
+            func.sum(case((Execution.status == "completed", 1), else_=0)),
+            func.sum(Execution.total_tokens),
+            func.sum(Execution.estimated_cost),
+        )
+        if last_summary_date is not None:
+            live_since = datetime.combine(last_summary_date + timedelta(days=1), time.min)
+            query = query.where(Execution.created_at >= live_since)
         if user_id:
             query = query.where(Execution.created_by_id == user_id)
-        total_executions = await db.scalar(query)
+        live = (await db.execute(query)).first()
+
+        total_executions = (summary[0] or 0) + (live[0] or 0)
+        completed = (summary[1] or 0) + (live[1] or 0)
+        total_tokens = (summary[2] or 0) + (live[2] or 0)
+        total_cost = (summary[3] or 0) + (live[3] or 0)
 
         # Count executions today (last 24 hours)
         yesterday = datetime.utcnow() - timedelta(days=1)
@@ -54,30 +92,104 @@ class MonitoringService:
             query = query.where(Execution.created_by_id == user_id)
         executions_today = await db.scalar(query)
 
-        # Calculate success rate
-        success_rate = await self._calculate_success_rate(db, user_id)
-
-        # Sum token usage
-        query = select(func.sum(Execution.total_tokens))
-        if user_id:
-            query = query.where(Execution.created_by_id == user_id)
-        total_tokens = await db.scalar(query) or 0
-
-        # Sum costs
-        query = select(func.sum(Execution.estimated_cost))
-        if user_id:
-            query = query.where(Execution.created_by_id == user_id)
-        total_cost = await db.scalar(query) or 0.0
+        success_rate = (completed / total_executions) * 100 if total_executions else 0.0
 
         return {
             "total_agents": total_agents or 0,
-            "total_executions": total_executions or 0,
+            "total_executions": total_executions,
             "executions_today": executions_today or 0,
             "success_rate": success_rate,
             "total_tokens_used": total_tokens,
             "estimated_total_cost": float(total_cost),
         }
 
+    async def rollup_daily_summaries(
+        self,
+        db: AsyncSession,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        Recompute execution_daily_summary rows for recent complete days.
+
+        The first run summarizes all history; later runs recompute the last
+        summarized day onwards (so late status/token updates on executions
+        that finished after midnight are picked up). The current day is
+        never summarized; dashboards aggregate it live.
+
+        On PostgreSQL the rollup holds a transaction-level advisory lock,
+        so when several workers run it at once only one does the work.
+
+        Args:
+            db: Database session
+            now: Current UTC time (defaults to datetime.utcnow())
+
+        Returns:
+            Number of summary rows written (0 if another worker holds the lock)
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            locked = await db.scalar(
+                select(func.pg_try_advisory_xact_lock(EXECUTION_SUMMARY_ROLLUP_LOCK_ID))
+            )
+            if not locked:
+                await db.rollback()
+                return 0
+
+        today_start = datetime.combine((now or datetime.utcnow()).date(), time.min)
+
+        last_summary_date = await db.scalar(
+            select(func.max(ExecutionDailySummary.date))
+        )
+        since = (
+            datetime.combine(last_summary_date, time.min)
+            if last_summary_date is not None
+            else None
+        )
+
+        day = func.date(Execution.created_at)
+        window = [Execution.created_at < today_start]
+        if since is not None:
+            window.append(Execution.created_at >= since)
+
+        rollup = (
+            select(
+                Execution.agent_id,
+                Execution.created_by_id,
+                day,
+                func.count(Execution.id),
+                func.sum(case((Execution.status == "completed", 1), else_=0)),
+                func.sum(case((Execution.status == "failed", 1), else_=0)),
+                func.coalesce(func.sum(Execution.total_tokens), 0),
+                func.coalesce(func.sum(Execution.estimated_cost), 0),
+            )
+            .where(and_(*window))
+            .group_by(Execution.agent_id, Execution.created_by_id, day)
+        )
+
+        if since is not None:
+            await db.execute(
+                delete(ExecutionDailySummary).where(
+                    ExecutionDailySummary.date >= last_summary_date
+                )
+            )
+        result = await db.execute(
+            insert(ExecutionDailySummary).from_select(
+                [
+                    ExecutionDailySummary.agent_id,
+                    ExecutionDailySummary.created_by_id,
+                    ExecutionDailySummary.date,
+                    ExecutionDailySummary.total_count,
+                    ExecutionDailySummary.success_count,
+                    ExecutionDailySummary.error_count,
+                    ExecutionDailySummary.total_tokens,
+                    ExecutionDailySummary.total_cost,
+                ],
+                rollup,
+            )
+        )
+        await db.commit()
+
+        return result.rowcount
+
     async def _calculate_success_rate(
         self,
         db: AsyncSession,
@@ -135,26 +247,25 @@ class MonitoringService:
                 - avg_execution_time: Average execution time in seconds
                 - last_execution_at: Last execution timestamp (ISO format)
         """
-        # Build query to get agents
-        if agent_id:
-            agents_query = select(Agent).where(Agent.id == agent_id)
-        else:
-            agents_query = select(Agent).where(Agent.is_active == True)
-
-        result = await db.execute(agents_query)
-        agents = result.scalars().all()
-
-        if not agents:
-            return []
-
-        # Get all agent IDs
-        agent_ids = [agent.id for agent in agents]
-
-        # Pre-fetch execution statistics for all agents in a single query (fixes N+1 query issue)
-        # This query aggregates: total count, success count, error count, and last execution time
-        stats_query = (
+        # Agents and their execution statistics in a single grouped query:
+        # the outer join keeps agents without executions, and the average
+        # only covers completed runs (AVG ignores the CASE's NULLs).
+        completed_duration = case(
+            (
+                and_(
+                    Execution.status == "completed",
+                    Execution.completed_at.isnot(None),
+                    Execution.started_at.isnot(None)
+                ),
+                self._duration_seconds_expr(
+                    db, Execution.started_at, Execution.completed_at
+                )
+            )
+        )
+        query = (
             select(
-                Execution.agent_id,
+                Agent.id,
+                Agent.name,
                 func.count(Execution.id).label('total'),
                 func.sum(
                     case((Execution.status == "completed", 1), else_=0)
@@ -162,67 +273,61 @@ class MonitoringService:
                 func.sum(
                     case((Execution.status == "failed", 1), else_=0)
                 ).label('errors'),
+                func.avg(completed_duration).label('avg_duration'),
                 func.max(Execution.started_at).label('last_execution')
             )
-            .where(Execution.agent_id.in_(agent_ids))
-            .group_by(Execution.agent_id)
+            .outerjoin(Execution, Execution.agent_id == Agent.id)
+            .group_by(Agent.id, Agent.name)
+            .order_by(Agent.id)
         )
-        stats_result = await db.execute(stats_query)
-        stats_by_agent = {
-            row.agent_id: {
-                'total': row.total or 0,
-                'success': row.success or 0,
-                'errors': row.errors or 0,
-                'last_execution': row.last_execution
-            }
-            for row in stats_result
-        }
+        if agent_id:
+            query = query.where(Agent.id == agent_id)
+        else:
+            query = query.where(Agent.is_active == True)
 
-        # Pre-fetch average execution times for all agents in a single query
-        avg_time_query = (
-            select(
-                Execution.agent_id,
-                func.avg(
-                    func.extract('epoch', Execution.completed_at - Execution.started_at)
-                ).label('avg_duration')
-            )
-            .where(
-                and_(
-                    Execution.agent_id.in_(agent_ids),
-                    Execution.status == "completed",
-                    Execution.completed_at.isnot(None),
-                    Execution.started_at.isnot(None)
-                )
-            )
-            .group_by(Execution.agent_id)
-        )
-        avg_time_result = await db.execute(avg_time_query)
-        avg_times = {row.agent_id: float(row.avg_duration or 0.0) for row in avg_time_result}
+        result = await db.execute(query)
 
-        # Build health data from pre-fetched statistics
         health_data = []
-        for agent in agents:
-            stats = stats_by_agent.get(agent.id, {'total': 0, 'success': 0, 'errors': 0, 'last_execution': None})
-            avg_time = avg_times.get(agent.id, 0.0)
-
-            total = stats['total']
-            success = stats['success']
-            errors = stats['errors']
-            last_exec = stats['last_execution']
+        for row in result:
+            total = row.total or 0
+            success = row.success or 0
+            last_exec = row.last_execution
 
             health_data.append({
-                "agent_id": agent.id,
-                "agent_name": agent.name,
+                "agent_id": row.id,
+                "agent_name": row.name,
                 "total_executions": total,
                 "success_count": success,
-                "error_count": errors,
+                "error_count": row.errors or 0,
                 "success_rate": (success / total * 100) if total > 0 else 0.0,
-                "avg_execution_time": avg_time,
+                "avg_execution_time": float(row.avg_duration or 0.0),
                 "last_execution_at": last_exec.isoformat() if last_exec else None,
             })
 
         return health_data
 
+    def _duration_seconds_expr(self, db: AsyncSession, start_column, end_column):
+        """
+        Get database-specific expression for a duration in seconds.
+
+        PostgreSQL uses EXTRACT(epoch FROM ...); SQLite has no interval
+        type, so the julianday() difference is scaled to seconds and
+        rounded to milliseconds (julianday's float error is well below).
+
+        Args:
+            db: Database session
+            start_column: Start timestamp column
+            end_column: End timestamp column
+
+        Returns:
+            SQLAlchemy expression for duration in seconds
+        """
+        if db.get_bind().dialect.name == "sqlite":
+            return func.round(
+                (func.julianday(end_column) - func.julianday(start_column)) * 86400, 3
+            )
+        return func.extract('epoch', end_column - start_column)
+
     async def _calculate_avg_execution_time(
         self,
         db: AsyncSession,
@@ -238,30 +343,28 @@ class MonitoringService:
         Returns:
             Average execution time in seconds
         """
-        # Get completed executions with both timestamps
         query = (
-            select(Execution.started_at, Execution.completed_at)
+            select(
+                func.avg(
+                    self._duration_seconds_expr(
+                        db, Execution.started_at, Execution.completed_at
+                    )
+                )
+            )
             .where(
                 and_(
                     Execution.agent_id == agent_id,
                     Execution.status == "completed",
+                    Execution.started_at.isnot(None),
                     Execution.completed_at.isnot(None)
                 )
             )
         )
-        result = await db.execute(query)
-        executions = result.all()
+        avg_duration = await db.scalar(query)
 
-        if not executions:
-            return 0.0
-
-        durations = [
-            (completed - started).total_seconds()
-            for started, completed in executions
-        ]
-
-        return sum(durations) / len(durations)
+        return float(avg_duration or 0.0)
 
+    @cache_result(ttl=30, key_prefix="monitoring:execution_stats")  # 30 seconds cache
     async def get_execution_stats(
         self,
         db: AsyncSession,
@@ -281,23 +384,28 @@ class MonitoringService:
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        # Count by status
-        status_counts = {}
-        for status in ["pending", "running", "completed", "failed", "cancelled"]:
-            query = select(func.count(Execution.id)).where(
-                and_(
-                    Execution.status == status,
-                    Execution.created_at >= cutoff_date
-                )
-            )
-            count = await db.scalar(query) or 0
-            status_counts[status] = count
+        # Count by status in one grouped query; statuses with no
+        # executions are still reported as 0
+        status_counts = {
+            status: 0
+            for status in ["pending", "running", "completed", "failed", "cancelled"]
+        }
+        query = (
+            select(Execution.status, func.count(Execution.id))
+            .where(Execution.created_at >= cutoff_date)
+            .group_by(Execution.status)
+        )
+        result = await db.execute(query)
+        for status, count in result:
+            if status in status_counts:
+                status_counts[status] = count
 
         return {
             "by_status": status_counts,
             "period_days": days,
         }
 
+    @cache_result(ttl=30, key_prefix="monitoring:token_usage")  # 30 seconds cache
     async def get_token_usage_summary(
         self,
         db: AsyncSession,
@@ -346,6 +454,9 @@ class MonitoringService:
         """
         Get most recent executions.
 
+        Only column data is loaded; relationships raise on access instead
+        of lazily issuing one query per row.
+
         Args:
             db: Database session
             limit: Maximum number of executions to return
@@ -355,6 +466,7 @@ class MonitoringService:
         """
         query = (
             select(Execution)
+            .options(raiseload("*"))
             .order_by(desc(Execution.created_at))
             .limit(limit)
         )
@@ -369,6 +481,8 @@ class MonitoringService:
         """
         Get most recent failed executions.
 
+        Relationships are not loaded (see get_recent_executions).
+
         Args:
             db: Database session
             limit: Maximum number of errors to return
@@ -378,6 +492,7 @@ class MonitoringService:
         """
         query = (
             select(Execution)
+            .options(raiseload("*"))
             .where(Execution.status == "failed")
             .order_by(desc(Execution.created_at))
             .limit(limit)
@@ -388,3 +503,44 @@ class MonitoringService:
 
 # Singleton instance
 monitoring_service = MonitoringService()
+
+
+async def daily_summary_rollup_enabled(target_engine: AsyncEngine = engine) -> bool:
+    """
+    Check whether the summary rollup task should run against an engine.
+
+    The rollup is skipped under test and when the execution_daily_summary
+    table hasn't been created (migrations not applied yet).
+
+    Args:
+        target_engine: Engine the rollup would write through
+
+    Returns:
+        True if the rollup task should be started
+    """
+    if settings.ENVIRONMENT == "testing":
+        return False
+
+    async with target_engine.connect() as conn:
+        return await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table(
+                ExecutionDailySummary.__tablename__
+            )
+        )
+
+
+async def run_daily_summary_rollup() -> None:
+    """
+    Background task keeping execution_daily_summary up to date.
+
+    Started from the application lifespan when daily_summary_rollup_enabled()
+    allows it. Failures are logged and retried on the next interval.
+    """
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                rows = await monitoring_service.rollup_daily_summaries(db)
+            logger.debug(f"Execution summary rollup wrote {rows} rows")
+        except Exception as e:
+            logger.warning(f"Execution summary rollup failed: {e}")
+        await asyncio.sleep(EXECUTION_SUMMARY_ROLLUP_INTERVAL_SECONDS)
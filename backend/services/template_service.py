@@ -9,12 +9,17 @@ Handles all template-related business operations including:
 - Usage tracking
 """
 
+import hashlib
+import json
+from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_delete, cache_get, cache_set, invalidate_cache_pattern
+from core.constants import CACHE_TEMPLATE_COUNT_TTL
 from models.agent import Agent
 from models.template import Template
 from models.tool import Tool
@@ -28,6 +33,58 @@ from schemas.template import (
 )
 
 
+# ============================================================================
+# Response Cache Keys
+# ============================================================================
+
+# Upper bound of the ``limit`` query parameter on the featured/popular
+# endpoints. Each list is cached once at this length and sliced per request.
+TEMPLATE_LIST_MAX_LIMIT = 50
+
+
+def template_cache_key(name: str) -> str:
+    """
+    Build the Redis key for a cached template list response.
+
+    Args:
+        name: List name ("categories", "featured" or "popular")
+
+    Returns:
+        Cache key string
+    """
+    return f"cache:templates:{name}"
+
+
+def template_count_cache_key(
+    category: Optional[str],
+    is_public: Optional[bool],
+    is_featured: Optional[bool],
+    search: Optional[str],
+) -> str:
+    """Build the Redis key for a cached template list total."""
+    filters = json.dumps([category, is_public, is_featured, search])
+    digest = hashlib.blake2b(filters.encode(), digest_size=16).hexdigest()
+    return f"cache:templates:count:{digest}"
+
+
+async def invalidate_template_caches(*names: str) -> None:
+    """
+    Drop cached template list responses.
+
+    Call this after the write has committed; otherwise a concurrent read
+    can re-cache the old rows for a full TTL.
+
+    Args:
+        names: List names to invalidate (all lists and cached list totals
+            if none are given)
+    """
+    if not names:
+        await invalidate_cache_pattern("cache:templates:count:*")
+
+    names = names or ("categories", "featured", "popular")
+    await cache_delete(*(template_cache_key(name) for name in names))
+
+
 # ============================================================================
 # Custom Exceptions
 # ============================================================================
@@ -53,6 +110,14 @@ class TemplateValidationError(TemplateServiceError):
     pass
 
 
+class TemplatePermissionError(TemplateServiceError):
+    """Raised when a user modifies a template they did not create."""
+
+    def __init__(self, template_id: int):
+        self.template_id = template_id
+        super().__init__(f"Not authorized to modify template {template_id}")
+
+
 class DuplicateTemplateNameError(TemplateServiceError):
     """Raised when template name already exists."""
 
@@ -127,6 +192,9 @@ class TemplateService:
         db.add(template)
         await db.flush()
         await db.refresh(template)
+        await db.commit()
+
+        await invalidate_template_caches()
 
         return template
 
@@ -197,18 +265,29 @@ class TemplateService:
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> tuple[list[Template], int]:
         """
         List templates with filtering and pagination.
 
+        Results are ordered newest first by (created_at, id). Pass ``after``
+        (the last row's key from the previous page) for keyset pagination;
+        ``skip`` is kept for offset-based callers.
+
+        The total is not counted when the first page already holds every
+        match; otherwise it is cached per filter combination for
+        CACHE_TEMPLATE_COUNT_TTL seconds (and dropped on template writes),
+        so paging through a list doesn't repeat the COUNT on every page.
+
         Args:
             db: Database session
             category: Filter by category
             is_public: Filter by public/private
             is_featured: Filter by featured status
             search: Search in name, description, and tags
-            skip: Number of records to skip (offset)
+            skip: Number of records to skip (ignored when ``after`` is given)
             limit: Maximum number of records to return
+            after: Keyset cursor as (created_at, id) of the last seen row
 
         Returns:
             Tuple of (templates list, total count)
@@ -235,19 +314,43 @@ class TemplateService:
                 )
             )
 
-        # Get total count
         count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
 
         # Apply pagination and ordering
-        query = query.order_by(Template.use_count.desc(), Template.created_at.desc())
+        first_page = after is None and skip == 0
+        if after is not None:
+            after_created_at, after_id = after
+            query = query.where(
+                or_(
+                    Template.created_at < after_created_at,
+                    and_(
+                        Template.created_at == after_created_at,
+                        Template.id < after_id,
+                    ),
+                )
+            )
+            skip = 0
+
+        query = query.order_by(Template.created_at.desc(), Template.id.desc())
         query = query.offset(skip).limit(limit)
 
         # Execute query
         result = await db.execute(query)
         templates = list(result.scalars().all())
 
+        # Get total count (filters only, not the page position)
+        if first_page and len(templates) < limit:
+            return templates, len(templates)
+
+        count_key = template_count_cache_key(category, is_public, is_featured, search)
+        cached_total = await cache_get(count_key)
+        if cached_total is not None:
+            return templates, int(cached_total)
+
+        total_result = await db.execute(count_query)
+        total = total_result.scalar_one()
+        await cache_set(count_key, str(total), CACHE_TEMPLATE_COUNT_TTL)
+
         return templates, total
 
     async def update_template(
@@ -255,29 +358,36 @@ class TemplateService:
         db: AsyncSession,
         template_id: int,
         template_update: TemplateUpdate,
+        user_id: Optional[int] = None,
     ) -> Template:
         """
         Update an existing template.
 
+        The update and the ownership check are a single
+        ``UPDATE ... WHERE id = :id AND created_by_id = :user_id RETURNING``
+        statement; the template is only looked up separately when no row
+        matched, to tell a missing template from a foreign one.
+
         Args:
             db: Database session
             template_id: Template ID to update
             template_update: Template update data
+            user_id: If given, only update the template if this user created it
 
         Returns:
             Updated template instance
 
         Raises:
             TemplateNotFoundError: If template not found
+            TemplatePermissionError: If the template belongs to another user
             DuplicateTemplateNameError: If new name conflicts
             TemplateValidationError: If validation fails
         """
-        # Get existing template
-        template = await self.get_template(db, template_id)
-
-        # Validate name uniqueness if changed
-        if template_update.name and template_update.name != template.name:
-            await self._validate_name_unique(db, template_update.name)
+        # Validate name uniqueness against other templates
+        if template_update.name:
+            await self._validate_name_unique(
+                db, template_update.name, exclude_id=template_id
+            )
 
         # Validate tool IDs if config_template is being updated
         if template_update.config_template:
@@ -285,21 +395,30 @@ class TemplateService:
                 db, template_update.config_template.tool_ids
             )
 
-        # Update fields
-        update_data = template_update.model_dump(exclude_unset=True)
+        # JSON mode turns the category enum and config_template model into
+        # their stored representations
+        update_data = template_update.model_dump(exclude_unset=True, mode="json")
+
+        conditions = self._owned_template_conditions(template_id, user_id)
+        if update_data:
+            stmt = (
+                update(Template)
+                .where(*conditions)
+                .values(**update_data)
+                .returning(Template)
+                .execution_options(populate_existing=True)
+            )
+        else:
+            stmt = select(Template).where(*conditions)
 
-        for field, value in update_data.items():
-            if field == "category" and value:
-                # Convert enum to string
-                setattr(template, field, value.value)
-            elif field == "config_template" and value:
-                # Convert Pydantic model to dict
-                setattr(template, field, value.model_dump())
-            else:
-                setattr(template, field, value)
+        result = await db.execute(stmt)
+        template = result.scalar_one_or_none()
 
-        await db.flush()
-        await db.refresh(template)
+        if template is None:
+            await self._raise_not_owned(db, template_id)
+
+        await db.commit()
+        await invalidate_template_caches()
 
         return template
 
@@ -308,26 +427,42 @@ class TemplateService:
         db: AsyncSession,
         template_id: int,
         hard_delete: bool = False,
+        user_id: Optional[int] = None,
     ) -> None:
         """
         Delete a template (soft or hard delete).
 
+        Like update_template(), this is a single statement with the
+        ownership check in its WHERE clause.
+
         Args:
             db: Database session
             template_id: Template ID to delete
             hard_delete: If True, permanently delete; if False, soft delete
+            user_id: If given, only delete the template if this user created it
 
         Raises:
             TemplateNotFoundError: If template not found
+            TemplatePermissionError: If the template belongs to another user
         """
-        template = await self.get_template(db, template_id)
+        conditions = self._owned_template_conditions(template_id, user_id)
 
         if hard_delete:
-            await db.delete(template)
+            stmt = delete(Template).where(*conditions).returning(Template.id)
         else:
-            template.is_active = False
+            stmt = (
+                update(Template)
+                .where(*conditions)
+                .values(is_active=False)
+                .returning(Template.id)
+            )
 
-        await db.flush()
+        result = await db.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            await self._raise_not_owned(db, template_id)
+
+        await db.commit()
+        await invalidate_template_caches()
 
     async def count_templates(
         self,
@@ -479,6 +614,9 @@ class TemplateService:
         """
         Increment template use count.
 
+        A single ``UPDATE ... SET use_count = use_count + 1 RETURNING``
+        statement, so concurrent increments are never lost.
+
         Args:
             db: Database session
             template_id: Template ID
@@ -489,11 +627,11 @@ class TemplateService:
         Raises:
             TemplateNotFoundError: If template not found
         """
-        template = await self.get_template(db, template_id)
-        template.use_count += 1
+        template = await self._increment_use_count(db, template_id)
 
-        await db.flush()
-        await db.refresh(template)
+        await db.commit()
+        # Both featured and popular lists are ordered by use_count
+        await invalidate_template_caches("featured", "popular")
 
         return template
 
@@ -588,8 +726,8 @@ class TemplateService:
         # Get template
         template = await self.get_template(db, agent_data.template_id)
 
-        # Increment template use count
-        await self.increment_use_count(db, template.id)
+        # Increment template use count (committed with the agent below)
+        await self._increment_use_count(db, template.id)
 
         # Merge template config with overrides
         config = template.config_template.copy()
@@ -653,6 +791,9 @@ class TemplateService:
 
         await db.flush()
         await db.refresh(agent)
+        await db.commit()
+
+        await invalidate_template_caches("featured", "popular")
 
         return agent
 
@@ -660,6 +801,55 @@ class TemplateService:
     # Private Helper Methods
     # ========================================================================
 
+    async def _increment_use_count(
+        self, db: AsyncSession, template_id: int
+    ) -> Template:
+        """
+        Increment a template's use count without committing.
+
+        Raises:
+            TemplateNotFoundError: If template not found
+        """
+        result = await db.execute(
+            update(Template)
+            .where(Template.id == template_id, Template.is_active == True)
+            .values(use_count=Template.use_count + 1)
+            .returning(Template)
+            .execution_options(populate_existing=True)
+        )
+        template = result.scalar_one_or_none()
+
+        if template is None:
+            raise TemplateNotFoundError(template_id)
+
+        return template
+
+    def _owned_template_conditions(
+        self, template_id: int, user_id: Optional[int]
+    ) -> list:
+        """Build WHERE conditions matching an active template (optionally owned)."""
+        conditions = [Template.id == template_id, Template.is_active == True]
+        if user_id is not None:
+            conditions.append(Template.created_by_id == user_id)
+        return conditions
+
+    async def _raise_not_owned(self, db: AsyncSession, template_id: int) -> None:
+        """
+        Explain why a conditional write matched no rows.
+
+        Raises:
+            TemplatePermissionError: If the template exists
+            TemplateNotFoundError: Otherwise
+        """
+        result = await db.execute(
+            select(Template.id).where(
+                Template.id == template_id, Template.is_active == True
+            )
+        )
+        if result.scalar_one_or_none() is not None:
+            raise TemplatePermissionError(template_id)
+        raise TemplateNotFoundError(template_id)
+
     async def _validate_name_unique(
         self,
         db: AsyncSession,
@@ -8,12 +8,17 @@ in the tool marketplace.
 from typing import Any, Optional
 
 from loguru import logger
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import cache_result, invalidate_cache_pattern
+from core.constants import CACHE_LONG_TTL
 from models.tool import Tool
 from schemas.tool import ToolCreate, ToolUpdate
 
+# Redis keys for the cached tool category list
+TOOL_CATEGORIES_CACHE_PATTERN = "cache:tool_categories:*"
+
 
 class ToolService:
     """Service layer for tool management."""
@@ -60,6 +65,7 @@ class ToolService:
         db.add(tool)
         await db.commit()
         await db.refresh(tool)
+        await invalidate_cache_pattern(TOOL_CATEGORIES_CACHE_PATTERN)
 
         logger.info(f"Created tool: {tool.name} (ID: {tool.id}, Type: {tool.tool_type})")
 
@@ -82,6 +88,32 @@ class ToolService:
         """
         return await db.get(Tool, tool_id)
 
+    @staticmethod
+    def _filter_conditions(
+        tool_type: Optional[str],
+        search: Optional[str],
+        is_active: Optional[bool],
+    ) -> list:
+        """Build the WHERE conditions shared by listing and counting."""
+        conditions = []
+
+        if tool_type:
+            conditions.append(Tool.tool_type == tool_type)
+
+        if search:
+            search_term = f"%{search}%"
+            conditions.append(
+                or_(
+                    Tool.name.ilike(search_term),
+                    Tool.description.ilike(search_term),
+                )
+            )
+
+        if is_active is not None:
+            conditions.append(Tool.is_active == is_active)
+
+        return conditions
+
     async def list_tools(
         self,
         db: AsyncSession,
@@ -107,24 +139,7 @@ class ToolService:
         """
         query = select(Tool)
 
-        # Build filters
-        conditions = []
-
-        if tool_type:
-            conditions.append(Tool.tool_type == tool_type)
-
-        if search:
-            search_term = f"%{search}%"
-            conditions.append(
-                or_(
-                    Tool.name.ilike(search_term),
-                    Tool.description.ilike(search_term),
-                )
-            )
-
-        if is_active is not None:
-            conditions.append(Tool.is_active == is_active)
-
+        conditions = self._filter_conditions(tool_type, search, is_active)
         if conditions:
             query = query.where(and_(*conditions))
 
@@ -141,6 +156,51 @@ class ToolService:
 
         return tools
 
+    async def list_tools_with_total(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        tool_type: Optional[str] = None,
+        search: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> tuple[list[Tool], int]:
+        """
+        List tools together with the total number of matching tools.
+
+        The total is selected as ``COUNT(*) OVER ()`` next to each row, so
+        the page and its count come from one filtered scan and one round
+        trip. A page past the end has no rows to carry the total, so only
+        then is count_tools() queried.
+
+        Args:
+            db: Database session
+            skip: Pagination offset
+            limit: Maximum results
+            tool_type: Filter by tool type (builtin, custom, langgraph)
+            search: Search in name and description
+            is_active: Filter by active status
+
+        Returns:
+            Tuple of (tools, total matching tools)
+        """
+        query = select(Tool, func.count().over().label("total_count"))
+
+        conditions = self._filter_conditions(tool_type, search, is_active)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        query = query.order_by(Tool.created_at.desc()).offset(skip).limit(limit)
+
+        result = await db.execute(query)
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if skip == 0:
+            return [], 0
+        return [], await self.count_tools(db, tool_type, search, is_active)
+
     async def update_tool(
         self,
         db: AsyncSession,
@@ -172,6 +232,8 @@ class ToolService:
 
         await db.commit()
         await db.refresh(tool)
+        if "tool_type" in update_data:
+            await invalidate_cache_pattern(TOOL_CATEGORIES_CACHE_PATTERN)
 
         logger.info(f"Updated tool: {tool.name} (ID: {tool.id})")
 
@@ -206,12 +268,18 @@ class ToolService:
             logger.info(f"Soft deleted tool: {tool.name} (ID: {tool.id})")
 
         await db.commit()
+        if hard_delete:
+            await invalidate_cache_pattern(TOOL_CATEGORIES_CACHE_PATTERN)
         return True
 
+    @cache_result(ttl=CACHE_LONG_TTL, key_prefix="tool_categories")
     async def get_tool_categories(self, db: AsyncSession) -> list[str]:
         """
         Get list of tool types/categories.
 
+        Cached; creating a tool, changing a tool's type or hard-deleting a
+        tool drops the cached list.
+
         Args:
             db: Database session
 
@@ -245,31 +313,13 @@ class ToolService:
         Returns:
             Total count of matching tools
         """
-        query = select(Tool)
-
-        # Build filters
-        conditions = []
-
-        if tool_type:
-            conditions.append(Tool.tool_type == tool_type)
-
-        if search:
-            search_term = f"%{search}%"
-            conditions.append(
-                or_(
-                    Tool.name.ilike(search_term),
-                    Tool.description.ilike(search_term),
-                )
-            )
-
-        if is_active is not None:
-            conditions.append(Tool.is_active == is_active)
+        query = select(func.count()).select_from(Tool)
 
+        conditions = self._filter_conditions(tool_type, search, is_active)
         if conditions:
             query = query.where(and_(*conditions))
 
-        result = await db.execute(query)
-        return len(result.scalars().all())
+        return await db.scalar(query)
 
 
 # Singleton instance
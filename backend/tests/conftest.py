@@ -16,7 +16,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 import redis.asyncio as redis_async
 
-from core.database import Base, get_db
+from core.database import Base, get_db, get_db_read, get_db_ro
 from core.config import settings
 from models.agent import Agent
 
@@ -124,7 +124,7 @@ def client(db_session: AsyncSession, test_user: "User") -> Generator:
     """
     # Import app here to avoid circular imports
     from main import app
-    from core.dependencies import get_current_active_user
+    from core.dependencies import get_current_active_user, get_current_active_user_read
 
     # Override database dependency
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -135,7 +135,12 @@ def client(db_session: AsyncSession, test_user: "User") -> Generator:
         return test_user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_ro] = override_get_db
+    app.dependency_overrides[get_db_read] = override_get_db
     app.dependency_overrides[get_current_active_user] = override_get_current_active_user
+    app.dependency_overrides[get_current_active_user_read] = (
+        override_get_current_active_user
+    )
 
     with TestClient(app) as test_client:
         yield test_client
@@ -166,6 +171,8 @@ def client_no_auth(db_session: AsyncSession) -> Generator:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_ro] = override_get_db
+    app.dependency_overrides[get_db_read] = override_get_db
 
     with TestClient(app) as test_client:
         yield test_client
@@ -282,6 +289,31 @@ async def test_agent(db_session: AsyncSession, test_user_id: int) -> Agent:
     return agent
 
 
+@pytest.fixture(autouse=True)
+async def isolated_cache(monkeypatch) -> AsyncGenerator:
+    """
+    Give every test its own empty result cache.
+
+    Service methods decorated with cache_result would otherwise serve
+    results cached by earlier tests (IDs and data are reused across the
+    per-test databases).
+
+    Yields:
+        FakeRedis: The client returned by core.cache.get_redis_client()
+    """
+    import fakeredis.aioredis
+
+    import core.cache
+    from services.auth_service import AuthService
+
+    redis_client = fakeredis.aioredis.FakeRedis()
+    monkeypatch.setattr(core.cache, "_redis_client", redis_client)
+    core.cache._local_results.clear()
+    AuthService.clear_token_user_cache()
+    yield redis_client
+    await redis_client.aclose()
+
+
 @pytest.fixture(scope="function")
 async def clean_redis() -> AsyncGenerator[None, None]:
     """
@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from models.agent import Agent
 from models.execution import Execution, Trace
 from models.user import User
+from schemas.execution import TraceResponse
 
 
 @pytest.mark.asyncio
@@ -105,6 +106,52 @@ class TestExecutionAPIEndpoints:
         assert data["agent_id"] == agent.id
         assert data["input_prompt"] == "Test prompt"
 
+    async def test_get_execution_cache_headers(
+        self, client: TestClient, db_session: AsyncSession, test_user: User
+    ):
+        """Test terminal executions are immutable and running ones uncached."""
+        agent = Agent(
+            name="Test Agent",
+            model_provider="anthropic",
+            model_name="claude-3-5-sonnet-20241022",
+            temperature=0.7,
+            created_by_id=test_user.id,
+        )
+        db_session.add(agent)
+        await db_session.commit()
+        await db_session.refresh(agent)
+
+        running = Execution(
+            agent_id=agent.id,
+            input_prompt="Running",
+            status="running",
+            created_by_id=test_user.id,
+        )
+        completed = Execution(
+            agent_id=agent.id,
+            input_prompt="Done",
+            status="completed",
+            created_by_id=test_user.id,
+        )
+        db_session.add_all([running, completed])
+        await db_session.commit()
+        await db_session.refresh(running)
+        await db_session.refresh(completed)
+
+        response = client.get(f"/api/v1/executions/{running.id}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["cache-control"] == "no-store"
+        assert "etag" not in response.headers
+
+        response = client.get(f"/api/v1/executions/{completed.id}")
+        assert response.status_code == status.HTTP_200_OK
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["etag"].startswith(f'"{completed.id}-completed-')
+
+        response = client.get(f"/api/v1/executions/{completed.id}/traces")
+        assert response.status_code == status.HTTP_200_OK
+        assert "immutable" in response.headers["cache-control"]
+
     async def test_get_execution_not_found(
         self, client: TestClient, db_session: AsyncSession
     ):
@@ -200,6 +247,61 @@ class TestExecutionAPIEndpoints:
         assert len(data) == 1
         assert data[0]["status"] == "completed"
 
+    async def test_list_executions_agent_filter_ownership(
+        self, client: TestClient, db_session: AsyncSession, test_user: User
+    ):
+        """Test agent filter returns 404/403/empty when nothing matches."""
+        other_user = User(
+            username="otheruser",
+            email="otheruser@example.com",
+            hashed_password="hashed_password",
+            is_active=True,
+        )
+        db_session.add(other_user)
+        await db_session.commit()
+        await db_session.refresh(other_user)
+
+        own_agent = Agent(
+            name="Own Agent",
+            model_provider="anthropic",
+            model_name="claude-3-5-sonnet-20241022",
+            temperature=0.7,
+            created_by_id=test_user.id,
+        )
+        other_agent = Agent(
+            name="Other Agent",
+            model_provider="anthropic",
+            model_name="claude-3-5-sonnet-20241022",
+            temperature=0.7,
+            created_by_id=other_user.id,
+        )
+        db_session.add_all([own_agent, other_agent])
+        await db_session.commit()
+        await db_session.refresh(own_agent)
+        await db_session.refresh(other_agent)
+
+        db_session.add(
+            Execution(
+                agent_id=other_agent.id,
+                input_prompt="Other",
+                created_by_id=other_user.id,
+            )
+        )
+        await db_session.commit()
+
+        # Own agent without executions -> empty list
+        response = client.get(f"/api/v1/executions/?agent_id={own_agent.id}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+        # Someone else's agent -> 403
+        response = client.get(f"/api/v1/executions/?agent_id={other_agent.id}")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        # Unknown agent -> 404
+        response = client.get("/api/v1/executions/?agent_id=999999")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     async def test_cancel_execution_endpoint(
         self, client: TestClient, db_session: AsyncSession, test_user: User
     ):
@@ -322,6 +424,76 @@ class TestExecutionAPIEndpoints:
         assert len(data) == 2
         assert data[0]["sequence_number"] == 0
         assert data[1]["sequence_number"] == 1
+        # Streamed items must still match the documented schema
+        for item in data:
+            TraceResponse.model_validate(item)
+
+    async def test_get_traces_empty(
+        self, client: TestClient, db_session: AsyncSession, test_user: User
+    ):
+        """Test streamed traces endpoint returns a valid empty JSON array."""
+        agent = Agent(
+            name="Test Agent",
+            model_provider="anthropic",
+            model_name="claude-3-5-sonnet-20241022",
+            temperature=0.7,
+            created_by_id=test_user.id,
+        )
+        db_session.add(agent)
+        await db_session.commit()
+        await db_session.refresh(agent)
+
+        execution = Execution(
+            agent_id=agent.id, input_prompt="Test", created_by_id=test_user.id
+        )
+        db_session.add(execution)
+        await db_session.commit()
+        await db_session.refresh(execution)
+
+        response = client.get(f"/api/v1/executions/{execution.id}/traces")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == []
+
+    async def test_get_traces_query_error(
+        self, client: TestClient, db_session: AsyncSession, test_user: User, monkeypatch
+    ):
+        """Test a failing trace query is a 500, not a truncated 200 body."""
+        from main import app
+        from services.execution_service import execution_service
+
+        agent = Agent(
+            name="Test Agent",
+            model_provider="anthropic",
+            model_name="claude-3-5-sonnet-20241022",
+            temperature=0.7,
+            created_by_id=test_user.id,
+        )
+        db_session.add(agent)
+        await db_session.commit()
+        await db_session.refresh(agent)
+
+        execution = Execution(
+            agent_id=agent.id, input_prompt="Test", created_by_id=test_user.id
+        )
+        db_session.add(execution)
+        await db_session.commit()
+        await db_session.refresh(execution)
+
+        async def failing_stream(db, execution_id, skip=0, limit=1000):
+            raise RuntimeError("database is down")
+            yield
+
+        monkeypatch.setattr(
+            execution_service, "stream_execution_traces", failing_stream
+        )
+
+        raw_client = TestClient(app, raise_server_exceptions=False)
+        response = raw_client.get(f"/api/v1/executions/{execution.id}/traces")
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json()["detail"] == "Internal server error"
 
     async def test_get_traces_with_pagination(
         self, client: TestClient, db_session: AsyncSession, test_user: User
@@ -370,3 +542,49 @@ class TestExecutionAPIEndpoints:
         data = response.json()
         assert len(data) == 2
         assert data[0]["sequence_number"] == 0
+
+
+@pytest.mark.asyncio
+class TestStreamHandshakeHelpers:
+    """Test suite for WebSocket handshake authorization helpers."""
+
+    async def test_get_stream_owner_is_active(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test ownership and active flag are resolved in one lookup."""
+        from api.v1.executions import get_stream_owner_is_active
+
+        agent = Agent(
+            name="Test Agent",
+            model_provider="anthropic",
+            model_name="claude-3-5-sonnet-20241022",
+            temperature=0.7,
+            created_by_id=test_user.id,
+        )
+        db_session.add(agent)
+        await db_session.commit()
+        await db_session.refresh(agent)
+
+        execution = Execution(
+            agent_id=agent.id, input_prompt="Test", created_by_id=test_user.id
+        )
+        db_session.add(execution)
+        await db_session.commit()
+        await db_session.refresh(execution)
+
+        assert await get_stream_owner_is_active(
+            execution.id, test_user.id, db_session
+        ) is True
+        # Not the owner / unknown execution -> None
+        assert await get_stream_owner_is_active(
+            execution.id, test_user.id + 1, db_session
+        ) is None
+        assert await get_stream_owner_is_active(
+            999999, test_user.id, db_session
+        ) is None
+
+        test_user.is_active = False
+        await db_session.commit()
+        assert await get_stream_owner_is_active(
+            execution.id, test_user.id, db_session
+        ) is False
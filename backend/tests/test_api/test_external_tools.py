@@ -0,0 +1,347 @@
+"""
+Tests for External Tools API endpoints.
+
+Tests listing, pagination and caching of external tool configurations.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from cryptography.fernet import Fernet
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.external_tool import ExternalToolConfig
+from models.user import User
+
+
+@pytest.fixture
+def encryption_key(monkeypatch):
+    """Provide a credential encryption key and a fresh encryptor."""
+    from core.encryption import get_encryptor
+
+    monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    get_encryptor.cache_clear()
+    yield
+    get_encryptor.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_config_cache():
+    """Per-test databases reuse IDs, so start every test with an empty cache."""
+    from api.v1.external_tools import _tool_config_cache
+
+    _tool_config_cache.clear()
+    yield
+    _tool_config_cache.clear()
+
+
+async def _create_configs(
+    db_session: AsyncSession, user: User, count: int
+) -> list[ExternalToolConfig]:
+    """Create tool configs with distinct, increasing created_at values."""
+    base = datetime(2025, 1, 1)
+    configs = [
+        ExternalToolConfig(
+            user_id=user.id,
+            tool_name=f"http_tool_{i}",
+            tool_type="http",
+            provider="langchain",
+            configuration={"base_url": f"https://api{i}.example.com"},
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(configs)
+    await db_session.commit()
+    return configs
+
+
+# ============================================================================
+# Create / Update Tool Config Endpoint Tests
+# ============================================================================
+
+
+def _http_tool_payload(name: str) -> dict:
+    return {
+        "tool_name": name,
+        "tool_type": "http",
+        "provider": "langchain",
+        "configuration": {"base_url": "https://api.example.com"},
+    }
+
+
+def test_create_tool_config_duplicate_name(client: TestClient, encryption_key):
+    """Test POST /api/v1/external-tools/ - duplicate name returns 409."""
+    response = client.post("/api/v1/external-tools/", json=_http_tool_payload("dup"))
+    assert response.status_code == 201
+
+    response = client.post("/api/v1/external-tools/", json=_http_tool_payload("dup"))
+    assert response.status_code == 409
+    assert "already exists" in response.json()["detail"]
+
+
+def test_only_tool_name_index_maps_to_duplicate():
+    """Test other integrity errors aren't reported as duplicate names."""
+    import sqlite3
+
+    from sqlalchemy.exc import IntegrityError
+
+    from services.external_tool_service import _violates_tool_name_index
+
+    def integrity_error(orig):
+        return IntegrityError("INSERT ...", {}, orig)
+
+    duplicate = sqlite3.IntegrityError(
+        "UNIQUE constraint failed: "
+        "external_tool_configs.user_id, external_tool_configs.tool_name"
+    )
+    not_null = sqlite3.IntegrityError(
+        "NOT NULL constraint failed: external_tool_configs.provider"
+    )
+    assert _violates_tool_name_index(integrity_error(duplicate))
+    assert not _violates_tool_name_index(integrity_error(not_null))
+
+    # asyncpg: the adapted DBAPI error wraps the driver error
+    class DriverError(Exception):
+        def __init__(self, constraint_name):
+            self.constraint_name = constraint_name
+
+    for constraint, expected in (
+        ("idx_external_tool_configs_user_tool_name", True),
+        ("external_tool_configs_user_id_fkey", False),
+    ):
+        orig = Exception("violation")
+        orig.__cause__ = DriverError(constraint)
+        assert _violates_tool_name_index(integrity_error(orig)) is expected
+
+
+@pytest.mark.asyncio
+async def test_update_tool_config_rename_conflict(
+    client: TestClient, db_session: AsyncSession, encryption_key
+):
+    """Test PUT /api/v1/external-tools/{id} - renaming onto an existing name."""
+    first = client.post("/api/v1/external-tools/", json=_http_tool_payload("first"))
+    second = client.post("/api/v1/external-tools/", json=_http_tool_payload("second"))
+    assert first.status_code == second.status_code == 201
+    second_id = second.json()["id"]
+
+    response = client.put(
+        f"/api/v1/external-tools/{second_id}",
+        json={"tool_name": "first"},
+    )
+    assert response.status_code == 409
+
+    # The failed rename was rolled back
+    result = await db_session.execute(
+        select(ExternalToolConfig.tool_name).where(ExternalToolConfig.id == second_id)
+    )
+    assert result.scalar_one() == "second"
+
+
+# ============================================================================
+# Get Tool Config Endpoint Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_tool_config_cached(
+    client: TestClient, db_session: AsyncSession, test_user: User
+):
+    """Test GET /api/v1/external-tools/{id} - repeat reads served from cache."""
+    [config] = await _create_configs(db_session, test_user, 1)
+    url = f"/api/v1/external-tools/{config.id}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+
+    # A write that bypasses the API is not seen until the entry expires
+    config.tool_name = "renamed_directly"
+    await db_session.commit()
+
+    assert client.get(url).json() == first.json()
+
+
+def test_get_tool_config_invalidated_on_update(client: TestClient, encryption_key):
+    """Test GET /api/v1/external-tools/{id} - update and delete drop the entry."""
+    created = client.post("/api/v1/external-tools/", json=_http_tool_payload("cached"))
+    assert created.status_code == 201
+    url = f"/api/v1/external-tools/{created.json()['id']}"
+
+    assert client.get(url).json()["tool_name"] == "cached"
+
+    response = client.put(url, json={"tool_name": "renamed"})
+    assert response.status_code == 200
+    assert client.get(url).json()["tool_name"] == "renamed"
+
+    assert client.delete(url).status_code == 204
+    assert client.get(url).status_code == 404
+
+
+def test_local_ttl_cache_expiry_and_eviction():
+    """Test LocalTTLCache - oldest entry is evicted and expired entries dropped."""
+    from core.cache import LocalTTLCache
+
+    cache = LocalTTLCache(ttl=30, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    expired = LocalTTLCache(ttl=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+    assert len(expired) == 0
+
+
+# ============================================================================
+# List Tool Configs Endpoint Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_list_tool_configs_cursor_pagination(
+    client: TestClient, db_session: AsyncSession, test_user: User
+):
+    """Test GET /api/v1/external-tools/ - walking pages with next_cursor."""
+    await _create_configs(db_session, test_user, 5)
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/external-tools/?page_size=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        seen.extend(item["tool_name"] for item in data["items"])
+        cursor = data["next_cursor"]
+        assert data["has_more"] is (cursor is not None)
+        if not cursor:
+            break
+
+    # Newest first, every config exactly once
+    assert seen == [f"http_tool_{i}" for i in range(4, -1, -1)]
+
+
+@pytest.mark.asyncio
+async def test_list_tool_configs_page_fallback(
+    client: TestClient, db_session: AsyncSession, test_user: User
+):
+    """Test GET /api/v1/external-tools/ - deprecated page parameter still works."""
+    await _create_configs(db_session, test_user, 3)
+
+    response = client.get("/api/v1/external-tools/?page=2&page_size=2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["tool_name"] for item in data["items"]] == ["http_tool_0"]
+    assert data["has_more"] is False
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_tool_configs_total_past_last_page(
+    client: TestClient, db_session: AsyncSession, test_user: User
+):
+    """Test GET /api/v1/external-tools/ - total is reported for empty pages."""
+    await _create_configs(db_session, test_user, 3)
+
+    response = client.get("/api/v1/external-tools/?page=5&page_size=2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == 3
+
+    response = client.get("/api/v1/external-tools/?tool_type=postgresql")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == 0
+
+
+def test_list_tool_configs_query_error(client: TestClient, monkeypatch):
+    """Test GET /api/v1/external-tools/ - a failing query is a plain 500."""
+    from main import app
+    from services.external_tool_service import external_tool_service
+
+    async def failing_stream(db, **kwargs):
+        raise RuntimeError("database is down")
+        yield
+
+    monkeypatch.setattr(
+        external_tool_service, "stream_tool_configs_with_total", failing_stream
+    )
+
+    response = TestClient(app, raise_server_exceptions=False).get(
+        "/api/v1/external-tools/"
+    )
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Internal server error"
+
+
+def test_list_tool_configs_invalid_cursor(client: TestClient):
+    """Test GET /api/v1/external-tools/ - malformed cursor is rejected."""
+    response = client.get("/api/v1/external-tools/?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+
+
+# ============================================================================
+# Tool Catalog Endpoint Tests
+# ============================================================================
+
+
+def test_get_tool_catalog(client: TestClient):
+    """Test GET /api/v1/external-tools/catalog/all - cached body with ETag."""
+    response = client.get("/api/v1/external-tools/catalog/all")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == len(data["langchain_tools"]) > 0
+    assert response.headers["cache-control"] == "public, max-age=300"
+    etag = response.headers["etag"]
+
+    # Same bytes on repeat requests
+    repeat = client.get("/api/v1/external-tools/catalog/all")
+    assert repeat.content == response.content
+    assert repeat.headers["etag"] == etag
+
+    # Conditional request skips the body
+    conditional = client.get(
+        "/api/v1/external-tools/catalog/all", headers={"If-None-Match": etag}
+    )
+    assert conditional.status_code == 304
+    assert conditional.content == b""
+
+
+# ============================================================================
+# Connection Test Endpoint Tests
+# ============================================================================
+
+
+def test_tool_connection_response_shape(client: TestClient, monkeypatch):
+    """Test POST /api/v1/external-tools/{id}/test - service dict is validated."""
+    from services.external_tool_service import external_tool_service
+
+    async def fake_test_connection(db, user_id, tool_id, override_config=None):
+        return {"success": True, "message": "ok", "internal": "dropped"}
+
+    monkeypatch.setattr(external_tool_service, "test_connection", fake_test_connection)
+
+    response = client.post("/api/v1/external-tools/1/test")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["message"] == "ok"
+    assert data["tested_at"] is not None
+    assert "internal" not in data
+
@@ -0,0 +1,225 @@
+"""
+Tests for Prometheus metrics endpoint.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics_rendering(monkeypatch):
+    """Render every scrape afresh so tests see metrics they just recorded."""
+    import api.v1.metrics as metrics_module
+
+    monkeypatch.setattr(metrics_module, "_rendered_metrics", None)
+    monkeypatch.setattr(metrics_module, "METRICS_RENDER_TTL_SECONDS", 0.0)
+
+
+def test_metrics_plain_text(client: TestClient):
+    """Test GET /api/v1/metrics - uncompressed exposition format."""
+    response = client.get(
+        "/api/v1/metrics", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "content-encoding" not in response.headers
+    assert b"http_requests_total" in response.content
+
+
+def test_metrics_gzip(client: TestClient):
+    """Test GET /api/v1/metrics - gzip when the scraper accepts it."""
+    response = client.get(
+        "/api/v1/metrics", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    # The test client transparently decodes gzip bodies
+    assert b"http_requests_total" in response.content
+
+
+def test_metrics_entity_counts(client: TestClient, monkeypatch):
+    """Test GET /api/v1/metrics - user/agent/template gauges are populated."""
+    import api.v1.metrics as metrics_module
+
+    # Force a refresh regardless of earlier scrapes in this process
+    monkeypatch.setattr(metrics_module, "_app_stats_refreshed_at", 0.0)
+
+    response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert b"total_users 1.0" in response.content
+    assert b"active_users_total 1.0" in response.content
+    assert b"total_agents 0.0" in response.content
+
+
+def test_metrics_app_registry_only(client: TestClient):
+    """Test GET /api/v1/metrics - only app and process metrics are exported."""
+    response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert b"tool_executions_total" in response.content
+    assert b"python_gc_objects_collected_total" not in response.content
+    assert b"python_info" not in response.content
+
+
+def test_metrics_endpoint_label_uses_route_template(client: TestClient):
+    """Test HTTP metrics are labelled by route template, not raw path."""
+    client.get("/api/v1/agents/987654")
+    client.get("/no/such/path/123")
+
+    content = client.get("/api/v1/metrics").text
+
+    assert 'endpoint="/api/v1/agents/{agent_id}"' in content
+    assert 'endpoint="unmatched"' in content
+    assert "987654" not in content
+    assert "/no/such/path" not in content
+
+
+def test_metrics_endpoint_label_built_once(client: TestClient, monkeypatch):
+    """Test the endpoint label is built on the first request to a route only."""
+    from core.middleware import MetricsMiddleware
+
+    built = []
+    route_label = MetricsMiddleware._route_label
+
+    def counting_route_label(route, path):
+        built.append(path)
+        return route_label(route, path)
+
+    monkeypatch.setattr(
+        MetricsMiddleware, "_route_label", staticmethod(counting_route_label)
+    )
+
+    client.get("/api/v1/agents/41")
+    client.get("/api/v1/agents/42")
+
+    assert built.count("/api/v1/agents/42") == 0
+    content = client.get("/api/v1/metrics").text
+    assert 'endpoint="/api/v1/agents/{agent_id}"' in content
+
+
+def test_bounded_label_overflow():
+    """Test BoundedLabel maps values past the limit to the overflow value."""
+    from core.metrics_registry import BoundedLabel
+
+    label = BoundedLabel("test_label", limit=2)
+
+    assert label(1) == "1"
+    assert label(2) == "2"
+    assert label(3) == "_other_"
+    # Values seen before the cap keep their own series
+    assert label(1) == "1"
+
+
+def test_bounded_label_reuses_strings():
+    """Test BoundedLabel returns the same string for repeat values."""
+    from core.metrics_registry import BoundedLabel
+
+    label = BoundedLabel("test_label", limit=1)
+
+    first = label(12345)
+    assert label(12345) is first
+    # The same label reached through another type shares the one slot
+    assert label("12345") == "12345"
+    assert label(6789) == "_other_"
+
+
+def test_metrics_endpoint_label_path_converter(client: TestClient):
+    """Test multi-segment path parameters don't leak into the endpoint label."""
+    client.get("/api/v1/agents/5/memory/files/secret/dir/file.txt")
+
+    content = client.get("/api/v1/metrics").text
+
+    assert 'endpoint="/api/v1/agents/{agent_id}/memory/files/{file_key:path}"' in content
+    assert "secret/dir" not in content
+
+
+def test_labeled_reuses_children():
+    """Test labeled() resolves each label combination once."""
+    from prometheus_client import CollectorRegistry, Counter
+
+    from core.metrics_registry import labeled
+
+    counter = Counter("test_labeled_total", "Test", ["method"], registry=CollectorRegistry())
+
+    child = labeled(counter, "GET")
+    child.inc()
+    labeled(counter, "GET").inc()
+
+    assert labeled(counter, "GET") is child
+    assert counter.labels(method="GET")._value.get() == 2
+
+
+def test_record_tool_execution_exported(client: TestClient):
+    """Test external tool execution metrics recorded via cached children."""
+    from core.metrics_external_tools import record_tool_execution
+
+    record_tool_execution("http", "metrics_test_tool", 0.2, True)
+    record_tool_execution("http", "metrics_test_tool", 0.3, True)
+
+    content = client.get("/api/v1/metrics").text
+
+    assert (
+        'tool_executions_total{success="true",tool_name="metrics_test_tool",'
+        'tool_type="http"} 2.0'
+    ) in content
+    assert 'tool_usage_by_category_total{category="http"}' in content
+    assert 'user_id="' not in content
+
+
+def test_record_marketplace_action_exported(client: TestClient):
+    """Test marketplace actions are counted through cached label children."""
+    from core.metrics_external_tools import record_marketplace_action
+
+    record_marketplace_action("metrics_test_action", "http")
+    record_marketplace_action("metrics_test_action", "http")
+
+    content = client.get("/api/v1/metrics").text
+
+    assert (
+        'tool_marketplace_actions_total{action="metrics_test_action",'
+        'tool_type="http"} 2.0'
+    ) in content
+
+
+def test_database_pool_collector(monkeypatch):
+    """Test pool usage is read from the engines at collection time."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    import api.v1.metrics as metrics_module
+
+    pooled = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool, pool_size=7
+    )
+    monkeypatch.setattr(metrics_module, "engine", pooled)
+    monkeypatch.setattr(metrics_module, "stream_engine", pooled)
+
+    [family] = metrics_module.DatabasePoolCollector().collect()
+    samples = {tuple(s.labels.values()): s.value for s in family.samples}
+
+    assert samples[("main", "size")] == 7
+    assert samples[("main", "checked_out")] == 0
+    assert ("stream", "size") not in samples
+
+
+def test_render_metrics_reused_within_ttl(monkeypatch):
+    """Test back-to-back renderings share one payload and gzip form."""
+    import gzip
+
+    import api.v1.metrics as metrics_module
+
+    monkeypatch.setattr(metrics_module, "METRICS_RENDER_TTL_SECONDS", 60.0)
+
+    plain = metrics_module.render_metrics(compress=False)
+    metrics_module.record_error("RenderTestError", "test")
+
+    assert metrics_module.render_metrics(compress=False) is plain
+    compressed = metrics_module.render_metrics(compress=True)
+    assert metrics_module.render_metrics(compress=True) is compressed
+    assert gzip.decompress(compressed) == plain
+
+    monkeypatch.setattr(metrics_module, "METRICS_RENDER_TTL_SECONDS", 0.0)
+    assert b"RenderTestError" in metrics_module.render_metrics(compress=False)
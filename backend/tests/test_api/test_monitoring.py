@@ -493,6 +493,31 @@ class TestRecentExecutionsEndpoint:
 
         assert len(data) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_recent_executions_endpoint_cached(
+        self,
+        client: TestClient,
+        db_session: AsyncSession,
+        test_agent: Agent,
+        test_user_id: int
+    ):
+        """Test recent executions are served from a short-lived cache."""
+        response = client.get("/api/v1/monitoring/executions/recent")
+        assert response.json() == []
+
+        db_session.add(Execution(
+            agent_id=test_agent.id,
+            input_prompt="new",
+            status="completed",
+            created_by_id=test_user_id
+        ))
+        await db_session.commit()
+
+        # Cached for CACHE_RECENT_ACTIVITY_TTL seconds, keyed by limit
+        assert client.get("/api/v1/monitoring/executions/recent").json() == []
+        data = client.get("/api/v1/monitoring/executions/recent?limit=5").json()
+        assert [item["input_prompt"] for item in data] == ["new"]
+
 
 class TestRecentErrorsEndpoint:
     """Tests for recent errors endpoint."""
@@ -588,3 +613,134 @@ class TestRecentErrorsEndpoint:
         data = response.json()
 
         assert len(data) == 0
+
+
+class TestResponseSerialization:
+    """Tests for how list responses are serialized."""
+
+    def test_list_routes_use_pydantic_json_fast_path(self):
+        """Test list routes keep the default response class.
+
+        FastAPI only serializes response models directly to JSON bytes
+        when no custom response class is configured.
+        """
+        from fastapi.datastructures import DefaultPlaceholder
+        from fastapi.routing import APIRoute
+
+        from api.v1.monitoring import router as monitoring_router
+        from api.v1.templates import router as templates_router
+        from api.v1.tools import router as tools_router
+        from main import app
+
+        assert isinstance(app.router.default_response_class, DefaultPlaceholder)
+
+        checked = 0
+        routes = monitoring_router.routes + templates_router.routes + tools_router.routes
+        for route in routes:
+            if isinstance(route, APIRoute) and route.response_model is not None:
+                assert isinstance(route.response_class, DefaultPlaceholder), route.path
+                checked += 1
+
+        assert checked > 0
+
+
+class TestReadOnlySessions:
+    """Tests for which endpoints use the read-only session dependency."""
+
+    def test_monitoring_routes_use_read_only_sessions(self):
+        """Test every monitoring route reads through get_db_ro, never get_db."""
+        from fastapi.routing import APIRoute
+
+        from api.v1.monitoring import router as monitoring_router
+        from core.database import get_db, get_db_ro
+
+        for route in monitoring_router.routes:
+            if isinstance(route, APIRoute):
+                calls = {dep.call for dep in route.dependant.dependencies}
+                assert get_db_ro in calls, route.path
+                assert get_db not in calls, route.path
+
+    def test_read_routes_use_primary_read_sessions(self):
+        """Test read-only GET routes (and their auth) never reach get_db."""
+        from fastapi.routing import APIRoute
+
+        from api.v1.analytics import router as analytics_router
+        from api.v1.tools import router as tools_router
+        from core.database import get_db, get_db_read
+
+        def all_calls(dependant):
+            for dep in dependant.dependencies:
+                yield dep.call
+                yield from all_calls(dep)
+
+        for route in analytics_router.routes + tools_router.routes:
+            if isinstance(route, APIRoute) and route.methods == {"GET"}:
+                calls = set(all_calls(route.dependant))
+                assert get_db_read in calls, route.path
+                assert get_db not in calls, route.path
+
+    def test_streaming_routes_avoid_autocommit_sessions(self):
+        """Test streamed responses never read through get_db_read."""
+        from fastapi.responses import StreamingResponse
+        from fastapi.routing import APIRoute
+
+        from api.v1 import agents, analytics, executions, external_tools, tools
+        from core.database import get_db_read
+
+        def all_calls(dependant):
+            for dep in dependant.dependencies:
+                yield dep.call
+                yield from all_calls(dep)
+
+        streaming = [
+            route
+            for module in (agents, analytics, executions, external_tools, tools)
+            for route in module.router.routes
+            if isinstance(route, APIRoute) and route.response_class is StreamingResponse
+        ]
+        assert streaming
+        for route in streaming:
+            assert get_db_read not in set(all_calls(route.dependant)), route.path
+
+    @pytest.mark.asyncio
+    async def test_read_route_checks_out_one_connection(
+        self, db_session: AsyncSession, test_user
+    ):
+        """Test a GET on get_db_read authenticates on its own session."""
+        from sqlalchemy import event
+
+        from core.database import get_db, get_db_read
+        from core.security import create_access_token
+        from main import app
+        from tests.conftest import TestAsyncSessionLocal, test_engine
+
+        # A fresh session per dependency, as in production
+        async def write_session():
+            async with TestAsyncSessionLocal() as session:
+                yield session
+
+        async def read_session():
+            async with TestAsyncSessionLocal() as session:
+                yield session
+
+        checkouts = []
+
+        def on_checkout(*args):
+            checkouts.append(args)
+
+        app.dependency_overrides[get_db] = write_session
+        app.dependency_overrides[get_db_read] = read_session
+        event.listen(test_engine.sync_engine, "checkout", on_checkout)
+        try:
+            with TestClient(app) as client:
+                token = create_access_token({"sub": test_user.username})
+                checkouts.clear()
+                response = client.get(
+                    "/api/v1/tools/", headers={"Authorization": f"Bearer {token}"}
+                )
+        finally:
+            event.remove(test_engine.sync_engine, "checkout", on_checkout)
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert len(checkouts) == 1
@@ -12,6 +12,8 @@ Tests all REST API endpoints for template management including:
 - Creating agents from templates
 """
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -241,6 +243,60 @@ def test_list_templates_endpoint_pagination(client: TestClient, test_user: User,
     assert data["page_size"] == 3
 
 
+@pytest.mark.asyncio
+async def test_list_templates_endpoint_cursor_pagination(
+    client: TestClient, test_user: User, db_session: AsyncSession
+):
+    """Test walking the template list with next_cursor."""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all(
+        Template(
+            name=f"Keyset Template {i}",
+            description=f"Description {i}",
+            category="research",
+            tags=["test"],
+            config_template={
+                "model_provider": "anthropic",
+                "model_name": "claude-3-5-sonnet-20241022",
+                "system_prompt": "Test",
+                "temperature": 0.7,
+                "max_tokens": 4096,
+                "planning_enabled": False,
+                "filesystem_enabled": False,
+                "tool_ids": [],
+                "additional_config": {},
+            },
+            created_by_id=test_user.id,
+            # Two templates share each timestamp; id breaks the tie
+            created_at=base + timedelta(minutes=i // 2),
+        )
+        for i in range(5)
+    )
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/templates/?limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        seen.extend(t["name"] for t in data["templates"])
+        cursor = data["next_cursor"]
+        assert data["has_next"] is (cursor is not None)
+        if not cursor:
+            break
+
+    # Newest first, every template exactly once
+    assert seen == [f"Keyset Template {i}" for i in range(4, -1, -1)]
+
+    response = client.get("/api/v1/templates/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
 def test_list_templates_endpoint_filter_by_category(client: TestClient, test_user: User, sample_tool: Tool):
     """Test template listing filtered by category."""
     response = client.get("/api/v1/templates/?category=research")
@@ -302,6 +358,27 @@ def test_get_template_endpoint_success(client: TestClient, sample_template: Temp
     assert data["name"] == sample_template.name
 
 
+def test_get_template_endpoint_conditional(client: TestClient, sample_template: Template):
+    """Test single templates carry Last-Modified and honour If-Modified-Since."""
+    url = f"/api/v1/templates/{sample_template.id}"
+    response = client.get(url)
+
+    assert response.status_code == 200
+    last_modified = response.headers["last-modified"]
+    assert last_modified.endswith("GMT")
+
+    conditional = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert conditional.status_code == 304
+    assert conditional.content == b""
+
+    stale = client.get(url, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+    assert stale.status_code == 200
+    assert stale.json()["id"] == sample_template.id
+
+    garbage = client.get(url, headers={"If-Modified-Since": "yesterday"})
+    assert garbage.status_code == 200
+
+
 def test_get_template_endpoint_not_found(client: TestClient):
     """Test template retrieval fails with invalid ID."""
     response = client.get("/api/v1/templates/99999")
@@ -339,6 +416,35 @@ def test_update_template_endpoint_not_found(client: TestClient):
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_update_and_delete_template_endpoint_forbidden(
+    client: TestClient, sample_template: Template, db_session: AsyncSession
+):
+    """Test another user's template can't be updated or deleted."""
+    other = User(
+        username="otheruser",
+        email="other@example.com",
+        hashed_password="hashed_password_here",
+        is_active=True,
+    )
+    db_session.add(other)
+    await db_session.flush()
+    sample_template.created_by_id = other.id
+    await db_session.commit()
+
+    response = client.put(
+        f"/api/v1/templates/{sample_template.id}", json={"name": "Hijacked"}
+    )
+    assert response.status_code == 403
+
+    response = client.delete(f"/api/v1/templates/{sample_template.id}")
+    assert response.status_code == 403
+
+    response = client.get(f"/api/v1/templates/{sample_template.id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Test Template"
+
+
 # ============================================================================
 # DELETE /api/v1/templates/{template_id} - Delete Template
 # ============================================================================
@@ -378,6 +484,34 @@ def test_get_categories_endpoint(client: TestClient, sample_template: Template):
     assert isinstance(data["categories"], list)
 
 
+def test_get_categories_endpoint_unexpected_error(client: TestClient, monkeypatch):
+    """Test unexpected errors become a generic 500 and are counted."""
+    from api.v1 import templates as templates_api
+    from api.v1.metrics import errors_total
+    from main import app
+
+    async def failing_get_categories(db):
+        raise RuntimeError("connection string with secrets")
+
+    monkeypatch.setattr(
+        templates_api.template_service, "get_categories", failing_get_categories
+    )
+    before = errors_total.labels(
+        error_type="RuntimeError", component="templates"
+    )._value.get()
+
+    response = TestClient(app, raise_server_exceptions=False).get(
+        "/api/v1/templates/categories"
+    )
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Internal server error"
+    assert "secrets" not in response.text
+    assert errors_total.labels(
+        error_type="RuntimeError", component="templates"
+    )._value.get() == before + 1
+
+
 # ============================================================================
 # GET /api/v1/templates/featured - Get Featured Templates
 # ============================================================================
@@ -564,3 +698,94 @@ def test_export_template_endpoint_not_found(client: TestClient):
     response = client.get("/api/v1/templates/99999/export")
 
     assert response.status_code == 404
+
+
+# ============================================================================
+# Cached Template Lists
+# ============================================================================
+
+
+def test_get_categories_endpoint_etag(client: TestClient, sample_template: Template):
+    """Test categories are served with an ETag and revalidated with 304."""
+    response = client.get("/api/v1/templates/categories")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=30, stale-while-revalidate=60"
+    etag = response.headers["etag"]
+
+    conditional = client.get(
+        "/api/v1/templates/categories", headers={"If-None-Match": etag}
+    )
+    assert conditional.status_code == 304
+    assert conditional.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_popular_templates_invalidated_on_use(
+    client: TestClient, sample_template: Template, db_session: AsyncSession
+):
+    """Test popular list stays cached until a use count changes."""
+    first = client.get("/api/v1/templates/popular")
+    assert first.status_code == 200
+    assert first.json()[0]["use_count"] == 0
+
+    # A write that bypasses the service is not seen until the entry expires
+    sample_template.description = "Changed directly"
+    await db_session.commit()
+    assert client.get("/api/v1/templates/popular").content == first.content
+
+    response = client.post(f"/api/v1/templates/{sample_template.id}/use")
+    assert response.status_code == 200
+
+    data = client.get("/api/v1/templates/popular").json()
+    assert data[0]["use_count"] == 1
+    assert data[0]["description"] == "Changed directly"
+
+
+@pytest.mark.asyncio
+async def test_get_popular_templates_limits_share_cache(
+    client: TestClient,
+    sample_template: Template,
+    db_session: AsyncSession,
+):
+    """Test every limit is sliced from one cached popular list."""
+    db_session.add(
+        Template(
+            name="Second Template",
+            description="Another template",
+            category="research",
+            tags=[],
+            config_template=sample_template.config_template,
+            is_public=True,
+            is_featured=False,
+            use_count=5,
+            created_by_id=sample_template.created_by_id,
+            is_active=True,
+        )
+    )
+    await db_session.commit()
+
+    first = client.get("/api/v1/templates/popular?limit=1").json()
+    assert [t["name"] for t in first] == ["Second Template"]
+
+    # A write that bypasses the service is not seen: the larger limit is
+    # served from the list cached by the first request
+    sample_template.description = "Changed directly"
+    await db_session.commit()
+
+    data = client.get("/api/v1/templates/popular?limit=2").json()
+    assert [t["name"] for t in data] == ["Second Template", "Test Template"]
+    assert data[1]["description"] == "A test template for API testing"
+
+
+def test_static_routes_declared_before_parametric_routes():
+    """Test static sub-paths are matched before any /{template_id} route."""
+    from fastapi.routing import APIRoute
+
+    from api.v1.templates import router
+
+    paths = [route.path for route in router.routes if isinstance(route, APIRoute)]
+    first_parametric = next(i for i, path in enumerate(paths) if "{" in path)
+
+    assert all("{" in path for path in paths[first_parametric:])
+    assert "/templates/import" in paths[:first_parametric]
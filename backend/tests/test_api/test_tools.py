@@ -319,6 +319,26 @@ def test_get_tool_categories(client: TestClient):
     assert set(data["categories"]) == {"builtin", "custom", "langgraph"}
 
 
+def test_get_tool_categories_unexpected_error(client: TestClient, monkeypatch):
+    """Test unexpected errors reach the app handler; one traceback per type."""
+    import main
+    from main import app
+
+    async def failing_get_tool_categories(db):
+        raise RuntimeError("database is down")
+
+    monkeypatch.setattr(tool_service, "get_tool_categories", failing_get_tool_categories)
+    monkeypatch.setattr(main, "_traceback_logged_at", {})
+
+    raw_client = TestClient(app, raise_server_exceptions=False)
+    for _ in range(2):
+        response = raw_client.get("/api/v1/tools/categories")
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Internal server error"
+
+    assert list(main._traceback_logged_at) == ["RuntimeError"]
+
+
 # ============================================================================
 # Get Tool By ID Endpoint Tests
 # ============================================================================
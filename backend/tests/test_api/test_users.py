@@ -238,6 +238,35 @@ def test_delete_account_success(client: TestClient, test_user: User, auth_header
     assert test_user.is_active is False
 
 
+def test_token_user_cached_until_user_changes(
+    client_no_auth: TestClient, auth_headers: dict, monkeypatch
+):
+    """Test repeat requests with a token skip the user query until a user write."""
+    from services.auth_service import AuthService
+
+    lookups = []
+    get_user_by_username = AuthService.get_user_by_username
+
+    async def counting_get_user_by_username(db, username):
+        lookups.append(username)
+        return await get_user_by_username(db, username)
+
+    monkeypatch.setattr(
+        AuthService, "get_user_by_username", staticmethod(counting_get_user_by_username)
+    )
+
+    for _ in range(3):
+        response = client_no_auth.get("/api/v1/users/me", headers=auth_headers)
+        assert response.status_code == 200
+    assert lookups == ["testuser"]
+
+    # Deactivation clears the cache, so the token stops working at once
+    assert client_no_auth.delete("/api/v1/users/me", headers=auth_headers).status_code == 204
+    response = client_no_auth.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 400
+    assert lookups == ["testuser", "testuser"]
+
+
 def test_delete_account_without_auth(client_no_auth: TestClient):
     """Test that deleting account without auth fails."""
     response = client_no_auth.delete("/api/v1/users/me")
@@ -0,0 +1,211 @@
+"""
+Tests for cache utilities.
+
+Tests cache key generation and the cache_result decorator.
+"""
+
+import pytest
+
+
+def test_make_cache_key_stable_and_bounded() -> None:
+    """Test equal arguments give equal keys of a fixed length."""
+    from core.cache import _make_cache_key
+
+    key = _make_cache_key("prefix", {"b": 2, "a": 1}, days=7)
+
+    assert key == _make_cache_key("prefix", {"a": 1, "b": 2}, days=7)
+    assert key != _make_cache_key("prefix", {"a": 1, "b": 2}, days=8)
+    assert key.startswith("cache:prefix:")
+    assert len(key.rsplit(":", 1)[1]) == 32
+
+
+@pytest.mark.asyncio
+async def test_cache_result_serves_repeat_calls_from_cache() -> None:
+    """Test a decorated function runs once per distinct argument set."""
+    from core.cache import cache_result
+
+    calls = []
+
+    @cache_result(ttl=60, key_prefix="test:cached")
+    async def compute(value: int) -> dict:
+        calls.append(value)
+        return {"value": value}
+
+    assert await compute(1) == {"value": 1}
+    assert await compute(1) == {"value": 1}
+    assert await compute(2) == {"value": 2}
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_cache_result_round_trips_types() -> None:
+    """Test cached results keep int keys and encode datetimes and decimals."""
+    from datetime import datetime
+    from decimal import Decimal
+
+    from core.cache import cache_result
+
+    @cache_result(ttl=60, key_prefix="test:types")
+    async def compute() -> dict:
+        return {
+            "at": datetime(2025, 1, 2, 3, 4, 5),
+            "cost": Decimal("1.5"),
+            "by_hour": {3: 10},
+        }
+
+    await compute()
+
+    assert await compute() == {
+        "at": "2025-01-02T03:04:05",
+        "cost": 1.5,
+        "by_hour": {3: 10},
+    }
+
+
+@pytest.mark.asyncio
+async def test_cache_result_shares_concurrent_lookups() -> None:
+    """Test concurrent calls for one key share a single lookup."""
+    import asyncio
+
+    from core.cache import cache_result
+
+    calls = []
+
+    @cache_result(ttl=60, key_prefix="test:shared")
+    async def compute(value: int) -> dict:
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return {"value": value}
+
+    results = await asyncio.gather(*(compute(1) for _ in range(5)))
+
+    assert calls == [1]
+    assert results == [{"value": 1}] * 5
+
+
+@pytest.mark.asyncio
+async def test_cache_result_waiters_retry_after_failure() -> None:
+    """Test callers waiting on a failed lookup run their own."""
+    import asyncio
+
+    from core.cache import cache_result
+
+    calls = []
+
+    @cache_result(ttl=60, key_prefix="test:retry")
+    async def compute() -> dict:
+        calls.append(len(calls))
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise RuntimeError("first call fails")
+        return {"ok": True}
+
+    first, second = await asyncio.gather(
+        compute(), compute(), return_exceptions=True
+    )
+
+    assert isinstance(first, RuntimeError)
+    assert second == {"ok": True}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_result_local_copy_skips_redis(isolated_cache) -> None:
+    """Test repeat hits within the local TTL are served without Redis."""
+    import core.cache
+    from core.cache import cache_result
+
+    calls = []
+
+    @cache_result(ttl=60, key_prefix="test:local")
+    async def compute() -> dict:
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert await compute() == {"n": 1}
+
+    # Served from the worker-local copy even with Redis emptied
+    await isolated_cache.flushall()
+    assert await compute() == {"n": 1}
+
+    # Dropped along with the Redis keys on invalidation
+    await core.cache.invalidate_cache_pattern("cache:test:*")
+    assert await compute() == {"n": 2}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_pattern_in_batches(isolated_cache, monkeypatch) -> None:
+    """Test matching keys are removed across several SCAN batches."""
+    import core.cache
+
+    monkeypatch.setattr(core.cache, "CACHE_SCAN_BATCH_SIZE", 3)
+    for i in range(10):
+        await isolated_cache.set(f"cache:batch:{i}", "x")
+    await isolated_cache.set("cache:other", "y")
+
+    assert await core.cache.invalidate_cache_pattern("cache:batch:*") == 10
+    assert await isolated_cache.keys("cache:batch:*") == []
+    assert await isolated_cache.get("cache:other") == b"y"
+
+
+def test_make_cache_key_scalar_fast_path() -> None:
+    """Test a few short scalar arguments are written into the key unhashed."""
+    from datetime import datetime
+
+    from core.cache import _make_cache_key
+
+    assert _make_cache_key("stats", days=7) == "cache:stats:days=7"
+    assert _make_cache_key("agent", 5, "x", None) == "cache:agent:5:'x':None"
+    assert _make_cache_key("agent", 1) != _make_cache_key("agent", True)
+    assert _make_cache_key("agent", "1") != _make_cache_key("agent", 1)
+
+    # Long strings, other types and many arguments are hashed
+    for args in (("x" * 100,), (datetime(2025, 1, 1),), (1, 2, 3, 4)):
+        key = _make_cache_key("agent", *args)
+        assert len(key.rsplit(":", 1)[1]) == 32
+
+
+@pytest.mark.asyncio
+async def test_cache_result_method_key_ignores_instance() -> None:
+    """Test methods on different instances share one cache entry."""
+    from core.cache import cache_result
+
+    class Service:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @cache_result(ttl=60, key_prefix="test:method")
+        async def compute(self, days: int) -> dict:
+            self.calls += 1
+            return {"days": days}
+
+    first, second = Service(), Service()
+
+    assert await first.compute(7) == {"days": 7}
+    assert await second.compute(7) == {"days": 7}
+    assert (first.calls, second.calls) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_cache_result_payload_size_limits(isolated_cache, monkeypatch) -> None:
+    """Test large results are compressed and oversized ones not cached."""
+    import core.cache
+    from core.cache import cache_result
+
+    monkeypatch.setattr(core.cache, "CACHE_COMPRESS_MIN_BYTES", 1024)
+    monkeypatch.setattr(core.cache, "CACHE_MAX_VALUE_BYTES", 64 * 1024)
+
+    @cache_result(ttl=60, key_prefix="test:size")
+    async def compute(size: int) -> dict:
+        return {"data": "x" * size}
+
+    assert await compute(10) == {"data": "x" * 10}
+    assert await compute(10_000) == {"data": "x" * 10_000}
+    assert await compute(100_000) == {"data": "x" * 100_000}
+
+    small = await isolated_cache.get("cache:test:size:10")
+    compressed = await isolated_cache.get("cache:test:size:10000")
+    assert core.cache._unpack_result(small) == {"data": "x" * 10}
+    assert len(compressed) < 1024
+    assert core.cache._unpack_result(compressed) == {"data": "x" * 10_000}
+    assert await isolated_cache.get("cache:test:size:100000") is None
@@ -131,3 +131,25 @@ def test_config_model_config() -> None:
     # Should be case sensitive for environment variables
     config = settings.model_config
     assert config.get("case_sensitive", False) == False or config.get("case_sensitive", False) == True
+
+
+def test_cors_origins_parsed_once() -> None:
+    """Test CORS origins are parsed on first access and then reused."""
+    from core.config import Settings
+
+    settings = Settings()
+
+    assert settings.CORS_ORIGINS is settings.CORS_ORIGINS
+    assert settings.model_dump()["CORS_ORIGINS"] == settings.CORS_ORIGINS
+
+
+def test_settings_repr_masks_secrets() -> None:
+    """Test repr hides secrets and is built once per instance."""
+    from core.config import Settings
+
+    settings = Settings()
+
+    assert settings.SECRET_KEY not in repr(settings)
+    assert "SECRET_KEY='***masked***'" in repr(settings)
+    assert repr(settings) is repr(settings)
+    assert "_masked_repr" not in settings.model_dump()
@@ -0,0 +1,75 @@
+"""
+Tests for database engine helpers.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.database import warm_pool
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_fills_base_pool():
+    """Test warm_pool leaves pool_size idle connections checked in."""
+    pooled = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool, pool_size=3
+    )
+    try:
+        assert await warm_pool(pooled) == 3
+        assert pooled.pool.checkedin() == 3
+        assert pooled.pool.checkedout() == 0
+    finally:
+        await pooled.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_skips_unsized_pools():
+    """Test engines without a queue pool (default SQLite) are left alone."""
+    unpooled = create_async_engine("sqlite+aiosqlite://")
+    try:
+        assert await warm_pool(unpooled) == 0
+    finally:
+        await unpooled.dispose()
+
+
+@pytest.mark.asyncio
+async def test_init_db_skips_create_all_when_schema_present(monkeypatch):
+    """Test init_db creates tables once and skips create_all afterwards."""
+    import core.database
+    from core.database import Base, init_db
+
+    target = create_async_engine("sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool)
+    monkeypatch.setattr(core.database, "engine", target)
+    calls = []
+    create_all = Base.metadata.create_all
+
+    def counting_create_all(*args, **kwargs):
+        calls.append(1)
+        return create_all(*args, **kwargs)
+
+    monkeypatch.setattr(Base.metadata, "create_all", counting_create_all)
+    try:
+        await init_db()
+        await init_db()
+    finally:
+        await target.dispose()
+
+    assert calls == [1]
+
+
+def test_pool_limits_fit_worker_budget(monkeypatch):
+    """Test pools shrink to their share of the per-worker connection budget."""
+    import core.database
+    from core.database import pool_limits
+
+    monkeypatch.setattr(core.database, "WORKER_DB_CONNECTIONS", 88)
+    assert pool_limits(20, 40, 0.5) == {"pool_size": 14, "max_overflow": 30}
+
+    # Configured sizes stay the upper bound on a large budget
+    monkeypatch.setattr(core.database, "WORKER_DB_CONNECTIONS", 1000)
+    assert pool_limits(20, 40, 0.5) == {"pool_size": 20, "max_overflow": 40}
+
+    # Many workers still get a usable minimum
+    monkeypatch.setattr(core.database, "WORKER_DB_CONNECTIONS", 4)
+    assert pool_limits(20, 40, 0.25) == {"pool_size": 2, "max_overflow": 1}
@@ -217,3 +217,51 @@ async def test_get_optional_user_with_invalid_token(db_session: AsyncSession):
     current_user = await get_optional_user(credentials=credentials, db=db_session)
 
     assert current_user is None
+
+
+# ============================================================================
+# Session Sharing Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_auth_and_handler_share_one_session(db_session: AsyncSession):
+    """Test that get_db is resolved once per request for auth and handler."""
+    from fastapi import Depends, FastAPI
+    from httpx import ASGITransport, AsyncClient
+
+    from core.database import get_db
+
+    user = User(
+        username="sessionuser",
+        email="session@example.com",
+        hashed_password=get_password_hash("TestPass123"),
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+
+    sessions_opened = []
+
+    async def override_get_db():
+        sessions_opened.append(db_session)
+        yield db_session
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = override_get_db
+
+    @app.get("/whoami")
+    async def whoami(
+        current_user: User = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db),
+    ):
+        return {"username": current_user.username}
+
+    token = create_access_token(data={"sub": "sessionuser", "user_id": user.id})
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.json() == {"username": "sessionuser"}
+    assert len(sessions_opened) == 1
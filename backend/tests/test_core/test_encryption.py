@@ -0,0 +1,126 @@
+"""
+Tests for credential encryption and sanitization utilities.
+"""
+
+import pytest
+from cryptography.fernet import Fernet
+
+from core.encryption import CredentialEncryption, CredentialSanitizer
+
+
+@pytest.fixture
+def encryptor(monkeypatch) -> CredentialEncryption:
+    """Provide an encryptor with a fresh key."""
+    monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    return CredentialEncryption()
+
+
+# ============================================================================
+# CredentialEncryption Tests
+# ============================================================================
+
+
+class TestDictFields:
+    """Tests for encrypt_dict_fields / decrypt_dict_fields."""
+
+    def test_round_trip(self, encryptor: CredentialEncryption):
+        """Test listed fields are encrypted and decrypted; input is not modified."""
+        config = {"host": "localhost", "password": "secret123", "token": ""}
+
+        encrypted = encryptor.encrypt_dict_fields(config, ["password", "token"])
+
+        assert encrypted is not config
+        assert encrypted["password"] != "secret123"
+        assert encrypted["token"] == ""
+        assert config["password"] == "secret123"
+        assert encryptor.decrypt_dict_fields(encrypted, ["password", "token"]) == config
+
+    def test_no_fields_present_returns_input(self, encryptor: CredentialEncryption):
+        """Test no copy is made when there is nothing to encrypt or decrypt."""
+        config = {"host": "localhost", "password": None}
+
+        assert encryptor.encrypt_dict_fields(config, ["password", "api_key"]) is config
+        assert encryptor.decrypt_dict_fields(config, ["password", "api_key"]) is config
+
+        masked = {"password": "***ENCRYPTED***"}
+        assert encryptor.decrypt_dict_fields(masked, ["password"]) is masked
+
+
+# ============================================================================
+# CredentialSanitizer Tests
+# ============================================================================
+
+
+class TestSanitizeString:
+    """Tests for CredentialSanitizer.sanitize_string."""
+
+    def test_sanitizes_all_patterns(self):
+        """Test key=value pairs, bearer tokens and API keys are all replaced."""
+        text = (
+            "password='hunter2' Authorization: Bearer abc.def "
+            "key sk-abcdefghijklmnopqrstuvwxyz"
+        )
+
+        sanitized = CredentialSanitizer.sanitize_string(text)
+
+        assert "hunter2" not in sanitized
+        assert "abc.def" not in sanitized
+        assert "sk-abcdefghijklmnopqrstuvwxyz" not in sanitized
+        assert "password='***SANITIZED***'" in sanitized
+        assert "Bearer ***SANITIZED***" in sanitized
+
+    def test_bearer_followed_by_assignment(self):
+        """Test overlapping matches leave no credential behind."""
+        sanitized = CredentialSanitizer.sanitize_string("Bearer token='hunter2'")
+
+        assert "hunter2" not in sanitized
+
+    def test_plain_text_unchanged(self):
+        """Test text without credentials is returned as is."""
+        text = "Connection refused on localhost:5432"
+
+        assert CredentialSanitizer.sanitize_string(text) == text
+
+
+class TestSanitizeDict:
+    """Tests for CredentialSanitizer.sanitize_dict."""
+
+    def test_sanitizes_nested_containers(self):
+        """Test sensitive keys are replaced inside nested dicts and lists."""
+        data = {
+            "host": "localhost",
+            "DB_Password": "secret",
+            "options": {"auth": {"apiKey": "k"}, "port": 5432},
+            "headers": [{"Authorization_Token": "t"}, "plain", ["raw"]],
+        }
+
+        sanitized = CredentialSanitizer.sanitize_dict(data)
+
+        assert sanitized == {
+            "host": "localhost",
+            "DB_Password": "***SANITIZED***",
+            "options": {"auth": {"apiKey": "***SANITIZED***"}, "port": 5432},
+            "headers": [{"Authorization_Token": "***SANITIZED***"}, "plain", ["raw"]],
+        }
+        # The input is left untouched
+        assert data["options"]["auth"]["apiKey"] == "k"
+
+    def test_clean_input_returned_as_is(self):
+        """Test dicts without sensitive keys are not copied."""
+        data = {"host": "localhost", "options": {"port": 5432}, "tags": [{"a": 1}]}
+
+        assert CredentialSanitizer.sanitize_dict(data) is data
+
+    def test_deep_nesting(self):
+        """Test nesting deeper than the recursion limit is handled."""
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["child"] = {}
+            leaf = leaf["child"]
+        leaf["secret"] = "s"
+
+        sanitized = CredentialSanitizer.sanitize_dict(data)
+
+        for _ in range(5000):
+            sanitized = sanitized["child"]
+        assert sanitized == {"secret": "***SANITIZED***"}
@@ -48,6 +48,17 @@ def test_password_hash_is_different_each_time() -> None:
     assert hash1 != hash2
 
 
+@pytest.mark.asyncio
+async def test_password_hashing_async() -> None:
+    """Test the thread-pool variants hash and verify off the event loop."""
+    from core.security import get_password_hash_async, verify_password_async
+
+    hashed_password = await get_password_hash_async("mysecretpassword123")
+
+    assert await verify_password_async("mysecretpassword123", hashed_password) is True
+    assert await verify_password_async("wrongpassword", hashed_password) is False
+
+
 def test_create_access_token() -> None:
     """Test JWT access token creation."""
     from core.security import create_access_token
@@ -2,10 +2,11 @@
 
 import pytest
 from datetime import datetime, timedelta
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.agent import Agent
-from models.execution import Execution
+from models.execution import Execution, ExecutionDailySummary
 from services.monitoring_service import monitoring_service
 
 
@@ -170,6 +171,49 @@ class TestAgentHealth:
         assert agent_health["avg_execution_time"] > 0
         assert agent_health["last_execution_at"] is not None
 
+    @pytest.mark.asyncio
+    async def test_get_agent_health_single_query(
+        self,
+        db_session: AsyncSession,
+        test_agent: Agent,
+        test_user_id: int
+    ):
+        """Test health for all agents is one statement, idle agents included."""
+        idle_agent = Agent(
+            name="Idle Agent",
+            model_provider="openai",
+            model_name="gpt-4",
+            created_by_id=test_user_id,
+        )
+        db_session.add_all([
+            idle_agent,
+            Execution(
+                agent_id=test_agent.id,
+                input_prompt="data",
+                status="failed",
+                created_by_id=test_user_id
+            ),
+        ])
+        await db_session.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            health_data = await monitoring_service.get_agent_health(db_session)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        by_agent = {h["agent_id"]: h for h in health_data}
+        assert by_agent[test_agent.id]["error_count"] == 1
+        assert by_agent[idle_agent.id]["total_executions"] == 0
+        assert by_agent[idle_agent.id]["last_execution_at"] is None
+
     @pytest.mark.asyncio
     async def test_get_agent_health_single_agent(
         self,
@@ -696,3 +740,164 @@ class TestRecentActivity:
         errors = await monitoring_service.get_recent_errors(db_session, limit=10)
 
         assert len(errors) == 0
+
+
+class TestCaching:
+    """Tests for short-lived Redis caching of monitoring aggregates."""
+
+    @pytest.mark.asyncio
+    async def test_dashboard_overview_cached(
+        self,
+        db_session: AsyncSession,
+        test_agent: Agent,
+        test_user_id: int,
+        isolated_cache
+    ):
+        """Test repeat dashboard reads are served from cache."""
+        first = await monitoring_service.get_dashboard_overview(db_session)
+        assert first["total_executions"] == 0
+
+        db_session.add(Execution(
+            agent_id=test_agent.id,
+            input_prompt="data",
+            status="completed",
+            started_at=datetime.utcnow(),
+            created_by_id=test_user_id
+        ))
+        await db_session.commit()
+
+        # Still the cached aggregate until the TTL expires
+        second = await monitoring_service.get_dashboard_overview(db_session)
+        assert second == first
+
+        from core.cache import clear_all_cache
+
+        await clear_all_cache()
+        third = await monitoring_service.get_dashboard_overview(db_session)
+        assert third["total_executions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_cache_keyed_by_days(
+        self,
+        db_session: AsyncSession,
+        isolated_cache
+    ):
+        """Test execution stats and token usage cache per period."""
+        week = await monitoring_service.get_execution_stats(db_session, days=7)
+        month = await monitoring_service.get_execution_stats(db_session, days=30)
+        tokens = await monitoring_service.get_token_usage_summary(db_session, days=30)
+
+        assert week["period_days"] == 7
+        assert month["period_days"] == 30
+        assert tokens["period_days"] == 30
+        assert len(await isolated_cache.keys("cache:monitoring:*")) == 3
+
+
+class TestDailySummaryRollup:
+    """Tests for the pre-aggregated execution_daily_summary table."""
+
+    @staticmethod
+    def _execution(agent: Agent, user_id: int, created_at: datetime, status: str):
+        return Execution(
+            agent_id=agent.id,
+            input_prompt="data",
+            status=status,
+            total_tokens=100,
+            estimated_cost=0.01,
+            created_by_id=user_id,
+            created_at=created_at,
+        )
+
+    @pytest.mark.asyncio
+    async def test_rollup_summarizes_complete_days_only(
+        self,
+        db_session: AsyncSession,
+        test_agent: Agent,
+        test_user_id: int
+    ):
+        """Test rollup writes one row per agent/user/day, excluding today."""
+        now = datetime.utcnow()
+        two_days_ago = now - timedelta(days=2)
+        db_session.add_all([
+            self._execution(test_agent, test_user_id, two_days_ago, "completed"),
+            self._execution(test_agent, test_user_id, two_days_ago, "failed"),
+            self._execution(test_agent, test_user_id, now, "completed"),
+        ])
+        await db_session.commit()
+
+        before = await monitoring_service.get_dashboard_overview.__wrapped__(
+            monitoring_service, db_session
+        )
+        rows = await monitoring_service.rollup_daily_summaries(db_session, now=now)
+
+        assert rows == 1
+        summary = (await db_session.execute(select(ExecutionDailySummary))).scalar_one()
+        assert summary.date == two_days_ago.date()
+        assert summary.total_count == 2
+        assert summary.success_count == 1
+        assert summary.error_count == 1
+        assert summary.total_tokens == 200
+
+        # Summary + live rows give the same totals as a full scan
+        after = await monitoring_service.get_dashboard_overview.__wrapped__(
+            monitoring_service, db_session
+        )
+        assert after == before
+        assert after["total_executions"] == 3
+
+    @pytest.mark.asyncio
+    async def test_rollup_recomputes_last_day(
+        self,
+        db_session: AsyncSession,
+        test_agent: Agent,
+        test_user_id: int
+    ):
+        """Test repeated rollups pick up late changes without duplicating."""
+        now = datetime.utcnow()
+        yesterday = now - timedelta(days=1)
+        execution = self._execution(test_agent, test_user_id, yesterday, "running")
+        db_session.add(execution)
+        await db_session.commit()
+
+        await monitoring_service.rollup_daily_summaries(db_session, now=now)
+
+        execution.status = "completed"
+        await db_session.commit()
+        await monitoring_service.rollup_daily_summaries(db_session, now=now)
+
+        summaries = (await db_session.execute(select(ExecutionDailySummary))).scalars().all()
+        assert len(summaries) == 1
+        assert summaries[0].success_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rollup_enabled_only_with_summary_table(
+        self,
+        db_session: AsyncSession,
+        monkeypatch
+    ):
+        """Test the rollup task is skipped under test or without its table."""
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        import services.monitoring_service as monitoring_module
+        from core.config import settings
+        from services.monitoring_service import daily_summary_rollup_enabled
+        from tests.conftest import test_engine
+
+        def use_environment(name):
+            monkeypatch.setattr(
+                monitoring_module,
+                "settings",
+                settings.model_copy(update={"ENVIRONMENT": name}),
+            )
+
+        use_environment("production")
+        assert await daily_summary_rollup_enabled(test_engine) is True
+
+        empty_engine = create_async_engine("sqlite+aiosqlite://")
+        try:
+            assert await daily_summary_rollup_enabled(empty_engine) is False
+        finally:
+            await empty_engine.dispose()
+
+        use_environment("testing")
+        assert await daily_summary_rollup_enabled(test_engine) is False
@@ -14,7 +14,7 @@ Tests all business logic for template CRUD operations, including:
 """
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.agent import Agent
@@ -32,6 +32,7 @@ from schemas.template import (
 from services.template_service import (
     DuplicateTemplateNameError,
     TemplateNotFoundError,
+    TemplatePermissionError,
     TemplateService,
     TemplateValidationError,
 )
@@ -294,6 +295,56 @@ async def test_list_templates_pagination(
     assert total == 5
 
 
+@pytest.mark.asyncio
+async def test_list_templates_total_cached(
+    db_session: AsyncSession,
+    template_service: TemplateService,
+    test_user: User,
+    sample_config_template: ConfigTemplate,
+):
+    """Test list totals are cached per filter set and dropped on writes."""
+    def template_data(i: int) -> TemplateCreate:
+        return TemplateCreate(
+            name=f"Counted Template {i}",
+            description=f"Description {i}",
+            category=TemplateCategory.RESEARCH,
+            tags=["test"],
+            config_template=sample_config_template,
+        )
+
+    for i in range(3):
+        await template_service.create_template(
+            db=db_session, template_data=template_data(i), created_by_id=test_user.id
+        )
+
+    # A short first page is its own total
+    templates, total = await template_service.list_templates(db=db_session, limit=10)
+    assert total == len(templates) == 3
+
+    _, total = await template_service.list_templates(db=db_session, limit=2)
+    assert total == 3
+
+    # A row added behind the service's back isn't counted until invalidation
+    db_session.add(
+        Template(
+            name="Direct Template",
+            description="Inserted directly",
+            category="research",
+            config_template=sample_config_template.model_dump(),
+            created_by_id=test_user.id,
+        )
+    )
+    await db_session.flush()
+    _, total = await template_service.list_templates(db=db_session, skip=2, limit=2)
+    assert total == 3
+
+    await template_service.create_template(
+        db=db_session, template_data=template_data(3), created_by_id=test_user.id
+    )
+    _, total = await template_service.list_templates(db=db_session, skip=2, limit=2)
+    assert total == 5
+
+
 @pytest.mark.asyncio
 async def test_list_templates_filter_by_category(
     db_session: AsyncSession,
@@ -451,6 +502,47 @@ async def test_update_template_duplicate_name(
         )
 
 
+@pytest.mark.asyncio
+async def test_update_template_owner_check(
+    db_session: AsyncSession,
+    template_service: TemplateService,
+    test_user: User,
+    sample_template_data: TemplateCreate,
+):
+    """Test update is conditional on the creator when user_id is given."""
+    template = await template_service.create_template(
+        db=db_session,
+        template_data=sample_template_data,
+        created_by_id=test_user.id,
+    )
+    update_data = TemplateUpdate(category=TemplateCategory.CODING)
+
+    with pytest.raises(TemplatePermissionError):
+        await template_service.update_template(
+            db=db_session,
+            template_id=template.id,
+            template_update=update_data,
+            user_id=test_user.id + 1,
+        )
+
+    with pytest.raises(TemplateNotFoundError):
+        await template_service.update_template(
+            db=db_session,
+            template_id=99999,
+            template_update=update_data,
+            user_id=test_user.id,
+        )
+
+    updated = await template_service.update_template(
+        db=db_session,
+        template_id=template.id,
+        template_update=update_data,
+        user_id=test_user.id,
+    )
+    assert updated.category == "coding"
+    assert updated.updated_at is not None
+
+
 # ============================================================================
 # Delete Template Tests
 # ============================================================================
@@ -602,6 +694,65 @@ async def test_increment_use_count(
     assert updated.use_count == 2
 
 
+@pytest.mark.asyncio
+async def test_template_caches_invalidated_after_commit(
+    db_session: AsyncSession,
+    template_service: TemplateService,
+    test_user: User,
+    sample_template_data: TemplateCreate,
+    monkeypatch,
+):
+    """Test writes commit before cached lists are dropped."""
+    import services.template_service as template_service_module
+
+    in_transaction = []
+
+    async def record_invalidation(*names):
+        in_transaction.append(db_session.in_transaction())
+
+    monkeypatch.setattr(
+        template_service_module, "invalidate_template_caches", record_invalidation
+    )
+
+    template = await template_service.create_template(
+        db=db_session,
+        template_data=sample_template_data,
+        created_by_id=test_user.id,
+    )
+    await template_service.increment_use_count(db=db_session, template_id=template.id)
+    await template_service.delete_template(db=db_session, template_id=template.id)
+
+    assert in_transaction == [False, False, False]
+
+
+@pytest.mark.asyncio
+async def test_increment_use_count_atomic(
+    db_session: AsyncSession,
+    template_service: TemplateService,
+    test_user: User,
+    sample_template_data: TemplateCreate,
+):
+    """Test increments apply to the stored count, not a stale loaded value."""
+    template = await template_service.create_template(
+        db=db_session,
+        template_data=sample_template_data,
+        created_by_id=test_user.id,
+    )
+
+    # Another writer bumps the count behind the session's back
+    await db_session.execute(
+        text("UPDATE templates SET use_count = 5 WHERE id = :id"), {"id": template.id}
+    )
+
+    updated = await template_service.increment_use_count(
+        db=db_session, template_id=template.id
+    )
+    assert updated.use_count == 6
+
+    with pytest.raises(TemplateNotFoundError):
+        await template_service.increment_use_count(db=db_session, template_id=99999)
+
+
 @pytest.mark.asyncio
 async def test_search_templates(
     db_session: AsyncSession,
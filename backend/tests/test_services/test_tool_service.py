@@ -540,3 +540,56 @@ async def test_count_tools_with_filters(db_session: AsyncSession, test_user_id:
     # Count by search
     calc_count = await tool_service.count_tools(db_session, search="calc")
     assert calc_count == 1
+
+
+@pytest.mark.asyncio
+async def test_list_tools_with_total(db_session: AsyncSession, test_user_id: int):
+    """Test the page and filtered total come back together."""
+    for i in range(3):
+        await tool_service.create_tool(
+            db_session,
+            ToolCreate(name=f"calc{i}", tool_type="builtin"),
+            created_by_id=test_user_id,
+        )
+    await tool_service.create_tool(
+        db_session,
+        ToolCreate(name="other", tool_type="custom"),
+        created_by_id=test_user_id,
+    )
+
+    tools, total = await tool_service.list_tools_with_total(
+        db_session, limit=2, tool_type="builtin"
+    )
+    assert len(tools) == 2
+    assert total == 3
+
+    # Past the last page the total is still reported
+    tools, total = await tool_service.list_tools_with_total(
+        db_session, skip=10, limit=2, tool_type="builtin"
+    )
+    assert tools == []
+    assert total == 3
+
+
+@pytest.mark.asyncio
+async def test_get_tool_categories_cached(db_session: AsyncSession, test_user_id: int):
+    """Test categories are cached until a tool write changes them."""
+    tool = await tool_service.create_tool(
+        db_session,
+        ToolCreate(name="builtin1", tool_type="builtin"),
+        created_by_id=test_user_id,
+    )
+    assert await tool_service.get_tool_categories(db_session) == ["builtin"]
+
+    # A write that bypasses the service is not seen while cached
+    db_session.add(Tool(name="direct", tool_type="custom", created_by_id=test_user_id))
+    await db_session.commit()
+    assert await tool_service.get_tool_categories(db_session) == ["builtin"]
+
+    await tool_service.update_tool(
+        db_session, tool.id, ToolUpdate(tool_type="langgraph")
+    )
+    assert set(await tool_service.get_tool_categories(db_session)) == {
+        "custom",
+        "langgraph",
+    }